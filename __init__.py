@@ -2,15 +2,56 @@
 """High-level documentation tools.
 """
 
-from .docmakers.pyreporters import *
-from .docmakers.docbuilder import *
-from .docmakers.utils import *
-from .docmakers.docmods import *
-from .inspect.pydocmd import *
-from .docmakers.funcstable import *
-from .inspect.pydump import *
-from .docpage.npdocs import npdocasmd
+import importlib as _importlib
 
 __author__ = 'Igor Semenov'
 __license__ = 'BSD-3-Clause'
 __version__ = '1.1.0-beta-1'
+
+# Public names mapped to their modules (loaded lazily).
+_APIMAP = {
+    'docpackage': '.docmakers.pyreporters',
+    'docscript': '.docmakers.pyreporters',
+    'mergedocs': '.docmakers.pyreporters',
+    'docsource': '.docmakers.docbuilder',
+    'builddocs': '.docmakers.docbuilder',
+    'watchdocs': '.docmakers.watcher',
+    'watchpackage': '.docmakers.watcher',
+    'cleardocs': '.docmakers.utils',
+    'docmods': '.docmakers.docmods',
+    'funcstomd': '.inspect.pydocmd',
+    'classtomd': '.inspect.pydocmd',
+    'funcstable': '.docmakers.funcstable',
+    'classfuncs': '.inspect.pydump',
+    'npdocasmd': '.docpage.npdocs',
+    'dumprecords': '.inspect.pyexport',
+    'loadrecords': '.inspect.pyexport'
+}
+
+_SUBPACKAGES = (
+    'docmakers', 'docpage', 'inspect', 'utils'
+)
+
+__all__ = list(_APIMAP)
+
+
+def __getattr__(name):
+
+    if name in _APIMAP:
+        module = _importlib.import_module(_APIMAP[name], __name__)
+        value = getattr(module, name)
+    elif name in _SUBPACKAGES:
+        value = _importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'"
+        )
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(
+        {*globals(), *_APIMAP, *_SUBPACKAGES}
+    )
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""Runs the command line interface — `python -m docspyer`.
+"""
+
+import sys
+from .docmakers import cli
+
+sys.exit(cli.main())
@@ -7,12 +7,14 @@ import unittest
 suite = unittest.TestSuite()
 
 dirnames = [
+    '.',
     'utils',
     'inspect',
     'docpage',
     'docpage/textmd',
     'docpage/npdocs',
-    'docmakers'
+    'docmakers',
+    'benchmarks'
 ]
 
 
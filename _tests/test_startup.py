@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Tracks the cost of importing the package.
+"""
+
+import os
+import sys
+import subprocess
+import unittest
+
+import docspyer
+
+# Generous limit for `import docspyer` (microseconds).
+IMPORT_BUDGET = 100_000
+
+
+def get_root_path():
+    pkgpath = os.path.dirname(docspyer.__file__)
+    return os.path.dirname(pkgpath)
+
+
+def run_importtime(statement) -> dict:
+    """Runs `python -X importtime` and returns cumulative times.
+    """
+
+    env = os.environ | {'PYTHONPATH': get_root_path()}
+
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=get_root_path(), env=env, capture_output=True, text=True,
+        check=True
+    )
+
+    return parse_importtime(proc.stderr)
+
+
+def parse_importtime(log) -> dict:
+
+    times = {}
+
+    for line in log.splitlines():
+
+        if not line.startswith('import time:'):
+            continue
+
+        line = line.removeprefix('import time:')
+        _, cumulative, name = line.split('|')
+
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+class TestStartup(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.times = run_importtime('import docspyer')
+
+    def test_no_eager_submodules(self):
+        loaded = [
+            name for name in self.times if name.startswith('docspyer.')
+        ]
+        assert not loaded
+
+    def test_import_budget(self):
+        assert self.times['docspyer'] < IMPORT_BUDGET
+
+    def test_lazy_api(self):
+        assert callable(docspyer.docscript)
+        assert 'builddocs' in dir(docspyer)
+        assert docspyer.docpage.pagemaker.getlogo()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of the hot paths on synthetic large inputs.
+
+Usage:
+
+    python -m docspyer.benchmarks run [--scale S] [--output FILE]
+    python -m docspyer.benchmarks compare OLDFILE NEWFILE
+
+"""
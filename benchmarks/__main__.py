@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Runs the benchmarks from the command line.
+"""
+
+import sys
+import argparse
+
+from . import runner
+
+
+def main(argv=None) -> int:
+
+    parser = make_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        return run(args)
+
+    return compare(args)
+
+
+def make_parser():
+
+    parser = argparse.ArgumentParser(prog='docspyer.benchmarks')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    runparser = commands.add_parser('run', help='run the benchmarks')
+
+    runparser.add_argument('--scale', type=float, default=1.0)
+    runparser.add_argument('--repeat', type=int, default=3)
+    runparser.add_argument('--only', nargs='+', default=None)
+    runparser.add_argument('--output', default=None)
+
+    cmpparser = commands.add_parser('compare', help='compare two results')
+
+    cmpparser.add_argument('oldpath')
+    cmpparser.add_argument('newpath')
+    cmpparser.add_argument('--threshold', type=float, default=0.1)
+
+    return parser
+
+
+def run(args) -> int:
+
+    results = runner.runbenchmarks(args.only, args.scale, args.repeat)
+
+    print(runner.results_as_table(results))
+
+    if args.output:
+        runner.dumpresults(results, args.output)
+
+    return 0
+
+
+def compare(args) -> int:
+    """Returns 1, if any benchmark is slower than the threshold allows.
+    """
+
+    table, regressed = runner.compareresults(
+        runner.loadresults(args.oldpath),
+        runner.loadresults(args.newpath),
+        args.threshold
+    )
+
+    print(table)
+
+    return int(regressed)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
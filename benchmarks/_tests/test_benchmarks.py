@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Tests the benchmark suite on tiny inputs.
+"""
+
+import ast
+import unittest
+
+from docspyer.benchmarks import generators, runner
+
+
+class TestGenerators(unittest.TestCase):
+
+    def test_pymodule(self):
+
+        source = generators.make_pymodule(nlines=500)
+
+        assert source == generators.make_pymodule(nlines=500)
+        assert source.count('\n') >= 500
+
+        ast.parse(source)
+
+    def test_callgraph(self):
+        graph = generators.make_callgraph(nnodes=100, depth=10)
+        assert graph == generators.make_callgraph(nnodes=100, depth=10)
+        assert 'func99' not in graph
+
+
+class TestRunner(unittest.TestCase):
+
+    def test_run_and_compare(self):
+
+        names = ['deeptrees.maketrees', 'npdocs.npdocasmd']
+        results = runner.runbenchmarks(names, scale=0.01, repeat=1)
+
+        assert set(results['results']) == set(names)
+        assert results['results'][names[0]]['peak'] > 0
+
+        slower = {
+            'results': {
+                name: res | {'min': res['min'] * 2}
+                for name, res in results['results'].items()
+            }
+        }
+
+        _, regressed = runner.compareresults(results, results)
+        assert regressed is False
+
+        table, regressed = runner.compareresults(results, slower)
+        assert regressed is True
+        assert 'slower' in table
+
+    def test_unknown_name(self):
+        with self.assertRaises(ValueError):
+            runner.runbenchmarks(['nobenchmark'])
+
+
+if __name__ == '__main__':
+    unittest.main()
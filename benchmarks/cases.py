@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""Benchmarked entry points with their synthetic inputs.
+"""
+
+import os
+import shutil
+import tempfile
+
+from . import generators
+from ..inspect import pyparser, pyreport, pystatic
+from ..docpage import pagemaker, npdocs
+from ..docpage.textmd import makehtml
+from ..docmakers import docbuilder
+from ..utils import deeptrees
+
+
+def scaled(size, scale) -> int:
+    return max(1, int(size * scale))
+
+
+class Benchmark:
+    """Entry point timed on a synthetic input (base class).
+
+    - `setup()` makes the input, it is not timed.
+    - `run()` calls the entry point, it is timed.
+
+    """
+
+    name = ''
+
+    def setup(self, scale):
+        pass
+
+    def run(self):
+        pass
+
+    def teardown(self):
+        pass
+
+
+class ParseScript(Benchmark):
+
+    name = 'pyparser.parsescript'
+
+    def setup(self, scale):
+        self.source = generators.make_pymodule(scaled(50_000, scale))
+
+    def run(self):
+        pyparser.parsescript(self.source, 'synthetic')
+
+
+class MakeReport(ParseScript):
+
+    name = 'pyreport.makereport'
+
+    def run(self):
+        pyreport.makereport(self.source, 'synthetic')
+
+
+class LoadStaticModule(Benchmark):
+
+    name = 'pystatic.loadmodule'
+
+    def setup(self, scale):
+
+        self.dirpath = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.dirpath, 'synthetic.py')
+
+        generators.write_text(
+            self.filepath, generators.make_pymodule(scaled(50_000, scale))
+        )
+
+    def run(self):
+        pystatic.loadmodule(self.filepath)
+
+    def teardown(self):
+        shutil.rmtree(self.dirpath)
+
+
+class MakeDocHTML(Benchmark):
+
+    name = 'textmd.makedochtml'
+
+    def setup(self, scale):
+        self.text = generators.make_mdpage(scaled(10_000, scale))
+
+    def run(self):
+        makehtml.makedochtml(self.text)
+
+
+class MakeDocPage(MakeDocHTML):
+
+    name = 'pagemaker.makedocpage'
+
+    def run(self):
+        pagemaker.makedocpage(self.text, pagemaker.PageParamsHTML())
+
+
+class NpDocAsMD(Benchmark):
+
+    name = 'npdocs.npdocasmd'
+
+    def setup(self, scale):
+        self.docstr = generators.make_npdocstring(scaled(2_000, scale))
+
+    def run(self):
+        npdocs.npdocasmd(self.docstr)
+
+
+class MakeTrees(Benchmark):
+
+    name = 'deeptrees.maketrees'
+
+    def setup(self, scale):
+        self.graph = generators.make_callgraph(scaled(2_000, scale))
+
+    def run(self):
+        deeptrees.maketrees(self.graph)
+
+
+class BuildDocs(Benchmark):
+
+    name = 'docbuilder.builddocs'
+
+    def setup(self, scale):
+
+        self.srcpath = tempfile.mkdtemp()
+        self.docroot = tempfile.mkdtemp()
+
+        generators.make_doctree(self.srcpath, scaled(2_000, scale))
+
+    def run(self):
+
+        # Each run builds into an empty folder, unchanged pages
+        # of a previous run would not be written.
+        docpath = tempfile.mkdtemp(dir=self.docroot)
+
+        docbuilder.builddocs(self.srcpath, docpath, swaplinks=True)
+
+    def teardown(self):
+        shutil.rmtree(self.srcpath)
+        shutil.rmtree(self.docroot)
+
+
+BENCHMARKS = [
+    ParseScript,
+    MakeReport,
+    LoadStaticModule,
+    MakeDocHTML,
+    MakeDocPage,
+    NpDocAsMD,
+    MakeTrees,
+    BuildDocs
+]
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""Deterministic generators of synthetic large inputs.
+
+- The same arguments always give the same output.
+- Sizes are approximate, the generators stop at whole units.
+
+"""
+
+import os
+import random
+import textwrap
+
+WORDS = (
+    'alfa', 'bravo', 'charlie', 'delta', 'echo', 'foxtrot', 'golf',
+    'hotel', 'india', 'juliett', 'kilo', 'lima', 'mike', 'november'
+)
+
+
+def make_words(rng, count) -> str:
+    return ' '.join(
+        rng.choice(WORDS) for _ in range(count)
+    )
+
+
+def make_pymodule(nlines=50_000, seed=0) -> str:
+    """Returns a python module with classes calling their methods.
+
+    Parameters
+    ----------
+    nlines : int = 50_000
+        Approximate number of lines.
+    seed : int = 0
+        Seed of the random generator.
+
+    """
+
+    rng = random.Random(seed)
+
+    lines = [
+        '"""Synthetic module."""',
+        '',
+        'import os',
+        'import re',
+        'from collections import OrderedDict',
+        ''
+    ]
+
+    count = 0
+
+    while len(lines) < nlines:
+        lines += make_pyclass(rng, count)
+        count += 1
+
+    return '\n'.join(lines) + '\n'
+
+
+def make_pyclass(rng, index) -> list[str]:
+
+    nmethods = rng.randint(5, 15)
+
+    names = [
+        f'method_{index}_{num}' for num in range(nmethods)
+    ]
+
+    lines = [
+        '',
+        f'class Class{index}:',
+        f'    """{make_words(rng, 8)}."""',
+        ''
+    ]
+
+    for num, name in enumerate(names):
+        callees = rng.sample(names[num+1:], min(2, nmethods - num - 1))
+        lines += make_pymethod(rng, name, callees)
+
+    return lines
+
+
+def make_pymethod(rng, name, callees) -> list[str]:
+
+    body = [
+        f'        value = self.{callee}(arg)' for callee in callees
+    ]
+
+    body += [
+        '        for item in range(arg):',
+        '            value = os.path.join(str(item), str(value))',
+        f'        return re.sub("{rng.choice(WORDS)}", "", str(value))'
+    ]
+
+    return [
+        f'    def {name}(self, arg=None):',
+        f'        """{make_words(rng, 6)}."""',
+        '        value = None',
+        *body,
+        ''
+    ]
+
+
+def make_mdpage(nheadings=10_000, seed=0) -> str:
+    """Returns an MD page with nested headings, lists and code.
+    """
+
+    rng = random.Random(seed)
+    blocks = []
+
+    for index in range(nheadings):
+
+        level = rng.randint(1, 4)
+        title = make_words(rng, 3).title()
+
+        blocks.append('#'*level + f' {title} {index}')
+        blocks.append(make_mdpar(rng))
+
+        if index % 5 == 0:
+            blocks.append(make_mdlist(rng))
+        if index % 7 == 0:
+            blocks.append(make_mdcode(rng))
+
+    return '\n\n'.join(blocks) + '\n'
+
+
+def make_mdpar(rng) -> str:
+
+    text = make_words(rng, 40)
+    text = text.replace('alfa', '*alfa*').replace('bravo', '`bravo`')
+
+    return '\n'.join(
+        textwrap.wrap(text, width=70)
+    )
+
+
+def make_mdlist(rng) -> str:
+    return '\n'.join(
+        f'- {make_words(rng, 5)}' for _ in range(4)
+    )
+
+
+def make_mdcode(rng) -> str:
+
+    code = [
+        f'def {rng.choice(WORDS)}(arg):',
+        '    return arg + 1'
+    ]
+
+    return '```python\n' + '\n'.join(code) + '\n```'
+
+
+def make_npdocstring(nparams=2_000, seed=0) -> str:
+    """Returns a numpy-style docstring with many parameters.
+    """
+
+    rng = random.Random(seed)
+
+    lines = [
+        make_words(rng, 10).capitalize() + '.',
+        '',
+        'Parameters',
+        '----------'
+    ]
+
+    for index in range(nparams):
+        lines.append(f'param{index} : int = {index}')
+        lines.append('    ' + make_words(rng, 12) + '.')
+
+    lines += [
+        '',
+        'Returns',
+        '-------',
+        'str',
+        '    ' + make_words(rng, 10) + '.'
+    ]
+
+    return '\n'.join(lines) + '\n'
+
+
+def make_callgraph(nnodes=2_000, depth=50, seed=0) -> dict:
+    """Returns a name-to-names mapping with long call chains.
+    """
+
+    rng = random.Random(seed)
+
+    names = [
+        f'func{index}' for index in range(nnodes)
+    ]
+
+    graph = {}
+
+    for index, name in enumerate(names):
+
+        tail = names[index+1:index+depth]
+
+        if not tail:
+            continue
+
+        graph[name] = rng.sample(tail, min(3, len(tail)))
+
+    return graph
+
+
+def make_doctree(dirpath, nfiles=2_000, seed=0) -> None:
+    """Writes a source tree for `builddocs()` to a given directory.
+    """
+
+    rng = random.Random(seed)
+
+    names = [
+        f'page{index}' for index in range(nfiles)
+    ]
+
+    for name in names:
+        write_text(
+            os.path.join(dirpath, name + '.md'),
+            make_mdpage(nheadings=10, seed=rng.randint(0, 2**31))
+        )
+
+    contents = '\n'.join(
+        f'- [{name.title()}]({name}.md)' for name in names
+    )
+
+    write_text(
+        os.path.join(dirpath, 'index.md'),
+        '## Contents\n\n' + contents + '\n\n## Overview\n\nOVERVIEW\n'
+    )
+
+
+def write_text(filepath, text):
+    with open(filepath, encoding='utf-8', mode='w') as file:
+        file.write(text)
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""Runs the benchmarks and compares their results.
+
+Results are JSON objects:
+
+    {
+      "meta": {"python": ..., "platform": ..., "commit": ..., "scale": ...},
+      "results": {"NAME": {"min": s, "median": s, "peak": bytes}, ...}
+    }
+
+"""
+
+import gc
+import os
+import json
+import time
+import platform
+import statistics
+import subprocess
+import tracemalloc
+
+from .cases import BENCHMARKS
+from ..utils import tableasmd
+
+
+def runbenchmarks(names=None, scale=1.0, repeat=3) -> dict:
+    """Runs the benchmarks and returns the results.
+
+    Parameters
+    ----------
+    names : list[str] = None
+        Names of the benchmarks to run, all if None.
+    scale : float = 1.0
+        Factor applied to the sizes of the synthetic inputs.
+    repeat : int = 3
+        Number of timed runs for each benchmark.
+
+    """
+
+    runner = BenchRunner(scale, repeat)
+    return runner.run_all(names)
+
+
+def compareresults(oldres, newres, threshold=0.1) -> tuple[str, bool]:
+    """Compares two results and returns a table and a regression flag.
+
+    Parameters
+    ----------
+    oldres : dict
+        Results of the baseline.
+    newres : dict
+        Results to be checked.
+    threshold : float = 0.1
+        Allowed relative slowdown of the minimum time.
+
+    """
+
+    comparer = ResultsComparer(threshold)
+    return comparer.compare(oldres, newres)
+
+
+def dumpresults(results, filepath):
+    with open(filepath, encoding='utf-8', mode='w') as file:
+        json.dump(results, file, indent=2)
+
+
+def loadresults(filepath) -> dict:
+    with open(filepath, encoding='utf-8') as file:
+        return json.load(file)
+
+
+class BenchRunner:
+    """Times the benchmarks and tracks their memory peaks.
+
+    - Times are measured without tracemalloc (it slows down).
+    - The memory peak is measured in an extra run.
+
+    """
+
+    def __init__(self, scale, repeat):
+        self.scale = scale
+        self.repeat = repeat
+
+    def run_all(self, names=None) -> dict:
+
+        benchmarks = self.select_benchmarks(names)
+
+        results = {
+            bench.name: self.run_benchmark(bench()) for bench in benchmarks
+        }
+
+        return {
+            'meta': self.make_meta(), 'results': results
+        }
+
+    def select_benchmarks(self, names) -> list:
+
+        if names is None:
+            return list(BENCHMARKS)
+
+        unknown = set(names) - {bench.name for bench in BENCHMARKS}
+
+        if unknown:
+            raise ValueError(
+                f"unknown benchmarks: {', '.join(sorted(unknown))}"
+            )
+
+        return [
+            bench for bench in BENCHMARKS if bench.name in names
+        ]
+
+    def run_benchmark(self, bench) -> dict:
+
+        bench.setup(self.scale)
+
+        try:
+            times = self.measure_times(bench)
+            peak = self.measure_peak(bench)
+        finally:
+            bench.teardown()
+
+        return {
+            'min': min(times),
+            'median': statistics.median(times),
+            'peak': peak
+        }
+
+    def measure_times(self, bench) -> list[float]:
+        return [
+            self.measure_time(bench) for _ in range(self.repeat)
+        ]
+
+    def measure_time(self, bench) -> float:
+
+        gc.collect()
+        start = time.perf_counter()
+
+        bench.run()
+
+        return time.perf_counter() - start
+
+    def measure_peak(self, bench) -> int:
+
+        gc.collect()
+        tracemalloc.start()
+
+        try:
+            bench.run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return peak
+
+    def make_meta(self) -> dict:
+        return {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'commit': self.get_commit(),
+            'scale': self.scale,
+            'repeat': self.repeat,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S')
+        }
+
+    def get_commit(self) -> str:
+        """Returns the current git commit, if any.
+        """
+
+        pkgpath = os.path.dirname(
+            os.path.dirname(__file__)
+        )
+
+        try:
+            proc = subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], cwd=pkgpath,
+                capture_output=True, text=True, check=True
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return ''
+
+        return proc.stdout.strip()
+
+
+class ResultsComparer:
+    """Compares minimum times and memory peaks of two results.
+    """
+
+    HEADERS = [
+        'benchmark', 'old, s', 'new, s', 'ratio',
+        'old peak', 'new peak', 'status'
+    ]
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+
+    def compare(self, oldres, newres) -> tuple[str, bool]:
+
+        oldres = oldres['results']
+        newres = newres['results']
+
+        rows = [
+            [name, *self.compare_benchmark(oldres[name], newres[name])]
+            for name in newres if name in oldres
+        ]
+
+        regressed = any(
+            row[-1] == 'slower' for row in rows
+        )
+
+        return make_table(self.HEADERS, rows), regressed
+
+    def compare_benchmark(self, oldbench, newbench) -> list[str]:
+
+        ratio = newbench['min'] / oldbench['min']
+
+        return [
+            f"{oldbench['min']:.4f}",
+            f"{newbench['min']:.4f}",
+            f'{ratio:.2f}',
+            format_bytes(oldbench['peak']),
+            format_bytes(newbench['peak']),
+            self.get_status(ratio)
+        ]
+
+    def get_status(self, ratio) -> str:
+        if ratio > 1 + self.threshold:
+            return 'slower'
+        if ratio < 1 - self.threshold:
+            return 'faster'
+        return 'same'
+
+
+def format_bytes(value) -> str:
+    return f'{value / 2**20:.1f} MiB'
+
+
+def make_table(headers, rows) -> str:
+    """Renders rows under headers as an MD table.
+    """
+
+    columns = zip(headers, *rows)
+
+    return tableasmd.maketablemd(
+        list(map(list, columns))
+    )
+
+
+def results_as_table(results) -> str:
+
+    headers = [
+        'benchmark', 'min, s', 'median, s', 'peak'
+    ]
+
+    rows = [
+        [name, f"{res['min']:.4f}", f"{res['median']:.4f}",
+         format_bytes(res['peak'])]
+        for name, res in results['results'].items()
+    ]
+
+    return make_table(headers, rows)
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""Tests documentation runs scoped to changed files.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import docspyer
+
+SOURCES = [
+    'index.md', 'alfa.md', 'bravo.md'
+]
+
+SCRIPTS = {
+    'pkg/alfa.py': 'def alfa():\n    pass\n',
+    'pkg/bravo.py': 'def bravo():\n    pass\n',
+    'pkg/sub/charlie.py': 'class Charlie:\n    pass\n'
+}
+
+
+def get_cwd_path():
+    return os.path.dirname(__file__)
+
+
+def write_text(filepath, text):
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    with open(filepath, encoding='utf-8', mode='w') as file:
+        file.write(text)
+
+
+def read_text(filepath):
+    with open(filepath, encoding='utf-8') as file:
+        return file.read()
+
+
+class TestBuildChanged(unittest.TestCase):
+
+    def setUp(self):
+
+        self.srcdir = tempfile.mkdtemp()
+        self.docdir = tempfile.mkdtemp()
+
+        for filename in SOURCES:
+            shutil.copy(
+                os.path.join(get_cwd_path(), filename), self.srcdir
+            )
+
+        self.build()
+
+    def tearDown(self):
+        shutil.rmtree(self.srcdir)
+        shutil.rmtree(self.docdir)
+
+    def build(self, changed=None):
+        docspyer.builddocs(
+            self.srcdir, self.docdir, codeblocks=False, changed=changed
+        )
+
+    def srcfile(self, filename):
+        return os.path.join(self.srcdir, filename)
+
+    def remove_pages(self, *filenames):
+        for filename in filenames:
+            os.remove(os.path.join(self.docdir, filename))
+
+    def test_changed_page(self):
+
+        write_text(self.srcfile('bravo.md'), '# Bravo\n\nNEWTEXT\n')
+        self.remove_pages('alfa.html', 'bravo.html', 'docpage.js')
+
+        self.build([self.srcfile('bravo.md')])
+        pages = os.listdir(self.docdir)
+
+        assert 'NEWTEXT' in read_text(os.path.join(self.docdir, 'bravo.html'))
+        assert 'alfa.html' not in pages
+
+        # The index page links to bravo, the global TOC is rebuilt.
+        assert 'docpage.js' in pages
+
+    def test_linking_page(self):
+
+        self.remove_pages('bravo.html')
+
+        listpath = os.path.join(self.docdir, 'changed.txt')
+        write_text(listpath, self.srcfile('alfa.md') + '\n')
+
+        self.build(listpath)
+
+        assert 'bravo.html' in os.listdir(self.docdir)
+
+    def test_removed_page(self):
+
+        os.remove(self.srcfile('bravo.md'))
+        self.build([self.srcfile('bravo.md')])
+
+        assert 'bravo.html' not in os.listdir(self.docdir)
+
+    def test_archive(self):
+        with self.assertRaises(ValueError):
+            docspyer.builddocs(
+                self.srcdir, self.docdir, output='docs.zip', changed=[]
+            )
+
+
+class TestPackageChanged(unittest.TestCase):
+
+    def setUp(self):
+
+        self.tempdir = tempfile.mkdtemp()
+        self.pkgpath = os.path.join(self.tempdir, 'pkg')
+        self.docpath = os.path.join(self.tempdir, 'docs')
+
+        for filename, source in SCRIPTS.items():
+            write_text(os.path.join(self.tempdir, filename), source)
+
+        os.mkdir(self.docpath)
+        self.docpkg()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def docpkg(self, changed=None):
+        docspyer.docpackage(
+            self.pkgpath, self.docpath, ['html', 'md'], classes=True,
+            changed=changed
+        )
+
+    def docfile(self, filename):
+        return os.path.join(self.docpath, filename)
+
+    def test_changed_script(self):
+
+        scriptpath = os.path.join(self.pkgpath, 'alfa.py')
+        write_text(scriptpath, 'class Echo(Exception):\n    pass\n')
+
+        for filename in ['pkg.bravo.md', 'pkg.sub.charlie.md', 'pkg.sub.md']:
+            os.remove(self.docfile(filename))
+
+        self.docpkg([scriptpath])
+        docs = os.listdir(self.docpath)
+
+        assert 'Echo' in read_text(self.docfile('pkg.alfa.md'))
+        assert 'Echo' in read_text(self.docfile('pkg-classes.md'))
+        assert 'pkg.md' in docs and 'pkg-classes.md' in docs
+        assert 'pkg.bravo.md' not in docs
+        assert 'pkg.sub.charlie.md' not in docs and 'pkg.sub.md' not in docs
+
+        # The global TOC still lists all pages.
+        contents = read_text(self.docfile('docpage.js'))
+        assert 'pkg.sub.charlie.html' in contents
+
+    def test_removed_script(self):
+
+        scriptpath = os.path.join(self.pkgpath, 'bravo.py')
+        os.remove(scriptpath)
+
+        self.docpkg([scriptpath])
+        docs = os.listdir(self.docpath)
+
+        assert 'pkg.bravo.md' not in docs and 'pkg.bravo.html' not in docs
+        assert 'pkg.bravo.html' not in read_text(self.docfile('docpage.js'))
+
+
+if __name__ == '__main__':
+    unittest.main()
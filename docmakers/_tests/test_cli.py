@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Tests the command line interface and the worker.
+"""
+
+import io
+import os
+import sys
+import tempfile
+import contextlib
+import subprocess
+import threading
+import unittest
+
+from docspyer.docmakers import cli
+
+
+def get_script_path():
+    dirpath = os.path.dirname(os.path.dirname(__file__))
+    return os.path.join(dirpath, 'docmods.py')
+
+
+class TestCommandLine(unittest.TestCase):
+
+    def test_docscript(self):
+        with tempfile.TemporaryDirectory() as docpath:
+
+            stderr = io.StringIO()
+
+            with contextlib.redirect_stderr(stderr):
+                code = cli.main(
+                    ['docscript', get_script_path(), docpath, '--mode', 'md']
+                )
+
+            assert code == 0
+            assert os.listdir(docpath) == ['docmods.md']
+            assert stderr.getvalue() == (
+                'docspyer: 1 files written, 0 unchanged\n'
+            )
+
+    def test_wrong_path(self):
+        request = {
+            'command': 'docscript',
+            'params': {'filepath': 'nofile.py', 'docpath': '.'}
+        }
+        response = cli.Worker().handle(request)
+        assert response['status'] == 'error'
+
+    def test_unknown_command(self):
+        response = cli.Worker().handle({'command': 'nocommand'})
+        assert response['status'] == 'error'
+
+    def test_light_client(self):
+
+        code = (
+            'import sys; from docspyer.docmakers import cli; '
+            'print(sorted(name for name in sys.modules '
+            'if name.startswith("docspyer.")))'
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = subprocess.run(
+                [sys.executable, '-c', code], cwd=tmpdir, check=True,
+                capture_output=True, text=True,
+                env=os.environ | {'PYTHONPATH': os.pathsep.join(sys.path)}
+            ).stdout
+
+        assert output.split() == [
+            "['docspyer.docmakers',", "'docspyer.docmakers.cli']"
+        ]
+
+    def test_changed_list(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+
+            listpath = os.path.join(tmpdir, 'changed.txt')
+
+            with open(listpath, encoding='utf-8', mode='w') as file:
+                file.write('b.md\n\na.md\n')
+
+            request = cli.args_to_request(
+                cli.make_parser().parse_args(
+                    ['builddocs', tmpdir, tmpdir, '--changed', listpath]
+                )
+            )
+
+        assert request['params']['changed'] == [
+            os.path.abspath('a.md'), os.path.abspath('b.md')
+        ]
+
+
+class TestWorkerServer(unittest.TestCase):
+
+    def test_requests(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+
+            socketpath = os.path.join(tmpdir, 'docspyer.sock')
+            server = cli.WorkerServer(socketpath, cli.Worker())
+
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+
+            try:
+                request = cli.args_to_request(
+                    cli.make_parser().parse_args(
+                        ['docscript', get_script_path(), tmpdir]
+                    )
+                )
+                first = cli.send_request(socketpath, request)
+                second = cli.send_request(socketpath, request)
+            finally:
+                server.shutdown()
+                server.server_close()
+                thread.join()
+
+            assert first['status'] == 'ok'
+            assert second['status'] == 'ok'
+            assert server.worker.served == 2
+            assert 'docmods.html' in os.listdir(tmpdir)
+
+    def test_client_cwd(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+
+            socketpath = os.path.join(tmpdir, 'docspyer.sock')
+            clientdir = os.path.join(tmpdir, 'client')
+
+            os.makedirs(os.path.join(clientdir, 'out'))
+
+            with open(os.path.join(clientdir, 'a.py'), encoding='utf-8',
+                      mode='w') as file:
+                file.write('def a():\n    pass\n')
+
+            server = cli.WorkerServer(socketpath, cli.Worker())
+
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+
+            code = (
+                'import sys; from docspyer.docmakers import cli; '
+                'sys.exit(cli.main(sys.argv[1:]))'
+            )
+
+            # Relative paths are resolved against the cwd of the client.
+            try:
+                process = subprocess.run(
+                    [
+                        sys.executable, '-c', code, 'docscript', 'a.py',
+                        'out', '--mode', 'md', '--socket', socketpath
+                    ],
+                    cwd=clientdir, capture_output=True, text=True,
+                    env=os.environ | {'PYTHONPATH': os.pathsep.join(sys.path)}
+                )
+            finally:
+                server.shutdown()
+                server.server_close()
+                thread.join()
+
+            assert process.returncode == 0, process.stderr
+            assert os.listdir(os.path.join(clientdir, 'out')) == ['a.md']
+
+
+if __name__ == '__main__':
+    unittest.main()
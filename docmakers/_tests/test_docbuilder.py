@@ -3,6 +3,7 @@
 """
 
 import os
+import tempfile
 import unittest
 
 from docspyer.docmakers.docbuilder import (
@@ -22,6 +23,19 @@ TOC_HTML_LINKS = """
     - <a href="" style="pointer-events: none;">Delta</a>
 """
 
+ALFA_MD = """
+<!--
+{
+  "codeblocks": true
+}
+-->
+
+```python
+def alfa():
+    return 1
+```
+"""
+
 INDEXMETA = {
     'webtitle': '',
     'doctitle': '',
@@ -104,9 +118,9 @@ class TestSourceFiles(unittest.TestCase):
         assert self.files['index'].meta['annotation'] == ""
 
     def test_dumpdocpage(self):
-        self.files['index'].dumpdocpage(
-            docdir=get_cwd_path()
-        )
+        with tempfile.TemporaryDirectory() as docdir:
+            self.files['index'].dumpdocpage(docdir=docdir)
+            assert os.listdir(docdir) == ['index.html']
 
 
 class TestDocsBuilder(unittest.TestCase):
@@ -114,7 +128,6 @@ class TestDocsBuilder(unittest.TestCase):
     def test_build_docs(self):
 
         srcdir = get_cwd_path()
-        docdir = get_cwd_path()
 
         config = {
             'doclogo': '<div><h3>DOC-LOGO</h3></div>',
@@ -122,9 +135,51 @@ class TestDocsBuilder(unittest.TestCase):
             'swaplinks': True
         }
 
-        DocsBuilder().build_docs(
-            srcdir, docdir, config
-        )
+        with tempfile.TemporaryDirectory() as docdir:
+
+            DocsBuilder().build_docs(
+                srcdir, docdir, config
+            )
+
+            docs = set(os.listdir(docdir))
+
+        assert {'index.html', 'alfa.html', 'bravo.html'} <= docs
+        assert {'docpage.css', 'docpage.js'} <= docs
+
+    def test_static_codeblocks(self):
+
+        sources = {
+            'index.md': '## Contents\n\n- [Alfa](alfa.md)',
+            'alfa.md': ALFA_MD
+        }
+
+        with tempfile.TemporaryDirectory() as srcdir, \
+                tempfile.TemporaryDirectory() as docdir:
+
+            for filename, source in sources.items():
+                with open(os.path.join(srcdir, filename),
+                          encoding='utf-8', mode='w') as file:
+                    file.write(source)
+
+            DocsBuilder().build_docs(
+                srcdir, docdir, {'codeblocks': 'static'}
+            )
+
+            pages = {
+                filename: read_file(os.path.join(docdir, filename))
+                for filename in os.listdir(docdir)
+                if filename.endswith('.html')
+            }
+
+        assert 'hljs-' in pages['alfa.html']
+
+        for page in pages.values():
+            assert 'highlight.min.js' not in page
+
+
+def read_file(filepath) -> str:
+    with open(filepath, encoding='utf-8') as file:
+        return file.read()
 
 
 if __name__ == '__main__':
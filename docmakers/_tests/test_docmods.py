@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Tests class pages split from module pages.
+"""
+
+import os
+import tempfile
+import unittest
+
+import docspyer
+from docspyer.docmakers import formatdoc, pyreporters
+
+
+class TestClassPages(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.docpath = self.tempdir.name
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def read_page(self, name) -> str:
+        with open(os.path.join(self.docpath, name + '.md'),
+                  encoding='utf-8') as file:
+            return file.read()
+
+    def test_docmods(self):
+
+        docspyer.docmods(
+            [pyreporters.__file__], self.docpath, docsname='index',
+            maxclasses=5
+        )
+
+        modname = pyreporters.__name__
+        modpage = self.read_page(modname)
+        index = self.read_page('index')
+
+        assert '## docscript()' in modpage
+        assert '## PyPkgHTML' not in modpage
+        assert f'<a href="{modname}.PyPkgHTML.md">PyPkgHTML</a>' in modpage
+
+        assert '## PyPkgHTML' in self.read_page(modname + '.PyPkgHTML')
+        assert f'{modname}.PyPkgHTML.md#pypkghtml' in index
+
+        linker = formatdoc.Linker().set_config([self.docpath])
+
+        assert linker.convert(f'#{modname}-docscript'.replace('.', '-')) == (
+            f'[{modname}.docscript()]({modname}.md#docscript)'
+        )
+        assert linker.convert(f'#{modname}-PyPkgHTML'.replace('.', '-')) == (
+            f'[{modname}.PyPkgHTML]({modname}.PyPkgHTML.md#pypkghtml)'
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Tests the bounded-memory mode of builds.
+"""
+
+import os
+import tempfile
+import unittest
+
+import docspyer
+from docspyer.inspect import pyscripts
+from docspyer.utils import tracing
+
+
+def get_cwd_path():
+    return os.path.dirname(__file__)
+
+
+def read_folder(dirpath) -> dict:
+
+    contents = {}
+
+    for name in os.listdir(dirpath):
+        with open(os.path.join(dirpath, name), mode='rb') as file:
+            contents[name] = file.read()
+
+    return contents
+
+
+class TestLowMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.docpaths = []
+        for name in ['full', 'low']:
+            self.docpaths.append(os.path.join(self.tempdir.name, name))
+            os.mkdir(self.docpaths[-1])
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def assert_same_folders(self):
+        full, low = map(read_folder, self.docpaths)
+        assert full and full == low
+
+    def test_builddocs(self):
+
+        for docpath, lowmemory in zip(self.docpaths, [False, True]):
+            docspyer.builddocs(
+                get_cwd_path(), docpath, swaplinks=True, lowmemory=lowmemory
+            )
+
+        self.assert_same_folders()
+
+    def test_docpackage(self):
+
+        pkgpath = os.path.dirname(get_cwd_path())
+
+        for docpath, lowmemory in zip(self.docpaths, [False, True]):
+            docspyer.docpackage(
+                pkgpath, docpath, 'html', lowmemory=lowmemory
+            )
+
+        self.assert_same_folders()
+
+    def test_docmods(self):
+
+        pkgpath = os.path.dirname(get_cwd_path())
+
+        modules = [
+            os.path.join(pkgpath, 'docbuilder.py'),
+            os.path.join(pkgpath, 'docmods.py')
+        ]
+
+        for docpath, lowmemory in zip(self.docpaths, [False, True]):
+            docspyer.docmods(
+                modules, docpath, docsname='index', lowmemory=lowmemory
+            )
+
+        self.assert_same_folders()
+
+
+class TestLazyScripts(unittest.TestCase):
+
+    def test_getscripts(self):
+
+        dirpath = os.path.dirname(get_cwd_path())
+
+        eager = pyscripts.getscripts(dirpath)
+        lazy = pyscripts.getscripts(dirpath, lazy=True)
+
+        assert lazy.listscripts() == eager.listscripts()
+
+        for script, record in zip(lazy.getscripts(), eager.getscripts()):
+            assert 'source' not in vars(script)
+            assert script.source == record.source
+            assert set(vars(record)) - {'source'} <= set(vars(script))
+
+
+class TestMemoryPeaks(unittest.TestCase):
+
+    def test_peaks(self):
+
+        tracer = tracing.Tracer(memory=True)
+
+        with tracing.tracerun(tracer):
+            with tracing.span('outer') as outer:
+                with tracing.span('inner') as inner:
+                    data = bytearray(2**20)
+                del data
+
+        assert inner['peak'] >= 2**20
+        assert outer['peak'] >= inner['peak']
+
+
+if __name__ == '__main__':
+    unittest.main()
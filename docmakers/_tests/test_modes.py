@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""Tests making several output formats in one run.
+"""
+
+import os
+import tempfile
+import unittest
+
+import docspyer
+from docspyer.docmakers import pyreporters
+from docspyer.utils import tracing
+
+
+def get_pkg_path():
+    return os.path.dirname(docspyer.__file__)
+
+
+def read_folder(dirpath) -> dict:
+
+    contents = {}
+
+    for name in os.listdir(dirpath):
+        with open(os.path.join(dirpath, name), mode='rb') as file:
+            contents[name] = file.read()
+
+    return contents
+
+
+def count_spans(tracer, name) -> int:
+    return sum(
+        event['name'] == name for event in tracer.events
+    )
+
+
+class TestModes(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def make_docpath(self, name) -> str:
+        docpath = os.path.join(self.tempdir.name, name)
+        os.mkdir(docpath)
+        return docpath
+
+    def test_docpackage(self):
+
+        single = self.make_docpath('single')
+        multi = self.make_docpath('multi')
+
+        docspyer.docpackage(get_pkg_path(), single, 'md', imports=True)
+        docspyer.docpackage(get_pkg_path(), single, 'html', imports=True)
+
+        tracer = tracing.Tracer()
+
+        docspyer.docpackage(
+            get_pkg_path(), multi, ['md', 'html'], imports=True, trace=tracer
+        )
+
+        assert read_folder(multi) == read_folder(single)
+        assert count_spans(tracer, 'imports') == 1
+
+    def test_single_parse(self):
+
+        docpath = self.make_docpath('docs')
+        dirpath = os.path.join(get_pkg_path(), 'inspect')
+
+        tracer = tracing.Tracer()
+
+        with tracing.tracerun(tracer):
+            toc = pyreporters.docpydir_multi(
+                dirpath, docpath, ['md', 'html'], hostname='docspyer'
+            )
+
+        names = os.listdir(docpath)
+        reports = count_spans(tracer, 'report')
+
+        # Each format has the outline page and a page per script.
+        for fileext in ['.md', '.html']:
+            pages = [name for name in names if name.endswith(fileext)]
+            assert reports == len(pages) - 1
+
+        assert toc.startswith('- <a href="docspyer.inspect.html">')
+
+    def test_docscript(self):
+
+        docpath = self.make_docpath('docs')
+        filepath = os.path.join(get_pkg_path(), 'inspect', 'pyreport.py')
+
+        docspyer.docscript(filepath, docpath, ['html', 'md', 'html'])
+
+        names = set(os.listdir(docpath))
+
+        assert {'pyreport.md', 'pyreport.html'} <= names
+
+    def test_wrong_modes(self):
+
+        docpath = self.make_docpath('docs')
+
+        with self.assertRaises(pyreporters.DocModeError):
+            docspyer.docpackage(get_pkg_path(), docpath, ['md', 'rst'])
+
+        with self.assertRaises(pyreporters.DocModeError):
+            docspyer.docpackage(get_pkg_path(), docpath, [])
+
+    def test_unknown_setting(self):
+
+        docpath = self.make_docpath('docs')
+
+        with self.assertRaises(TypeError):
+            docspyer.docpackage(get_pkg_path(), docpath, 'md', foldtree=(1, 1))
+
+        assert os.listdir(docpath) == []
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Tests documentation written to archives.
+"""
+
+import os
+import zipfile
+import tempfile
+import unittest
+
+import docspyer
+
+
+def get_cwd_path():
+    return os.path.dirname(__file__)
+
+
+def read_folder(dirpath) -> dict:
+
+    contents = {}
+
+    for name in os.listdir(dirpath):
+        with open(os.path.join(dirpath, name), mode='rb') as file:
+            contents[name] = file.read()
+
+    return contents
+
+
+def read_zip(zippath) -> dict:
+    with zipfile.ZipFile(zippath) as archive:
+        return {
+            name: archive.read(name) for name in archive.namelist()
+        }
+
+
+class TestArchiveOutput(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.docpath = os.path.join(self.tempdir.name, 'docs')
+        self.zippath = os.path.join(self.tempdir.name, 'docs.zip')
+        os.mkdir(self.docpath)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_builddocs(self):
+
+        srcpath = get_cwd_path()
+
+        docspyer.builddocs(srcpath, self.docpath, swaplinks=True)
+        docspyer.builddocs(srcpath, None, swaplinks=True, output=self.zippath)
+
+        assert read_zip(self.zippath) == read_folder(self.docpath)
+
+    def test_docpackage(self):
+
+        pkgpath = os.path.dirname(get_cwd_path())
+
+        docspyer.docpackage(pkgpath, self.docpath, 'html')
+        docspyer.docpackage(pkgpath, None, 'html', output=self.zippath)
+
+        assert read_zip(self.zippath) == read_folder(self.docpath)
+
+
+if __name__ == '__main__':
+    unittest.main()
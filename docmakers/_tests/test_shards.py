@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Tests sharded documentation of a package.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import docspyer
+from docspyer.docmakers import pyreporters
+
+
+def get_pkg_path():
+    return os.path.dirname(docspyer.__file__)
+
+
+def read_folder(dirpath) -> dict:
+
+    contents = {}
+
+    for name in os.listdir(dirpath):
+        if name.startswith('.'):
+            continue
+        with open(os.path.join(dirpath, name), mode='rb') as file:
+            contents[name] = file.read()
+
+    return contents
+
+
+class TestShards(unittest.TestCase):
+
+    def test_merged_equals_single(self):
+
+        with tempfile.TemporaryDirectory() as tempdir:
+
+            single = os.path.join(tempdir, 'single')
+            merged = os.path.join(tempdir, 'merged')
+
+            os.mkdir(single)
+            os.mkdir(merged)
+
+            docspyer.docpackage(get_pkg_path(), single, 'html')
+
+            manifests = []
+
+            for index in range(3):
+
+                shardpath = os.path.join(tempdir, f'shard{index}')
+                os.mkdir(shardpath)
+
+                docspyer.docpackage(
+                    get_pkg_path(), shardpath, 'html', shard=(index, 3)
+                )
+
+                manifest = f'.docspyer-shard-{index}-of-3.json'
+                manifests.append(os.path.join(shardpath, manifest))
+
+                for name in os.listdir(shardpath):
+                    shutil.copy(os.path.join(shardpath, name), merged)
+
+            docspyer.mergedocs(manifests, merged)
+
+            assert read_folder(merged) == read_folder(single)
+
+    def test_missing_shard(self):
+
+        with tempfile.TemporaryDirectory() as docpath:
+
+            docspyer.docpackage(
+                get_pkg_path(), docpath, 'html', maxdepth=0, shard=(0, 2)
+            )
+
+            manifest = os.path.join(docpath, '.docspyer-shard-0-of-2.json')
+
+            with self.assertRaises(pyreporters.ShardsError):
+                docspyer.mergedocs([manifest], docpath)
+
+    def test_wrong_shard(self):
+        with self.assertRaises(pyreporters.ShardsError):
+            docspyer.docpackage(get_pkg_path(), '.', 'md', shard=(2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Tests concurrent builds in one process.
+"""
+
+import os
+import tempfile
+import unittest
+import concurrent.futures
+
+import docspyer
+from docspyer.inspect import pyreport
+from docspyer.utils import dumpfiles
+
+
+def get_cwd_path():
+    return os.path.dirname(__file__)
+
+
+def read_folder(dirpath) -> dict:
+
+    contents = {}
+
+    for name in os.listdir(dirpath):
+        with open(os.path.join(dirpath, name), mode='rb') as file:
+            contents[name] = file.read()
+
+    return contents
+
+
+def run_builddocs(docpath, codeblocks):
+    docspyer.builddocs(
+        get_cwd_path(), docpath, swaplinks=True, codeblocks=codeblocks
+    )
+
+
+def run_docpackage(docpath, mode):
+    docspyer.docpackage(
+        os.path.dirname(get_cwd_path()), docpath, mode
+    )
+
+
+JOBS = [
+    (run_builddocs, True),
+    (run_builddocs, 'static'),
+    (run_docpackage, 'html'),
+    (run_docpackage, 'md')
+]
+
+
+class TestThreads(unittest.TestCase):
+
+    ROUNDS = 4
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        pyreport.REPORTS.enable()
+
+    def tearDown(self):
+        pyreport.REPORTS.disable()
+        self.tempdir.cleanup()
+
+    def make_docdir(self, name) -> str:
+        docpath = os.path.join(self.tempdir.name, name)
+        os.mkdir(docpath)
+        return docpath
+
+    def run_job(self, index, jobid) -> dict:
+
+        func, arg = JOBS[jobid]
+        docpath = self.make_docdir(f'run{index}')
+
+        dumpfiles.resetstats()
+        func(docpath, arg)
+
+        written = dumpfiles.getstats()['written']
+        assert written == len(os.listdir(docpath))
+
+        return read_folder(docpath)
+
+    def test_parallel_builds(self):
+
+        expected = []
+
+        for jobid, (func, arg) in enumerate(JOBS):
+            docpath = self.make_docdir(f'serial{jobid}')
+            func(docpath, arg)
+            expected.append(read_folder(docpath))
+
+        jobids = list(range(len(JOBS))) * self.ROUNDS
+
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            results = list(
+                executor.map(self.run_job, range(len(jobids)), jobids)
+            )
+
+        for jobid, res in zip(jobids, results):
+            assert res == expected[jobid]
+
+
+if __name__ == '__main__':
+    unittest.main()
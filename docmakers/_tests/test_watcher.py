@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Tests incremental rebuilds of the documentation.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from docspyer.docmakers import watcher
+
+
+SOURCES = [
+    'index.md', 'alfa.md', 'bravo.md'
+]
+
+
+def get_cwd_path():
+    return os.path.dirname(__file__)
+
+
+def copy_sources(srcdir):
+    for filename in SOURCES:
+        shutil.copy(
+            os.path.join(get_cwd_path(), filename), srcdir
+        )
+
+
+def append_text(filepath, text):
+    with open(filepath, encoding='utf-8', mode='a') as file:
+        file.write(text)
+
+
+def read_text(filepath):
+    with open(filepath, encoding='utf-8') as file:
+        return file.read()
+
+
+class TestPollingWatcher(unittest.TestCase):
+
+    def test_changes(self):
+
+        with tempfile.TemporaryDirectory() as srcdir:
+
+            copy_sources(srcdir)
+
+            alfa = os.path.join(srcdir, 'alfa.md')
+            bravo = os.path.join(srcdir, 'bravo.md')
+            delta = os.path.join(srcdir, 'delta.md')
+
+            files = watcher.PollingWatcher(srcdir, '.md', recursive=False)
+
+            assert not files.poll()
+
+            append_text(alfa, '\nNEWTEXT\n')
+            append_text(delta, 'DELTA\n')
+            os.remove(bravo)
+
+            changes = files.poll()
+
+            assert changes.modified == {alfa}
+            assert changes.added == {delta}
+            assert changes.removed == {bravo}
+
+            assert not files.poll()
+
+    def test_make_watcher(self):
+
+        with tempfile.TemporaryDirectory() as srcdir:
+
+            files = watcher.make_watcher(srcdir, '.md', recursive=True)
+
+            append_text(
+                os.path.join(srcdir, 'alfa.md'), 'ALFA\n'
+            )
+
+            changes = files.wait(timeout=1.0)
+            files.close()
+
+            assert len(changes.added) == 1
+
+
+class TestDocsRebuilder(unittest.TestCase):
+
+    def setUp(self):
+
+        self.srcdir = tempfile.mkdtemp()
+        self.docdir = tempfile.mkdtemp()
+
+        copy_sources(self.srcdir)
+
+        self.rebuilder = watcher.DocsRebuilder(
+            self.srcdir, self.docdir, {'codeblocks': False}
+        )
+
+        self.rebuilder.build()
+
+        self.files = watcher.PollingWatcher(
+            self.srcdir, '.md', recursive=False
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.srcdir)
+        shutil.rmtree(self.docdir)
+
+    def docfile(self, filename):
+        return os.path.join(self.docdir, filename)
+
+    def srcfile(self, filename):
+        return os.path.join(self.srcdir, filename)
+
+    def test_page_update(self):
+
+        bravo = self.rebuilder.builder.source_files.files['bravo']
+
+        os.remove(self.docfile('docpage.js'))
+        append_text(self.srcfile('alfa.md'), '\nNEWTEXT\n')
+
+        rebuilt = self.rebuilder.update(self.files.poll())
+
+        assert rebuilt == ['alfa']
+        assert 'NEWTEXT' in read_text(self.docfile('alfa.html'))
+        assert 'docpage.js' not in os.listdir(self.docdir)
+        assert self.rebuilder.builder.source_files.files['bravo'] is bravo
+
+    def test_toc_update(self):
+
+        os.remove(self.docfile('docpage.js'))
+
+        append_text(self.srcfile('index.md'), '\nNEWTEXT\n')
+        self.rebuilder.update(self.files.poll())
+
+        assert 'docpage.js' not in os.listdir(self.docdir)
+
+        indexmd = read_text(self.srcfile('index.md'))
+        indexmd = indexmd.replace('[Alfa]', '[Alfa Echo]')
+
+        with open(self.srcfile('index.md'), encoding='utf-8', mode='w') as file:
+            file.write(indexmd)
+
+        self.rebuilder.update(self.files.poll())
+
+        assert 'Echo' in read_text(self.docfile('docpage.js'))
+
+    def test_removed_page(self):
+
+        os.remove(self.srcfile('bravo.md'))
+        self.rebuilder.update(self.files.poll())
+
+        assert 'bravo.html' not in os.listdir(self.docdir)
+        assert 'bravo' not in self.rebuilder.builder.source_files.files
+
+
+class TestPackageRebuilder(unittest.TestCase):
+
+    def test_affected_dirs(self):
+
+        pkgpath = os.path.dirname(get_cwd_path())
+
+        rebuilder = watcher.PackageRebuilder(
+            pkgpath, docpath='', mode='md', maxdepth=None
+        )
+
+        rebuilder.docmaker.set_locals(pkgpath, '', maxdepth=None)
+        rebuilder.dirpaths = rebuilder.list_pkg_dirs()
+
+        paths = [
+            os.path.join(pkgpath, 'watcher.py'),
+            os.path.join(pkgpath, '_tests', 'test_watcher.py')
+        ]
+
+        assert rebuilder.dirpaths == [pkgpath]
+        assert rebuilder.get_affected_dirs(paths) == [pkgpath]
+        assert rebuilder.get_hostname(pkgpath) == ''
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,658 @@
+# -*- coding: utf-8 -*-
+"""Command-line interface and persistent worker.
+
+Commands:
+
+    python -m docspyer docscript FILEPATH DOCPATH [--mode MODE [MODE]]
+    python -m docspyer docpackage PKGPATH DOCPATH [--mode MODE [MODE]] [...]
+    python -m docspyer mergedocs MANIFEST [MANIFEST ...] --docpath DOCPATH
+    python -m docspyer builddocs SRCPATH DOCPATH [--swaplinks] [...]
+    python -m docspyer docmods MODULE [MODULE ...] --docpath DOCPATH [...]
+    python -m docspyer serve --socket PATH
+    python -m docspyer watchdocs SRCPATH DOCPATH [--interval S] [...]
+    python -m docspyer watchpackage PKGPATH DOCPATH [--mode MODE] [...]
+
+- Commands are forwarded to a running worker, if `--socket` is given.
+- The worker keeps templates and reports warm between requests.
+- The worker handles each connection in its own thread.
+- Requests and responses are JSON lines over a UNIX socket.
+- Watch commands always run in the current process.
+- With `--trace PATH`, spans of build stages are saved as Chrome trace
+  events and summed up in a table (with memory peaks, if `--trace-memory`).
+- With `--lowmemory`, sources are read and released one by one.
+- With `--imports` (or `--importtime LOG`), docpackage adds the report
+  on import cycles, transitive imports and import times.
+- With `--classes`, docpackage adds the report on class trees
+  across modules.
+- With `--mode md html`, scripts are parsed once for both formats.
+- With `--assets`, static files are minified and named by content
+  hashes, pages and static files get gzip siblings (folders only).
+- With `--foldtrees DEPTH BREADTH`, larger call trees and class trees
+  in HTML reports are folded and expanded on click.
+- With `--blocking PATTERN ...`, docscript and docpackage report
+  calls matching the patterns (fnmatch) as blocking in coroutines.
+- With `--hotloops`, docscript and docpackage mark calls in loops
+  with loop depths and list functions with such calls.
+- With `--changed LIST`, builddocs and docpackage rebuild only pages
+  affected by files listed in LIST (one path per line, `-` for stdin).
+
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import importlib
+import threading
+import socketserver
+
+# Modules of the package are imported by the commands, so that
+# a client forwarding a request to the worker stays light.
+
+
+# Arguments with paths, sent to the worker as absolute paths.
+PATHARGS = (
+    'filepath', 'docpath', 'srcpath', 'pkgpath', 'manifests', 'output',
+    'trace', 'profile', 'importtime'
+)
+
+MAYBEPATHARGS = (
+    'modules', 'extracss', 'extrajs'
+)
+
+
+def main(argv=None) -> int:
+    """Runs the command line interface and returns the exit code.
+    """
+
+    parser = make_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        serve(args.socket)
+        return 0
+
+    if args.command.startswith('watch'):
+        return run_watch(args)
+
+    request = args_to_request(args)
+
+    if args.socket:
+        response = send_request(args.socket, request)
+    else:
+        response = Worker().handle(request)
+
+    return report_response(response)
+
+
+def make_parser():
+
+    parser = argparse.ArgumentParser(
+        prog='docspyer', description='Explores the structure of Python code.'
+    )
+
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add_docscript_parser(commands)
+    add_docpackage_parser(commands)
+    add_mergedocs_parser(commands)
+    add_builddocs_parser(commands)
+    add_docmods_parser(commands)
+    add_serve_parser(commands)
+    add_watchdocs_parser(commands)
+    add_watchpackage_parser(commands)
+
+    return parser
+
+
+def add_output_option(parser):
+    parser.add_argument(
+        '--output', default=None,
+        help='output folder or archive (.zip, .tar, .tar.gz)'
+    )
+
+
+def add_trace_option(parser):
+    parser.add_argument(
+        '--trace', default=None,
+        help='JSON file for Chrome trace events of build stages'
+    )
+    parser.add_argument(
+        '--trace-memory', action='store_true',
+        help='add tracemalloc peaks to the traced stages'
+    )
+
+
+def add_profile_option(parser):
+    parser.add_argument(
+        '--profile', default=None,
+        help='cProfile file (.prof) to annotate call trees with'
+    )
+
+
+def add_foldtrees_option(parser):
+    parser.add_argument(
+        '--foldtrees', type=int, nargs=2, default=None,
+        metavar=('DEPTH', 'BREADTH'),
+        help='fold trees in HTML reports beyond the max depth and breadth'
+    )
+
+
+def add_blocking_option(parser):
+    parser.add_argument(
+        '--blocking', nargs='+', default=None, metavar='PATTERN',
+        help='patterns of calls that block the event loop'
+    )
+
+
+def add_hotloops_option(parser):
+    parser.add_argument(
+        '--hotloops', action='store_true',
+        help='mark calls in loops and list functions with such calls'
+    )
+
+
+def add_lowmemory_option(parser):
+    parser.add_argument(
+        '--lowmemory', action='store_true',
+        help='read and release sources one by one (bounded memory)'
+    )
+
+
+def add_assets_option(parser):
+    parser.add_argument(
+        '--assets', action='store_true',
+        help='minify and fingerprint static files, add gzip siblings'
+    )
+
+
+def add_changed_option(parser):
+    parser.add_argument(
+        '--changed', default=None, metavar='LIST',
+        help='file listing changed files to rebuild for ("-" for stdin)'
+    )
+
+
+def add_socket_option(parser, required=False):
+    parser.add_argument(
+        '--socket', required=required,
+        help='path to the UNIX socket of the worker'
+    )
+
+
+def add_docscript_parser(commands):
+
+    parser = commands.add_parser(
+        'docscript', help='report on a python script'
+    )
+
+    parser.add_argument('filepath')
+    parser.add_argument('docpath')
+    parser.add_argument(
+        '--mode', default='html', choices=['html', 'md'], nargs='+',
+        help='one or more output formats made in one run'
+    )
+
+    add_profile_option(parser)
+    add_foldtrees_option(parser)
+    add_blocking_option(parser)
+    add_hotloops_option(parser)
+    add_socket_option(parser)
+
+
+def add_docpackage_parser(commands):
+
+    parser = commands.add_parser(
+        'docpackage', help='overview of a python package'
+    )
+
+    parser.add_argument('pkgpath')
+    parser.add_argument('docpath')
+    parser.add_argument(
+        '--mode', default='html', choices=['html', 'md'], nargs='+',
+        help='one or more output formats made in one run'
+    )
+    parser.add_argument('--maxdepth', type=int, default=None)
+    parser.add_argument(
+        '--shard', type=int, nargs=2, default=None, metavar=('I', 'N'),
+        help='document only the I-th of N shards of folders'
+    )
+    parser.add_argument(
+        '--imports', action='store_true',
+        help='add the report on imports between modules'
+    )
+    parser.add_argument(
+        '--importtime', default=None, metavar='LOG',
+        help='log of python -X importtime to rank imports by times'
+    )
+    parser.add_argument(
+        '--classes', action='store_true',
+        help='add the report on inheritance across modules'
+    )
+
+    add_profile_option(parser)
+    add_foldtrees_option(parser)
+    add_blocking_option(parser)
+    add_hotloops_option(parser)
+
+    add_output_option(parser)
+    add_trace_option(parser)
+    add_lowmemory_option(parser)
+    add_assets_option(parser)
+    add_changed_option(parser)
+    add_socket_option(parser)
+
+
+def add_mergedocs_parser(commands):
+
+    parser = commands.add_parser(
+        'mergedocs', help='merge shards of a package overview'
+    )
+
+    parser.add_argument('manifests', nargs='+')
+    parser.add_argument('--docpath', required=True)
+
+    add_assets_option(parser)
+    add_socket_option(parser)
+
+
+def add_builddocs_parser(commands):
+
+    parser = commands.add_parser(
+        'builddocs', help='HTML documentation from MD sources'
+    )
+
+    parser.add_argument('srcpath')
+    parser.add_argument('docpath')
+    parser.add_argument('--doclogo', default=None)
+    parser.add_argument('--extracss', default=None)
+    parser.add_argument('--extrajs', default=None)
+    parser.add_argument('--swaplinks', action='store_true')
+    parser.add_argument(
+        '--no-codeblocks', dest='codeblocks', action='store_false'
+    )
+    parser.add_argument(
+        '--static-codeblocks', dest='codeblocks',
+        action='store_const', const='static'
+    )
+
+    add_output_option(parser)
+    add_trace_option(parser)
+    add_lowmemory_option(parser)
+    add_assets_option(parser)
+    add_changed_option(parser)
+    add_socket_option(parser)
+
+
+def add_docmods_parser(commands):
+
+    parser = commands.add_parser(
+        'docmods', help='MD documentation for python modules'
+    )
+
+    parser.add_argument(
+        'modules', nargs='+', help='module names or paths to sources'
+    )
+
+    parser.add_argument('--docpath', required=True)
+    parser.add_argument('--docsname', default=None)
+    parser.add_argument('--hostname', default=None)
+    parser.add_argument('--clsverbs', type=int, default=0)
+    parser.add_argument(
+        '--maxclasses', type=int, default=None,
+        help='modules with more classes get one page per class'
+    )
+    parser.add_argument(
+        '--maxclasssize', type=int, default=None,
+        help='classes with longer MD entries get their own pages'
+    )
+    parser.add_argument('--codeblocks', action='store_true')
+    parser.add_argument(
+        '--no-npstyle', dest='npstyle', action='store_false'
+    )
+
+    add_output_option(parser)
+    add_trace_option(parser)
+    add_lowmemory_option(parser)
+    add_socket_option(parser)
+
+
+def add_serve_parser(commands):
+
+    parser = commands.add_parser(
+        'serve', help='run a persistent worker'
+    )
+
+    add_socket_option(parser, required=True)
+
+
+def add_watchdocs_parser(commands):
+
+    parser = commands.add_parser(
+        'watchdocs', help='rebuild HTML documentation on changes'
+    )
+
+    parser.add_argument('srcpath')
+    parser.add_argument('docpath')
+    parser.add_argument('--interval', type=float, default=0.5)
+    parser.add_argument('--doclogo', default=None)
+    parser.add_argument('--extracss', default=None)
+    parser.add_argument('--extrajs', default=None)
+    parser.add_argument('--swaplinks', action='store_true')
+    parser.add_argument(
+        '--no-codeblocks', dest='codeblocks', action='store_false'
+    )
+    parser.add_argument(
+        '--static-codeblocks', dest='codeblocks',
+        action='store_const', const='static'
+    )
+
+
+def add_watchpackage_parser(commands):
+
+    parser = commands.add_parser(
+        'watchpackage', help='rebuild a package overview on changes'
+    )
+
+    parser.add_argument('pkgpath')
+    parser.add_argument('docpath')
+    parser.add_argument('--mode', default='html', choices=['html', 'md'])
+    parser.add_argument('--maxdepth', type=int, default=None)
+    parser.add_argument('--interval', type=float, default=0.5)
+
+
+def run_watch(args) -> int:
+    """Runs a watch command until interrupted.
+    """
+
+    from . import utils, watcher
+
+    params = dict(vars(args))
+    watch = getattr(watcher, params.pop('command'))
+
+    try:
+        watch(**params)
+    except (OSError, utils.DirNotFound) as exc:
+        return report_response(
+            Worker().error(f'{type(exc).__name__}: {exc}')
+        )
+
+    return 0
+
+
+def args_to_request(args) -> dict:
+
+    params = dict(vars(args))
+
+    command = params.pop('command')
+    params.pop('socket')
+
+    if params.get('changed') is not None:
+        params['changed'] = read_changed_list(params['changed'])
+
+    make_paths_absolute(params)
+
+    return {
+        'command': command, 'params': params
+    }
+
+
+def make_paths_absolute(params):
+    """Resolves paths against the cwd of the client, not of the worker.
+
+    - Arguments that may be paths or text (module names, CSS, JS)
+      are resolved, if they exist.
+
+    """
+
+    def resolve(value, always):
+        if value is None or not (always or os.path.exists(value)):
+            return value
+        return os.path.abspath(value)
+
+    for name, value in params.items():
+
+        if name not in PATHARGS and name not in MAYBEPATHARGS:
+            continue
+
+        always = name in PATHARGS
+
+        if isinstance(value, list):
+            params[name] = [resolve(item, always) for item in value]
+        else:
+            params[name] = resolve(value, always)
+
+
+def read_changed_list(listpath) -> list[str]:
+    """Reads paths of changed files, the worker gets absolute ones.
+    """
+
+    from . import utils
+
+    if listpath == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = utils.read_file(listpath).splitlines()
+
+    return sorted(
+        utils.read_changed(lines)
+    )
+
+
+def report_response(response) -> int:
+
+    if response.get('status') == 'ok':
+        report_stats(response)
+        return 0
+
+    print(
+        'docspyer: error: ' + response.get('error', ''), file=sys.stderr
+    )
+
+    return 1
+
+
+def report_stats(response):
+    """Prints counts of files and the trace table to stderr.
+    """
+
+    if 'written' in response:
+        print(
+            f"docspyer: {response['written']} files written, "
+            f"{response['skipped']} unchanged", file=sys.stderr
+        )
+
+    if 'trace' in response:
+        print(response['trace'], file=sys.stderr)
+
+
+def send_request(socketpath, request) -> dict:
+    """Sends a request to the worker and returns the response.
+    """
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+
+        client.connect(socketpath)
+
+        with client.makefile(mode='rw', encoding='utf-8') as stream:
+            stream.write(json.dumps(request) + '\n')
+            stream.flush()
+            response = stream.readline()
+
+    return json.loads(response)
+
+
+def serve(socketpath) -> None:
+    """Runs a persistent worker on a UNIX socket.
+    """
+
+    if os.path.exists(socketpath):
+        os.remove(socketpath)
+
+    server = WorkerServer(socketpath, Worker())
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(socketpath)
+
+
+class Worker:
+    """Runs commands, keeps caches warm between requests.
+    """
+
+    COMMANDS = (
+        'docscript', 'docpackage', 'mergedocs', 'builddocs', 'docmods',
+        'status'
+    )
+
+    def __init__(self):
+        self.served = 0
+        self.lock = threading.Lock()
+
+    def warmup(self):
+        """Loads templates and enables the reports cache.
+        """
+
+        from ..docpage import templates
+        from ..inspect import pyreport
+
+        for name in os.listdir(templates.TEMPLATESPATH):
+            templates.read_template(name)
+
+        pyreport.REPORTS.enable()
+
+    def handle(self, request) -> dict:
+
+        from ..utils import dumpfiles, tracing
+
+        command = request.get('command')
+        params = request.get('params', {})
+
+        if command not in self.COMMANDS:
+            return self.error(f"unknown command '{command}'")
+
+        params = dict(params)
+        tracepath = params.pop('trace', None)
+        memory = params.pop('trace_memory', False)
+
+        tracer = tracing.Tracer(memory) if tracepath else None
+
+        start = time.perf_counter()
+        dumpfiles.resetstats()
+
+        try:
+            with tracing.tracerun(tracer):
+                getattr(self, 'run_' + command)(**params)
+            if tracer:
+                tracer.dumptrace(tracepath)
+        except Exception as exc:  # pylint: disable=broad-except
+            return self.error(f'{type(exc).__name__}: {exc}')
+
+        with self.lock:
+            self.served += 1
+
+        response = {
+            'status': 'ok',
+            'elapsed': time.perf_counter() - start
+        } | dumpfiles.getstats()
+
+        if tracer:
+            response['trace'] = tracer.summary()
+
+        return response
+
+    def error(self, message) -> dict:
+        return {
+            'status': 'error', 'error': message
+        }
+
+    def run_status(self):
+        pass
+
+    def run_docscript(self, filepath, docpath, mode='html', profile=None,
+                      foldtrees=None, blocking=None, hotloops=False):
+        from .pyreporters import docscript
+        docscript(
+            filepath, docpath, mode, profile, foldtrees, blocking, hotloops
+        )
+
+    def run_docpackage(self, pkgpath, docpath, mode='html', maxdepth=None,
+                       **settings):
+        from .pyreporters import docpackage
+        docpackage(pkgpath, docpath, mode, maxdepth, **settings)
+
+    def run_mergedocs(self, manifests, docpath, assets=False):
+        from .pyreporters import mergedocs
+        mergedocs(manifests, docpath, assets)
+
+    def run_builddocs(self, srcpath, docpath, **settings):
+        from .docbuilder import builddocs
+        builddocs(srcpath, docpath, **settings)
+
+    def run_docmods(self, modules, docpath, **settings):
+
+        from .docmods import docmods
+
+        modules = list(
+            map(self.get_module, modules)
+        )
+
+        docmods(modules, docpath, **settings)
+
+    def get_module(self, name):
+        """Returns a path as it is (static), imports a module otherwise.
+        """
+        if os.path.exists(name):
+            return name
+        return importlib.import_module(name)
+
+
+class WorkerServer(socketserver.ThreadingUnixStreamServer):
+    """UNIX socket server that holds a warm worker.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socketpath, worker):
+
+        self.worker = worker
+        self.worker.warmup()
+
+        super().__init__(socketpath, WorkerHandler)
+
+    def server_close(self):
+
+        from ..inspect import pyreport
+
+        super().server_close()
+        pyreport.REPORTS.disable()
+
+
+class WorkerHandler(socketserver.StreamRequestHandler):
+    """Handles JSON lines with requests to the worker.
+    """
+
+    def handle(self):
+
+        for line in self.rfile:
+
+            response = self.handle_line(line)
+
+            self.wfile.write(
+                json.dumps(response).encode('utf-8') + b'\n'
+            )
+
+    def handle_line(self, line) -> dict:
+
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError:
+            return self.server.worker.error('broken JSON request')
+
+        return self.server.worker.handle(request)
@@ -5,11 +5,13 @@
 import os
 import re
 import json
+import functools
 
 from . import utils
 from ..docpage import pagemaker
+from ..docpage import assets
 from ..docpage import textmd
-from ..utils import treeashtml, texttrees
+from ..utils import treeashtml, texttrees, tracing
 
 __all__ = [
     'docsource', 'builddocs'
@@ -29,8 +31,9 @@ def docsource(srcpath, docpath, codeblocks=False) -> None:
         Path to the source file.
     docpath : str
         Path where to place the output files.
-    codeblocks : bool
+    codeblocks : bool | str
         Code highlighting is activated, if True.
+        If "static", code is highlighted at build time (no JS).
 
     """
 
@@ -65,8 +68,9 @@ def builddocs(srcpath, docpath, **settings) -> None:
     doclogo : str = None
         Documentation logo as an SVG or HTML tag.
         The recommended size is 30-40px.
-    codeblocks : bool = True 
+    codeblocks : bool | str = True 
         Code highlighting is activated, if True.
+        If "static", code is highlighted at build time (no JS).
     swaplinks : bool = False
         If True, links to MD files are converted 
         to HTML ones across the source files.
@@ -74,17 +78,53 @@ def builddocs(srcpath, docpath, **settings) -> None:
         Custom CSS styles to include (path or text).
     extrajs : str = None
         Custom JS code to include (path or text).
+    output : str | file = None
+        Output folder, archive path (.zip, .tar, .tar.gz)
+        or writable binary file (a). If None, docpath is used.
+    trace : str | Tracer = None
+        Path to a JSON file for Chrome trace events or a tracer
+        to collect spans of build stages (see `utils.tracing`).
+    lowmemory : bool = False
+        If True, source files are read, written and released
+        one by one, only the global TOC is kept.
+    assets : bool = False
+        If True, static files are minified and fingerprinted,
+        pages and static files get gzip siblings (b).
+    changed : list[str] | str = None
+        Paths to changed source files or a file listing them,
+        only the affected pages are rebuilt (c).
+
+    Notes
+    -----
+
+    (a) — Names of archive members are the same as in a folder.
+
+    (b) — Static files are named by content hashes, links in pages
+          are rewritten (see `docpage.packassets()`), folders only.
+
+    (c) — Pages of changed sources and pages linking to them
+          (the index page included) are rebuilt, pages of removed
+          sources are deleted. Other pages are kept from the previous
+          build in docpath. Static files are rebuilt with the index page.
 
     """
 
     srcpath = utils.check_srcdir(srcpath)
-    docpath = utils.check_docdir(docpath)
 
-    doc_builder = DocsBuilder()
+    settings = dict(settings)
+    output = settings.pop('output', None)
+    trace = settings.pop('trace', None)
 
-    doc_builder.build_docs(
-        srcpath, docpath, settings
-    )
+    utils.check_assets_output(settings.get('assets'), output)
+    utils.check_changed_output(settings.get('changed'), output)
+
+    with tracing.tracerun(trace), utils.opendocs(docpath, output) as docpath:
+
+        doc_builder = DocsBuilder()
+
+        doc_builder.build_docs(
+            srcpath, docpath, settings
+        )
 
 
 def docsconfig() -> dict:
@@ -99,7 +139,10 @@ def docsconfig() -> dict:
         'codeblocks': True,
         'swaplinks': False,
         'extracss': None,
-        'extrajs': None
+        'extrajs': None,
+        'lowmemory': False,
+        'assets': False,
+        'changed': None
     }
 
 
@@ -124,23 +167,152 @@ class DocsBuilder:
         self._docdir = docdir
         self._config = docsconfig() | config
 
+        if self._config['changed'] is not None:
+            self.build_changed(
+                utils.read_changed(self._config['changed'])
+            )
+            return
+
+        if self._config['lowmemory']:
+            self.stream_docs()
+            return
+
         sources = self.get_files()
         self.edit_sources(sources.files)
 
         self.doc_sources(sources.files)
         self.dump_static(sources.contents)
+        self.pack_assets()
 
     def get_files(self):
         return self.source_files.set_sources(self._srcdir)
 
+    def stream_docs(self):
+        """Builds pages one by one, keeps only the global TOC.
+        """
+
+        for files in self.source_files.iter_sources(self._srcdir):
+            self.edit_sources(files)
+            self.doc_sources(files)
+
+        self.dump_static(self.source_files.contents)
+        self.pack_assets()
+
+    def build_changed(self, changed) -> list[str]:
+        """Rebuilds pages affected by changed sources, keeps the other ones.
+
+        - Pages of changed sources and pages linking to them are rebuilt.
+        - Pages of removed sources are deleted.
+        - Static files are rebuilt only with the index page.
+
+        """
+
+        names = self.get_changed_names(changed)
+        sources = self.get_files()
+
+        self.remove_pages(
+            sorted(names - sources.files.keys())
+        )
+
+        files = sources.select_affected(names)
+
+        self.edit_sources(files)
+        self.doc_sources(files)
+
+        if 'index' in files:
+            self.dump_static(sources.contents)
+
+        self.pack_assets()
+
+        return list(files)
+
+    def get_changed_names(self, changed) -> set[str]:
+        """Returns names of changed sources from paths of files.
+        """
+
+        srcdir = os.path.abspath(self._srcdir)
+
+        return {
+            os.path.basename(path).removesuffix('.md') for path in changed
+            if path.endswith('.md') and os.path.dirname(path) == srcdir
+        }
+
+    def update_docs(self, changed, removed=()) -> list[str]:
+        """Rebuilds pages of changed sources, keeps the other ones.
+
+        - Unchanged sources are reused from the previous build.
+        - Static files are rebuilt only when the global TOC changes.
+
+        """
+
+        oldtoc = self.source_files.contents
+
+        self.remove_pages(
+            self.source_files.drop_sources(removed)
+        )
+
+        files = self.source_files.update_sources(changed)
+
+        self.edit_sources(files)
+        self.doc_sources(files)
+
+        if self.source_files.contents != oldtoc:
+            self.dump_static(self.source_files.contents)
+
+        self.pack_assets()
+
+        return list(files)
+
+    def remove_pages(self, names):
+        for name in names:
+            pagepath = os.path.join(self._docdir, name + '.html')
+            if os.path.isfile(pagepath):
+                os.remove(pagepath)
+
     def edit_sources(self, files):
 
         if self._config['swaplinks']:
             self.swaplinks(files)
 
     def doc_sources(self, files):
+
+        editor = self.get_page_editor()
+
         for file in files.values():
-            file.dumpdocpage(self._docdir)
+            file.dumpdocpage(
+                self._docdir, self.get_codeblocks(file), editor
+            )
+
+    def get_page_editor(self):
+        """Links pages to fingerprinted static files of the previous build.
+
+        - Unchanged pages are not written again.
+        - If fingerprints change, `pack_assets()` relinks the pages.
+
+        """
+
+        if not self._config['assets']:
+            return None
+
+        names = assets.findassets(self._docdir)
+
+        return functools.partial(assets.relinkpage, names=names)
+
+    def get_codeblocks(self, file) -> str | None:
+        """Returns the highlighting of a page overriding its metadata.
+
+        - With "static", pages with code highlighting get it at build
+          time, since the JS highlighter is not dumped.
+
+        """
+
+        if self._config['codeblocks'] != 'static':
+            return None
+
+        if not file.meta.get('codeblocks', False):
+            return None
+
+        return 'static'
 
     def dump_static(self, contents):
 
@@ -155,12 +327,26 @@ class DocsBuilder:
         settings.contents = contents
         settings.homepage = 'index.html'
 
-        pagemaker.dumpstatic(
+        dumper = pagemaker.StaticFilesDumper()
+
+        dumper.set_extras(
+            css=self.get_extra_static('css'), js=self.get_extra_static('js')
+        )
+
+        dumper.set_minify(self._config['assets'])
+
+        dumper.dump_static_files(
             self._docdir, settings=settings, highlights=codeblocks
         )
 
-        self.add_extra_css()
-        self.add_extra_js()
+    def pack_assets(self):
+        """Fingerprints static files and relinks pages, if opted.
+        """
+
+        if not self._config['assets']:
+            return
+
+        assets.packassets(self._docdir)
 
     def swaplinks(self, files):
         for file in files.values():
@@ -180,29 +366,16 @@ class DocsBuilder:
             toplink, newlink, contents, flags=re.MULTILINE
         )
 
-    def add_extra_css(self):
-        self.add_extra_static(ext='css')
-
-    def add_extra_js(self):
-        self.add_extra_static(ext='js')
-
-    def add_extra_static(self, ext):
+    def get_extra_static(self, ext) -> str:
+        """Returns custom CSS/JS code to be added, if any.
+        """
 
         codespec = self._config['extra' + ext]
 
         if not codespec:
-            return
-
-        extracode = utils.read_file_or_str(codespec)
+            return ''
 
-        filepath = os.path.join(
-            self._docdir, 'docpage.' + ext
-        )
-
-        content = utils.read_file(filepath)
-        content = content + '\n\n' + extracode
-
-        utils.dump_file(filepath, content)
+        return utils.read_file_or_str(codespec)
 
 
 class SourceFiles:
@@ -239,28 +412,91 @@ class SourceFiles:
     def set_contents(self, globaltoc):
         setattr(self, 'contents', globaltoc)
 
+    def update_sources(self, filepaths) -> dict:
+        """Reloads given source files and returns them (name-to-object).
+        """
+
+        name_to_file = self.make_sources(filepaths)
+
+        self.files.update(name_to_file)
+
+        if 'index' in name_to_file:
+            self.set_contents(name_to_file['index'].toc)
+
+        return name_to_file
+
+    def select_affected(self, names) -> dict:
+        """Returns given sources and sources linking to them (name-to-object).
+        """
+
+        return {
+            name: file for name, file in self.files.items()
+            if name in names or file.getlinks() & names
+        }
+
+    def iter_sources(self, srcdir):
+        """Yields source files one by one (name-to-object).
+
+        - Files are not kept, only the global TOC is set.
+
+        """
+
+        self.check_index_is_available(srcdir)
+        self.set_files({})
+
+        for filepath in self.get_source_paths(srcdir):
+
+            name_to_file = self.make_sources([filepath])
+
+            if 'index' in name_to_file:
+                self.set_contents(name_to_file['index'].toc)
+
+            yield name_to_file
+
+    def drop_sources(self, filepaths) -> list[str]:
+        """Forgets removed source files and returns their names.
+        """
+
+        names = [
+            os.path.basename(path).removesuffix('.md') for path in filepaths
+        ]
+
+        if 'index' in names:
+            raise NoIndexFile(
+                "'index.md' was removed from the source directory"
+            )
+
+        for name in names:
+            self.files.pop(name, None)
+
+        return names
+
     def get_sources(self, srcdir) -> dict:
         """Returns the namespace of source files (name-to-object).
         """
 
-        def makefile(filepath):
-            if filepath.endswith('index.md'):
-                return IndexFile().set_file(filepath)
-            return SourceFile().set_file(filepath)
-
         self.check_index_is_available(srcdir)
 
         pathsgetter = self.get_source_paths
         filepaths = pathsgetter(srcdir)
 
+        return self.make_sources(filepaths)
+
+    def make_sources(self, filepaths) -> dict:
+
         files = list(
-            map(makefile, filepaths)
+            map(self.make_source, filepaths)
         )
 
         return {
             file.name: file for file in files
         }
 
+    def make_source(self, filepath):
+        if filepath.endswith('index.md'):
+            return IndexFile().set_file(filepath)
+        return SourceFile().set_file(filepath)
+
     def get_source_paths(self, srcdir) -> list[str]:
         """Returns paths to the source files.
         """
@@ -399,20 +635,30 @@ class SourceFile:
         return parts[0].strip()
 
     def read_source(self, filepath) -> str:
-        with open(filepath, encoding='utf-8') as file:
-            return file.read()
+        with tracing.span('read', file=filepath) as args:
+            with open(filepath, encoding='utf-8') as file:
+                text = file.read()
+            args['bytes'] = len(text)
+        return text
 
-    def dumpdocpage(self, docdir, codeblocks=None):
+    def dumpdocpage(self, docdir, codeblocks=None, editor=None):
 
         pagename = getattr(self, 'name') + '.html'
         pagepath = os.path.join(docdir, pagename)
 
-        settings = self.specify_settings()
-        pagehtml = self.run_pagemaker(settings, codeblocks)
+        with tracing.span('page', file=pagename) as args:
 
-        utils.dump_file(
-            filepath=pagepath, content=pagehtml
-        )
+            settings = self.specify_settings()
+            pagehtml = self.run_pagemaker(settings, codeblocks)
+
+            if editor is not None:
+                pagehtml = editor(pagehtml)
+
+            utils.dump_file(
+                filepath=pagepath, content=pagehtml
+            )
+
+            args['bytes'] = len(pagehtml)
 
     def specify_settings(self):
 
@@ -435,6 +681,18 @@ class SourceFile:
 
         return pagemaker.makedocpage(sourcemd, settings)
 
+    def getlinks(self) -> set[str]:
+        """Returns names of source files linked from the text.
+        """
+
+        link = re.compile(
+            r'(?:\]\(|<a\s{1,}href=")([\w.-]{1,})\.(?:md|html)[#)"]'
+        )
+
+        return set(
+            link.findall(self.text)
+        )
+
     def swaplinks(self):
         self.edit_md_links()
         self.edit_html_links()
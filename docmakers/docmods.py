@@ -3,9 +3,9 @@
 """
 
 import os
-from ..utils import contentsmd
-from ..inspect import pyoutline, pydocmd
-from .utils import apiobj, dump_file
+from ..utils import contentsmd, tracing
+from ..inspect import pyoutline, pydocmd, pystatic
+from .utils import apiobj, dump_file, opendocs
 
 __all__ = [
     'docmods'
@@ -19,7 +19,11 @@ def docmods(modules, docpath, **settings) -> None:
     Parameters
     ----------
     modules : list
-        List of python modules (live objects).
+        List of python modules (live objects) or paths
+        to their sources (scripts or package folders).
+        Paths are documented statically, without import
+        (in signatures, defaults other than literals and names
+        of module-level literals are shown as written).
     docpath : str
         Path where to place the output files.
     settings : dict
@@ -44,16 +48,44 @@ def docmods(modules, docpath, **settings) -> None:
     clsverbs : int = 0
         Controls the verbosity of classes (0-2)
         regarding the methods headings.
+    maxclasses : int = None
+        Modules with more classes get one page per class (b).
+    maxclasssize : int = None
+        Classes with longer MD entries (in characters)
+        get their own pages (b).
     codeblocks : bool = False
         Code highlighting is activated, if True.
+    lowmemory : bool = False
+        If True, docs of modules are written one by one,
+        only their headings are kept for the index file.
+    output : str | file = None
+        Output folder, archive path (.zip, .tar, .tar.gz)
+        or writable binary file (a). If None, docpath is used.
+    trace : str | Tracer = None
+        Path to a JSON file for Chrome trace events or a tracer
+        to collect spans of build stages (see `utils.tracing`).
+
+    Notes
+    -----
+
+    (a) — Names of archive members are the same as in a folder.
+
+    (b) — Class pages are named MODULE.CLASS, the module page keeps
+          the table of these classes with links. Links made by
+          `DocFormat` lead to class pages, if they exist.
 
     """
 
+    settings = dict(settings)
+    output = settings.pop('output', None)
+    trace = settings.pop('trace', None)
+
     recorder = ModsRecorder()
 
-    recorder.doc_modules(
-        modules, docpath, **settings
-    )
+    with tracing.tracerun(trace), opendocs(docpath, output) as docpath:
+        recorder.doc_modules(
+            modules, docpath, **settings
+        )
 
 
 class ModsRecorder:
@@ -71,14 +103,49 @@ class ModsRecorder:
 
         self._docpath = docpath
 
+        modules = self.load_static_modules(modules)
+
         self.set_config(config)
         self.set_hostname(modules)
 
+        if self._config['lowmemory']:
+            self.stream_files(modules)
+            return
+
         moddocs = self.make_moddocs(modules)
         outline = self.make_outline(moddocs, modules)
 
         self.dump_files(outline, moddocs)
 
+    def stream_files(self, modules):
+        """Dumps docs of modules one by one, then the outline.
+        """
+
+        headings = {}
+        docser = ModsDocser()
+
+        for name, content in docser.iter_sources(modules, self._config):
+            self.dump_moddocs({name: content}, self.dump_file)
+            headings[name] = contentsmd.keepheadings(content)
+
+        outline = self.make_outline(headings, modules)
+        self.dump_outline(outline, self.dump_file)
+
+    def load_static_modules(self, modules) -> list:
+        """Replaces paths with static modules.
+        """
+
+        loader = pystatic.StaticLoader()
+
+        def loadmodule(module):
+            if isinstance(module, str):
+                return loader.loadmodule(module)
+            return module
+
+        return list(
+            map(loadmodule, modules)
+        )
+
     def set_config(self, config) -> dict:
         self._config = self.get_default_config()
         self._config = self.update_config(config)
@@ -91,7 +158,10 @@ class ModsRecorder:
             'moddocs': True,
             'modrefs': True,
             'clsverbs': 0,
-            'codeblocks': False
+            'maxclasses': None,
+            'maxclasssize': None,
+            'codeblocks': False,
+            'lowmemory': False
         }
 
     def update_config(self, config) -> dict:
@@ -165,20 +235,23 @@ class ModsDocser:
         self._config = None
 
     def get_sources(self, modules, config) -> dict:
+        return dict(
+            self.iter_sources(modules, config)
+        )
 
-        self._config = config.copy()
+    def iter_sources(self, modules, config):
+        """Yields names of pages and their docs one by one.
 
-        docs = list(
-            map(self.module_to_md, modules)
-        )
+        - Class pages (if any) follow the page of their module.
 
-        names = [
-            mod.__name__ for mod in modules
-        ]
+        """
+
+        self._config = config.copy()
 
-        return dict(zip(names, docs))
+        for module in modules:
+            yield from self.module_to_md(module).items()
 
-    def module_to_md(self, pymod) -> str:
+    def module_to_md(self, pymod) -> dict:
         meta = self.specify_module_meta()
         docs = self.run_pydocmd(pymod, meta)
         return docs
@@ -188,10 +261,12 @@ class ModsDocser:
         config = {
             'meta': meta,
             'npstyle': self._config['npstyle'],
-            'clsverbs': self._config['clsverbs']
+            'clsverbs': self._config['clsverbs'],
+            'maxclasses': self._config['maxclasses'],
+            'maxclasssize': self._config['maxclasssize']
         }
 
-        return pydocmd.modtomd(pymod, **config)
+        return pydocmd.modtomds(pymod, **config)
 
     def specify_module_meta(self):
         return {
@@ -231,7 +231,18 @@ class Linker(BaseKey):
         return utils.PyName().fromstr(name)
 
     def pyname_to_docname(self, pyname):
-        return pyname.getmodule() + '.md'
+        """Returns the class page, if exists, or the module page.
+        """
+
+        modname = pyname.getmodule()
+        clsname = pyname.getclass()
+
+        if clsname:
+            filename = f'{modname}.{clsname}.md'
+            if self.find_source_file(filename):
+                return filename
+
+        return modname + '.md'
 
     def pyname_to_objname(self, pyname):
         return pyname.render()
@@ -3,15 +3,23 @@
 """
 
 import os
+import json
+import zlib
 import textwrap
+import functools
 from . import utils
 from ..docpage import pagemaker
+from ..docpage import assets as docassets
 from ..inspect import pyscripts
 from ..inspect import pyoutline
-from ..utils import texttrees, treeashtml
+from ..inspect import pyprofile
+from ..inspect import pyimports
+from ..inspect import pyclasses
+from ..inspect import pytrees
+from ..utils import texttrees, treeashtml, dumpfiles, tracing
 
 __all__ = [
-    'docpackage', 'docscript'
+    'docpackage', 'docscript', 'mergedocs'
 ]
 
 
@@ -19,7 +27,7 @@ apiobj = utils.apiobj
 
 
 @apiobj
-def docpackage(pkgpath, docpath, mode, maxdepth=None) -> None:
+def docpackage(pkgpath, docpath, mode, maxdepth=None, **settings) -> None:
     """Creates an overview of a python package (static analysis).
 
     Parameters
@@ -28,35 +36,224 @@ def docpackage(pkgpath, docpath, mode, maxdepth=None) -> None:
         Path to the package directory.
     docpath : str
         Path where to place the output files.
-    mode : str
-        Specifies the output format — "html" or "md".
+    mode : str | list[str]
+        Specifies the output format — "html" or "md",
+        or several formats made in one run (e).
     maxdepth : int = None
         Maximum depth of nested subpackages.
         If None, all subpackages are included.
+    settings : dict
+        Configuration settings (see below).
+
+    Settings
+    --------
+    output : str | file = None
+        Output folder, archive path (.zip, .tar, .tar.gz)
+        or writable binary file (a). If None, docpath is used.
+    shard : tuple[int, int] = None
+        Shard (i, n) — only folders of the i-th of n shards
+        are documented (b).
+    trace : str | Tracer = None
+        Path to a JSON file for Chrome trace events or a tracer
+        to collect spans of build stages (see `utils.tracing`).
+    lowmemory : bool = False
+        If True, scripts are read one at a time and not kept (c).
+    profile : str | Profile = None
+        Path to a cProfile file (.prof) or a loaded profile,
+        call trees are annotated with runtime costs.
+    imports : bool = False
+        If True, the report on imports between modules is added (d).
+    importtime : str = None
+        Path to a log of `python -X importtime`, modules in the
+        imports report are ranked by import times (implies imports).
+    assets : bool = False
+        If True, static files of HTML are minified and fingerprinted,
+        pages and static files get gzip siblings (f).
+    foldtrees : tuple[int, int] = None
+        Max depth and breadth (d, b) of call trees and class trees
+        in HTML reports, larger trees are folded (g).
+    classes : bool = False
+        If True, the report on inheritance across modules is added (h).
+    changed : list[str] | str = None
+        Paths to changed scripts or a file listing them,
+        only the affected pages are rebuilt (i).
+    blocking : list[str] = None
+        Patterns (fnmatch) of calls that block the event loop,
+        matched against names qualified by imports (j).
+    hotloops : bool = False
+        If True, calls in call trees are marked with loop depths
+        and functions with calls in loops are listed (k).
+
+    Notes
+    -----
+
+    (a) — Names of archive members are the same as in a folder.
+
+    (b) — Folders are assigned to shards by their names. Instead of
+          static files, the shard manifest with TOC fragments is dumped,
+          see `mergedocs()`.
+
+    (c) — Memory is bounded by the largest script, not the package,
+          but each script is read more than once.
+
+    (d) — Import cycles, transitive imports and import times are
+          reported on the page PKGNAME-imports (the first shard only).
+
+    (e) — The package is walked and each script is read, parsed
+          and reported once, the formats are rendered from the report.
+          With shards, the manifest holds the TOC fragments of HTML.
+
+    (f) — See `docpage.packassets()`, folders only. With shards,
+          the option is passed to `mergedocs()`.
+
+    (g) — See `inspect.pytrees.foldtrees_html()`, subtrees are expanded
+          on click.
+
+    (h) — Class trees with bases resolved through imports and
+          the most subclassed classes are reported on the page
+          PKGNAME-classes (the first shard only).
+
+    (i) — Reports on changed scripts and outlines of their folders
+          are rebuilt, reports on removed scripts are deleted. Package
+          reports (d, h) are rebuilt, if any script changed. Other pages
+          are kept from the previous run in docpath, the TOC is complete.
+
+    (j) — Replace `inspect.pyrecords.BLOCKING`, e.g. `['db.query*']`.
+
+    (k) — Calls are marked with ↻N (N — loop depth, comprehensions
+          and map/filter calls count as loops).
 
     """
 
     pkgpath = utils.check_srcdir(pkgpath)
+    doc_maker = get_docmaker_by_mode(mode)()
+
+    settings = dict(settings)
+    output = settings.pop('output', None)
+    trace = settings.pop('trace', None)
+
+    config = check_pkgconfig(settings)
+
+    utils.check_assets_output(config['assets'], output)
+    utils.check_changed_output(config['changed'], output)
+
+    with tracing.tracerun(trace), utils.opendocs(docpath, output) as docpath:
+        doc_maker.docpkg(
+            pkgpath=pkgpath, docpath=docpath, maxdepth=maxdepth, **config
+        )
+
+
+def pkgconfig() -> dict:
+    """Returns the default settings of package docs.
+
+    - The keys are the parameters names.
+    - The values are the default settings.
+
+    """
+    return {
+        'shard': None,
+        'lowmemory': False,
+        'profile': None,
+        'imports': False,
+        'importtime': None,
+        'assets': False,
+        'foldtrees': None,
+        'classes': False,
+        'changed': None,
+        'blocking': None,
+        'hotloops': False
+    }
+
+
+def dirconfig() -> dict:
+    """Returns the default settings of folder docs.
+    """
+    return {
+        'lowmemory': False,
+        'profile': None,
+        'foldtrees': None,
+        'changed': None,
+        'blocking': None,
+        'hotloops': False
+    }
+
+
+def check_pkgconfig(settings) -> dict:
+    """Checks names of settings and loads or normalizes values.
+    """
+
+    config = pkgconfig()
+
+    unknown = set(settings) - set(config)
+
+    if unknown:
+        raise TypeError(
+            f"unknown settings: {', '.join(sorted(unknown))}"
+        )
+
+    config |= settings
+
+    config['imports'] = config['imports'] or config['importtime'] is not None
+    config['foldtrees'] = utils.check_foldtrees(config['foldtrees'])
+    config['blocking'] = utils.check_blocking(config['blocking'])
+    config['profile'] = pyprofile.getprofile(config['profile'])
+    config['changed'] = utils.read_changed(config['changed'])
+
+    return config
+
+
+@apiobj
+def mergedocs(manifests, docpath, assets=False) -> None:
+    """Completes HTML docs of a package made in shards.
+
+    Parameters
+    ----------
+    manifests : list[str]
+        Paths to the manifests of all shards.
+    docpath : str
+        Path to the folder with pages of all shards.
+    assets : bool = False
+        If True, static files are minified and fingerprinted,
+        pages and static files get gzip siblings.
+
+    Notes
+    -----
+
+    - Assembles the global TOC and dumps the static files once.
+    - The result is the same as of a single `docpackage()` run.
+
+    """
+
     docpath = utils.check_docdir(docpath)
 
-    doc_maker = get_docmaker_by_mode(mode)()
+    doc_maker = PyPkgHTML()
+    doc_maker.mergepkg(manifests, docpath, assets)
+
+
+def get_docmaker_by_mode(mode):
+
+    modes = check_modes(mode)
 
-    doc_maker.docpkg(
-        pkgpath=pkgpath, docpath=docpath, maxdepth=maxdepth
+    if len(modes) > 1:
+        return functools.partial(PyPkgMulti, modes)
+
+    return globals().get(
+        'PyPkg' + modes[0].upper()
     )
 
 
-def get_docmaker_by_mode(mode):
+def get_dirmaker_by_mode(mode):
 
     mode = check_mode(mode)
 
     return globals().get(
-        'PyPkg' + mode.upper()
+        'PyDir' + mode.upper()
     )
 
 
 @apiobj
-def docscript(filepath, docpath, mode) -> None:
+def docscript(filepath, docpath, mode, profile=None,
+              foldtrees=None, blocking=None, hotloops=False) -> None:
     """Creates a report on a python script (static analysis).
 
     Parameters
@@ -65,11 +262,25 @@ def docscript(filepath, docpath, mode) -> None:
         Path to the python script.
     docpath : str
         Path where to place the output files.
-    mode : str
-        Specifies the output format — <i>"html"</i> or <i>"md"</i>.
+    mode : str | list[str]
+        Specifies the output format — <i>"html"</i> or <i>"md"</i>,
+        or several formats rendered from one report.
+    profile : str | Profile = None
+        Path to a cProfile file (.prof) or a loaded profile,
+        call trees are annotated with runtime costs.
+    foldtrees : tuple[int, int] = None
+        Max depth and breadth (d, b) of call trees and class trees
+        in HTML reports, larger trees are folded.
+    blocking : list[str] = None
+        Patterns (fnmatch) of calls that block the event loop,
+        if None, `inspect.pyrecords.BLOCKING` is used.
+    hotloops : bool = False
+        If True, calls in loops are marked and listed.
 
     """
 
+    modes = check_modes(mode)
+
     filepath = utils.check_srcfile(filepath)
     docpath = utils.check_docdir(docpath)
 
@@ -77,9 +288,28 @@ def docscript(filepath, docpath, mode) -> None:
     content = utils.read_file(filepath)
 
     script = pyscripts.ScriptRecord(name, content)
+    script.profile = get_file_profile(profile, filepath)
+    script.foldtrees = utils.check_foldtrees(foldtrees)
+    script.blocking = utils.check_blocking(blocking)
+    script.hotloops = hotloops
+
+    report = script.makereport()
+
+    for mode in modes:
+        dumper = get_dumper_by_mode(mode)
+        dumper(script, docpath, report)
+
+
+def get_file_profile(profile, filepath):
+    """Returns costs of functions from a script, if profiled.
+    """
+
+    profile = pyprofile.getprofile(profile)
 
-    dumper = get_dumper_by_mode(mode)
-    dumper(script, docpath)
+    if profile is None:
+        return None
+
+    return profile.forfile(filepath)
 
 
 def get_dumper_by_mode(mode):
@@ -91,22 +321,22 @@ def get_dumper_by_mode(mode):
     )
 
 
-def dump_script_md(script, docpath):
+def dump_script_md(script, docpath, report=None):
 
     filepath = os.path.join(
         docpath, script.name + '.md'
     )
 
-    script.dumpreport(filepath)
+    script.dumpreport(filepath, report)
 
 
-def dump_script_html(script, docpath):
+def dump_script_html(script, docpath, report=None):
 
     filepath = os.path.join(
         docpath, script.name + '.html'
     )
 
-    script.dumpdocpage(filepath)
+    script.dumpdocpage(filepath, report)
 
     settings = pagemaker.PageParamsJS()
     settings.pagelogo = pagemaker.getlogo()
@@ -126,7 +356,21 @@ def check_mode(mode):
     return mode
 
 
-def docpydir_html(dirpath, docpath, hostname='') -> str:
+def check_modes(mode) -> list[str]:
+    """Returns the output formats as a list without repeats.
+    """
+
+    modes = [mode] if isinstance(mode, str) else list(mode)
+
+    if not modes:
+        raise DocModeError('at least one mode is required')
+
+    return list(
+        dict.fromkeys(map(check_mode, modes))
+    )
+
+
+def docpydir_html(dirpath, docpath, hostname='', **config) -> str:
     """Documents a folder with python scripts (HTML format).
 
     Parameters
@@ -137,6 +381,24 @@ def docpydir_html(dirpath, docpath, hostname='') -> str:
         Path to the documentation.
     hostname : str
         Prefix for all docpage names.
+    config : dict
+        Configuration settings (see below).
+
+    Settings
+    --------
+    lowmemory : bool = False
+        If True, scripts are read on demand and not kept.
+    profile : Profile = None
+        Runtime costs to annotate call trees with.
+    foldtrees : tuple[int, int] = None
+        Max depth and breadth of trees in HTML reports.
+    changed : set[str] = None
+        Absolute paths to changed scripts, only their reports
+        and the outline are made, if any of them is in the folder.
+    blocking : list[str] = None
+        Patterns of blocking calls, if None, the default ones.
+    hotloops : bool = False
+        If True, calls in loops are marked and listed.
 
     Returns
     -------
@@ -145,10 +407,12 @@ def docpydir_html(dirpath, docpath, hostname='') -> str:
 
     """
     doc_maker = PyDirHTML()
-    return doc_maker.docdir(dirpath, docpath, hostname)
+    return doc_maker.docdir(
+        dirpath, docpath, hostname, config
+    )
 
 
-def docpydir_md(dirpath, docpath, hostname=''):
+def docpydir_md(dirpath, docpath, hostname='', **config):
     """Documents a folder with python scripts (MD format).
 
     Parameters
@@ -159,14 +423,111 @@ def docpydir_md(dirpath, docpath, hostname=''):
         Path to the documentation.
     hostname : str
         Prefix for all report names.
+    config : dict
+        Configuration settings (see below).
+
+    Settings
+    --------
+    lowmemory : bool = False
+        If True, scripts are read on demand and not kept.
+    profile : Profile = None
+        Runtime costs to annotate call trees with.
+    foldtrees : tuple[int, int] = None
+        Max depth and breadth of trees in HTML reports.
+    changed : set[str] = None
+        Absolute paths to changed scripts, only their reports
+        and the outline are made, if any of them is in the folder.
+    blocking : list[str] = None
+        Patterns of blocking calls, if None, the default ones.
+    hotloops : bool = False
+        If True, calls in loops are marked and listed.
 
     """
     doc_maker = PyDirMD()
-    return doc_maker.docdir(dirpath, docpath, hostname)
+    return doc_maker.docdir(
+        dirpath, docpath, hostname, config
+    )
+
+
+def docpydir_multi(dirpath, docpath, modes, hostname='',
+                   **config) -> str:
+    """Documents a folder with python scripts in several formats.
+
+    Parameters
+    ----------
+    dirpath : str
+        Path to the folder.
+    docpath : str
+        Path to the documentation.
+    modes : list[str]
+        Output formats — "html" and "md".
+    hostname : str
+        Prefix for all docpage names.
+    config : dict
+        Configuration settings (see below).
+
+    Settings
+    --------
+    lowmemory : bool = False
+        If True, scripts are read on demand and not kept.
+    profile : Profile = None
+        Runtime costs to annotate call trees with.
+    foldtrees : tuple[int, int] = None
+        Max depth and breadth of trees in HTML reports.
+    changed : set[str] = None
+        Absolute paths to changed scripts, only their reports
+        and the outline are made, if any of them is in the folder.
+    blocking : list[str] = None
+        Patterns of blocking calls, if None, the default ones.
+    hotloops : bool = False
+        If True, calls in loops are marked and listed.
+
+    Returns
+    -------
+    str
+        Local TOC as an MD list.
+
+    """
+    doc_maker = PyDirMulti(modes)
+    return doc_maker.docdir(
+        dirpath, docpath, hostname, config
+    )
+
+
+class PkgFolder:
+    """A documented folder of a package.
+
+    Attributes
+    ----------
+    dirpath : str
+        Path to the folder.
+    level : int
+        Depth of the folder in the package.
+    hostname : str
+        Names of the parent folders joined by dots.
+    index : int
+        Position of the folder in the walk over the package.
+
+    """
+
+    def __init__(self, dirpath, level, hostname, index):
+        self.dirpath = dirpath
+        self.level = level
+        self.hostname = hostname
+        self.index = index
+
+    def getname(self) -> str:
+        return '.'.join(
+            filter(len, [self.hostname, os.path.basename(self.dirpath)])
+        )
 
 
 class PyPkgDocs:
     """Docs generator for python packages (base class).
+
+    - Folders are walked in the sorted order (deterministic).
+    - A shard (i, n) documents only the folders assigned to it.
+
     """
 
     def __init__(self):
@@ -176,16 +537,62 @@ class PyPkgDocs:
         self._docpath = None
 
         self._maxdepth = None
-        self._hostname = None
-        self._level = None
-        self._toc = None
+        self._shard = None
+        self._config = pkgconfig()
 
-    def set_locals(self, pkgpath, docpath, maxdepth):
+    def set_locals(self, pkgpath, docpath, maxdepth, config=None):
 
         self._pkgpath = pkgpath
         self._pkgname = os.path.basename(pkgpath)
         self._docpath = docpath
         self._maxdepth = maxdepth
+        self._config = pkgconfig() | (config or {})
+        self._shard = check_shard(self._config['shard'])
+
+    def get_dirconfig(self) -> dict:
+        """Returns the settings passed to folders.
+        """
+        return {
+            key: self._config[key] for key in dirconfig()
+        }
+
+    def walk_folders(self, pkgpath) -> list[PkgFolder]:
+        """Returns the documented folders in the walk order.
+        """
+
+        folders = []
+
+        def walk(dirpath, level, hostname):
+
+            folders.append(
+                PkgFolder(dirpath, level, '.'.join(hostname), len(folders))
+            )
+
+            if level == self._maxdepth:
+                return
+
+            hostname = hostname + [os.path.basename(dirpath)]
+
+            for subpath in self.get_nested_folders(dirpath):
+                walk(subpath, level+1, hostname)
+
+        walk(pkgpath, 0, [])
+
+        return folders
+
+    def select_folders(self, folders) -> list[PkgFolder]:
+        """Returns the folders of the current shard.
+        """
+
+        if self._shard is None:
+            return folders
+
+        index, count = self._shard
+
+        return [
+            folder for folder in folders
+            if get_shard_index(folder.getname(), count) == index
+        ]
 
     def get_nested_folders(self, dirpath) -> list[str]:
         """Returns paths to subpackages in a given directory.
@@ -198,7 +605,7 @@ class PyPkgDocs:
                 return False
             return True
 
-        foldernames = list(
+        foldernames = sorted(
             filter(is_eligigble_folder, os.listdir(dirpath))
         )
 
@@ -222,82 +629,195 @@ class PyPkgDocs:
 
         return False
 
+    def get_pkgreports(self) -> list[str]:
+        """Returns names of package reports made by the current run.
+        """
+
+        if self._shard is not None and self._shard[0] != 0:
+            return []
+
+        flags = {
+            'imports': self._config['imports'],
+            'classes': self._config['classes']
+        }
+
+        return [
+            name for name, flag in flags.items() if flag
+        ]
+
+    def is_pkg_changed(self) -> bool:
+        """Checks if package reports are to be rebuilt.
+        """
+
+        changed = self._config['changed']
+
+        if changed is None:
+            return True
+
+        pkgpath = os.path.abspath(self._pkgpath) + os.sep
+
+        return any(
+            path.startswith(pkgpath) and path.endswith('.py')
+            for path in changed
+        )
+
+    def get_pkgreport_filename(self, name, fileext=None) -> str:
+        fileext = fileext or self.FILEEXT
+        return f'{self._pkgname}-{name}.{fileext}'
+
+    def make_pkgreport(self, name) -> str:
+
+        makers = {
+            'imports': self.make_imports_report,
+            'classes': self.make_classes_report
+        }
+
+        with tracing.span(name, file=self._pkgname):
+            return makers[name]()
+
+    def make_imports_report(self) -> str:
+        return pyimports.analyzeimports(
+            self._pkgpath, self._config['importtime']
+        )
+
+    def make_classes_report(self) -> str:
+        return pyclasses.reportclasses(self._pkgpath)
+
+    def dump_pkgreport_md(self, name, report):
+
+        filepath = os.path.join(
+            self._docpath, self.get_pkgreport_filename(name, 'md')
+        )
+
+        utils.dump_file(filepath, report)
+
+    def get_manifest_name(self) -> str:
+        index, count = self._shard
+        return f'.docspyer-shard-{index}-of-{count}.json'
+
+    def dump_manifest(self, fragments, total):
+        """Dumps the shard manifest with TOC fragments.
+        """
+
+        index, count = self._shard
+
+        manifest = {
+            'package': self._pkgname,
+            'shard': [index, count],
+            'total': total,
+            'fragments': fragments
+        }
+
+        filepath = os.path.join(
+            self._docpath, self.get_manifest_name()
+        )
+
+        utils.dump_file(
+            filepath, json.dumps(manifest, indent=1)
+        )
+
 
 class PyPkgHTML(PyPkgDocs):
     """Documents a python package (HTML format).
     """
 
-    def docpkg(self, pkgpath, docpath, maxdepth=2):
+    FILEEXT = 'html'
+
+    def docpkg(self, pkgpath, docpath, maxdepth=2, **config):
 
         preprocessor = self.set_locals
-        preprocessor(pkgpath, docpath, maxdepth)
+        preprocessor(pkgpath, docpath, maxdepth, config)
 
-        tocastext = self.makehtml(pkgpath)
-        self.dumpstatic(tocastext)
+        folders = self.walk_folders(pkgpath)
+        fragments = self.makehtml(self.select_folders(folders))
 
-    def makehtml(self, pkgpath):
+        for index, name in enumerate(self.get_pkgreports()):
 
-        self._level = 0
+            if self.is_pkg_changed():
+                self.dump_pkgreport(name, self.make_pkgreport(name))
 
-        self._toc = []
-        self._hostname = []
+            fragments.append(
+                self.make_pkgreport_toc(name, index=len(folders)+index)
+            )
 
-        self.walk_to_make_doc(pkgpath)
+        if self._shard is None:
+            self.dumpstatic(join_fragments(fragments))
+        else:
+            self.dump_manifest(fragments, total=len(folders))
 
-        toc = '\n'.join(self._toc)
+    def mergepkg(self, manifests, docpath, assets=False):
+        """Assembles the global TOC from shard manifests.
+        """
 
-        list.clear(self._hostname)
-        list.clear(self._toc)
+        merger = ManifestsMerger()
+        pkgname, fragments = merger.merge(manifests)
 
-        self._level = None
-        return toc
+        self._pkgname = pkgname
+        self._docpath = docpath
+        self._config = pkgconfig() | {'assets': assets}
 
-    def walk_to_make_doc(self, dirpath):
+        self.dumpstatic(join_fragments(fragments))
 
-        dirtoc = self.run_docpydir_html(
-            dirpath, hostname='.'.join(self._hostname)
+    def makehtml(self, folders) -> list[dict]:
+        """Documents the folders and returns their TOC fragments.
+        """
+        return list(
+            map(self.make_folder_doc, folders)
         )
 
-        self.add_folder_to_toc(dirtoc)
-
-        if self._level == self._maxdepth:
-            return
+    def make_folder_doc(self, folder) -> dict:
 
-        list.append(
-            self._hostname, os.path.basename(dirpath)
+        dirtoc = self.run_docpydir_html(
+            folder.dirpath, hostname=folder.hostname
         )
 
-        subpkgs = self.get_nested_folders(dirpath)
+        return {
+            'index': folder.index,
+            'level': folder.level,
+            'toc': dirtoc
+        }
 
-        self._level += 1
+    def dump_pkgreport(self, name, report):
 
-        for pkgpath in subpkgs:
-            self.walk_to_make_doc(pkgpath)
+        filename = self.get_pkgreport_filename(name)
 
-        self._level -= 1
+        settings = pagemaker.PageParamsHTML()
 
-        list.pop(
-            self._hostname
+        settings.webtitle = f'{self._pkgname}-{name}'
+        settings.doctitle = name
+
+        docpage = pagemaker.makedocpage(
+            sourcemd=report, settings=settings
         )
 
-    def run_docpydir_html(self, dirpath, hostname):
+        if self._config['foldtrees']:
+            docpage = pytrees.foldtrees_html(
+                docpage, *self._config['foldtrees']
+            )
 
-        dirtoc = docpydir_html(
-            dirpath, self._docpath, hostname=hostname
+        utils.dump_file(
+            os.path.join(self._docpath, filename), docpage
         )
 
-        return dirtoc
+    def make_pkgreport_toc(self, name, index) -> dict:
 
-    def add_folder_to_toc(self, dirtoc):
+        filename = self.get_pkgreport_filename(name)
 
-        tocentry = textwrap.indent(
-            dirtoc, prefix=chr(32)*self._level
-        )
+        return {
+            'index': index,
+            'level': 0,
+            'toc': f'- <a href="{filename}">{name}</a>'
+        }
 
-        list.append(
-            self._toc, tocentry
+    def run_docpydir_html(self, dirpath, hostname):
+
+        dirtoc = docpydir_html(
+            dirpath, self._docpath, hostname=hostname,
+            **self.get_dirconfig()
         )
 
+        return dirtoc
+
     def set_logo(self):
         return pagemaker.getlogo()
 
@@ -306,9 +826,10 @@ class PyPkgHTML(PyPkgDocs):
         """
 
         pkgpage = self._pkgname + '.html'
+        pkgpath = os.path.join(self._docpath, pkgpage)
 
         # No homepage.
-        if pkgpage not in os.listdir(self._docpath):
+        if not dumpfiles.isdumped(pkgpath):
             return ''
 
         return self.make_index_page()
@@ -326,9 +847,13 @@ class PyPkgHTML(PyPkgDocs):
         settings.contents = self.set_contents(tocastext)
 
         pagemaker.dumpstatic(
-            self._docpath, settings, highlights=False
+            self._docpath, settings, highlights=False,
+            minify=self._config['assets']
         )
 
+        if self._config['assets']:
+            docassets.packassets(self._docpath)
+
     def make_index_page(self) -> str:
         """Makes the index page and returns its filename.
         """
@@ -342,8 +867,7 @@ class PyPkgHTML(PyPkgDocs):
             self._docpath, 'index.html'
         )
 
-        with open(indexpath, encoding='utf-8', mode='w') as file:
-            file.write(page)
+        utils.dump_file(indexpath, page)
 
         return 'index.html'
 
@@ -352,50 +876,143 @@ class PyPkgMD(PyPkgDocs):
     """Documents a python package (MD format).
     """
 
-    def docpkg(self, pkgpath, docpath, maxdepth=2):
+    FILEEXT = 'md'
+
+    def docpkg(self, pkgpath, docpath, maxdepth=2, **config):
 
         preprocessor = self.set_locals
-        preprocessor(pkgpath, docpath, maxdepth)
+        preprocessor(pkgpath, docpath, maxdepth, config)
 
-        self._level = 0
-        self._hostname = []
+        folders = self.walk_folders(pkgpath)
 
-        self.walk_to_make_doc(self._pkgpath)
+        for folder in self.select_folders(folders):
+            self.run_docpydir_md(folder.dirpath, folder.hostname)
 
-        list.clear(self._hostname)
-        self._level = None
+        if self.is_pkg_changed():
+            for name in self.get_pkgreports():
+                self.dump_pkgreport_md(name, self.make_pkgreport(name))
 
-    def walk_to_make_doc(self, dirpath):
+        if self._shard is not None:
+            self.dump_manifest([], total=len(folders))
 
-        self.run_docpydir_md(
-            dirpath, hostname='.'.join(self._hostname)
+    def run_docpydir_md(self, dirpath, hostname):
+        docpydir_md(
+            dirpath, self._docpath, hostname=hostname,
+            **self.get_dirconfig()
         )
 
-        if self._level == self._maxdepth:
-            return
 
-        list.append(
-            self._hostname, os.path.basename(dirpath)
+class PyPkgMulti(PyPkgHTML):
+    """Documents a python package in HTML and MD at once.
+
+    - Folders are walked and scripts are parsed once for all formats.
+    - Package reports are made once and dumped in both formats.
+
+    """
+
+    def __init__(self, modes):
+        super().__init__()
+        self._modes = modes
+
+    def run_docpydir_html(self, dirpath, hostname):
+
+        dirtoc = docpydir_multi(
+            dirpath, self._docpath, self._modes, hostname=hostname,
+            **self.get_dirconfig()
         )
 
-        subpkgs = self.get_nested_folders(dirpath)
+        return dirtoc
 
-        self._level += 1
+    def dump_pkgreport(self, name, report):
+        self.dump_pkgreport_md(name, report)
+        super().dump_pkgreport(name, report)
 
-        for pkgpath in subpkgs:
-            self.walk_to_make_doc(pkgpath)
 
-        self._level -= 1
+class ManifestsMerger:
+    """Collects TOC fragments from manifests of all shards.
+    """
+
+    def merge(self, manifests) -> tuple[str, list]:
 
-        list.pop(
-            self._hostname
+        manifests = list(
+            map(self.read_manifest, manifests)
         )
 
-    def run_docpydir_md(self, dirpath, hostname):
-        docpydir_md(
-            dirpath, self._docpath, hostname=hostname
+        self.check_shards(manifests)
+
+        fragments = [
+            fragment for manifest in manifests
+            for fragment in manifest['fragments']
+        ]
+
+        fragments.sort(
+            key=lambda fragment: fragment['index']
+        )
+
+        return manifests[0]['package'], fragments
+
+    def read_manifest(self, filepath) -> dict:
+        return json.loads(
+            utils.read_file(filepath)
+        )
+
+    def check_shards(self, manifests):
+
+        if not manifests:
+            raise ShardsError('no manifests to merge')
+
+        index, count = zip(
+            *[manifest['shard'] for manifest in manifests]
+        )
+
+        if len(set(count)) != 1:
+            raise ShardsError('manifests from different shardings')
+
+        if sorted(index) != list(range(count[0])):
+            raise ShardsError(
+                f'expected shards 0..{count[0]-1}, got {sorted(index)}'
+            )
+
+        packages = {
+            manifest['package'] for manifest in manifests
+        }
+
+        if len(packages) != 1:
+            raise ShardsError('manifests from different packages')
+
+
+def join_fragments(fragments) -> str:
+    """Joins TOC fragments indented by levels of folders.
+    """
+
+    entries = [
+        textwrap.indent(fragment['toc'], prefix=chr(32)*fragment['level'])
+        for fragment in fragments
+    ]
+
+    return '\n'.join(entries)
+
+
+def check_shard(shard):
+
+    if shard is None:
+        return None
+
+    index, count = shard
+
+    if not 0 <= index < count:
+        raise ShardsError(
+            f'shard index must be in 0..{count-1}, not {index}'
         )
 
+    return index, count
+
+
+def get_shard_index(name, count) -> int:
+    """Assigns a folder to a shard by its name (stable across machines).
+    """
+    return zlib.crc32(name.encode('utf-8')) % count
+
 
 class PyDirDocs:
     """Docs generator for dirs with python scripts (base class).
@@ -410,12 +1027,16 @@ class PyDirDocs:
         self._dirname = None
         self._hostname = None
         self._toc = None
+        self._config = dirconfig()
+        self._changed = None
 
-    def set_locals(self, dirpath, docpath, hostname):
+    def set_locals(self, dirpath, docpath, hostname, config=None):
 
+        self._config = dirconfig() | (config or {})
         self._dirpath = dirpath
         self._docpath = docpath
         self._dirname = os.path.basename(dirpath)
+        self._changed = self.select_changed(self._config['changed'])
 
         self._hostname = '.'.join(
             filter(len, [hostname, self._dirname])
@@ -423,31 +1044,123 @@ class PyDirDocs:
 
         self._toc = []
 
-    def docdir(self, dirpath, docpath, hostname) -> str | None:
+    def docdir(self, dirpath, docpath, hostname, config=None) -> str | None:
 
         preprocessor = self.set_locals
-        preprocessor(dirpath, docpath, hostname)
+        preprocessor(dirpath, docpath, hostname, config)
 
         scripts = self.getscripts()
 
-        self.makeoutline(scripts)
+        if self.is_dir_changed():
+            self.makeoutline(scripts)
+            self.removescripts()
+        else:
+            self.skipoutline()
+
         self.docscripts(scripts)
 
+        return self.gettoc()
+
+    def select_changed(self, changed) -> set[str] | None:
+        """Returns names of changed public scripts of the folder.
+        """
+
+        if changed is None:
+            return None
+
+        dirpath = os.path.abspath(self._dirpath)
+
+        filenames = [
+            os.path.basename(path) for path in changed
+            if os.path.dirname(path) == dirpath
+        ]
+
+        return {
+            name.removesuffix('.py') for name in filenames
+            if name.endswith('.py') and not name.startswith('_')
+        }
+
+    def is_dir_changed(self) -> bool:
+        return self._changed is None or bool(self._changed)
+
+    def is_script_changed(self, script) -> bool:
+        return self._changed is None or script.name in self._changed
+
+    def removescripts(self):
+        """Removes reports on removed scripts.
+        """
+
+        for name in sorted(self._changed or ()):
+            if not os.path.isfile(os.path.join(self._dirpath, name + '.py')):
+                self.removescript(name)
+
+    def removescript(self, name):
+
+        filepath = os.path.join(
+            self._docpath, '.'.join([self._hostname, name, self.FILEEXT])
+        )
+
+        if os.path.isfile(filepath):
+            os.remove(filepath)
+
+    def gettoc(self) -> str | None:
         if self._toc is None:
             return None
         return '\n'.join(self._toc)
 
-    def makeoutline(self, _):
+    def makeoutline(self, scripts):
+        self.dumpoutline(
+            pyoutline.makeoutline(scripts)
+        )
+
+    def dumpoutline(self, _):
         pass
 
     def getscripts(self):
-        return pyscripts.getscripts(self._dirpath)
+
+        # Sources of unchanged folders are not read.
+        lazy = self._config['lowmemory'] or not self.is_dir_changed()
+
+        return pyscripts.getscripts(self._dirpath, lazy=lazy)
 
     def docscripts(self, scripts):
         for script in scripts.getscripts():
+            if not self.is_script_changed(script):
+                self.skipscript(script)
+                continue
+            self.set_script_profile(script)
+            script.foldtrees = self._config['foldtrees']
+            script.blocking = self._config['blocking']
+            script.hotloops = self._config['hotloops']
             self.docscript(script)
 
-    def docscript(self, _):
+    def skipoutline(self):
+        """Keeps the outline made by the previous run.
+        """
+
+    def skipscript(self, script):
+        """Keeps the report made by the previous run.
+        """
+
+    def set_script_profile(self, script):
+
+        profile = self._config['profile']
+
+        if profile is None:
+            return
+
+        filepath = os.path.join(
+            self._dirpath, script.name + '.py'
+        )
+
+        script.profile = profile.forfile(filepath)
+
+    def docscript(self, script):
+        self.dumpscript(
+            script, script.makereport()
+        )
+
+    def dumpscript(self, script, report):
         pass
 
     def get_outline_filename(self):
@@ -471,15 +1184,13 @@ class PyDirHTML(PyDirDocs):
 
     FILEEXT = 'html'
 
-    def makeoutline(self, scripts):
+    def dumpoutline(self, outline):
 
-        docpage = self.make_outline_html(scripts)
+        docpage = self.make_outline_html(outline)
         self.save_outline_html(docpage)
         self.add_outline_to_toc()
 
-    def make_outline_html(self, scripts) -> str:
-
-        outline = pyoutline.makeoutline(scripts)
+    def make_outline_html(self, outline) -> str:
 
         settings = pagemaker.PageParamsHTML()
 
@@ -500,14 +1211,19 @@ class PyDirHTML(PyDirDocs):
             self._docpath, filename
         )
 
-        with open(filepath, encoding='utf-8', mode='w') as file:
-            file.write(docpage)
+        utils.dump_file(filepath, docpage)
 
-    def docscript(self, script):
-        self.dump_script_html(script)
+    def dumpscript(self, script, report):
+        self.dump_script_html(script, report)
+        self.add_script_to_toc(script)
+
+    def skipoutline(self):
+        self.add_outline_to_toc()
+
+    def skipscript(self, script):
         self.add_script_to_toc(script)
 
-    def dump_script_html(self, script):
+    def dump_script_html(self, script, report):
 
         filename = self.get_script_filename(script)
 
@@ -515,7 +1231,7 @@ class PyDirHTML(PyDirDocs):
             self._docpath, filename
         )
 
-        script.dumpdocpage(filepath)
+        script.dumpdocpage(filepath, report)
 
     def add_outline_to_toc(self):
 
@@ -562,15 +1278,13 @@ class PyDirMD(PyDirDocs):
 
     FILEEXT = 'md'
 
-    def makeoutline(self, scripts):
-        self.dump_outline_md(scripts)
+    def dumpoutline(self, outline):
+        self.dump_outline_md(outline)
 
-    def docscript(self, script):
-        self.dump_script_md(script)
+    def dumpscript(self, script, report):
+        self.dump_script_md(script, report)
 
-    def dump_outline_md(self, scripts):
-
-        outline = pyoutline.makeoutline(scripts)
+    def dump_outline_md(self, outline):
 
         filename = self.get_outline_filename()
 
@@ -578,10 +1292,9 @@ class PyDirMD(PyDirDocs):
             self._docpath, filename
         )
 
-        with open(filepath, encoding='utf-8', mode='w') as file:
-            file.write(outline)
+        utils.dump_file(filepath, outline)
 
-    def dump_script_md(self, script):
+    def dump_script_md(self, script, report):
 
         filename = self.get_script_filename(script)
 
@@ -589,9 +1302,65 @@ class PyDirMD(PyDirDocs):
             self._docpath, filename
         )
 
-        script.dumpreport(filepath)
+        script.dumpreport(filepath, report)
+
+
+class PyDirMulti(PyDirDocs):
+    """Documents a folder with python scripts in several formats.
+
+    - The outline and reports are made once and passed to each format.
+
+    """
+
+    def __init__(self, modes):
+        super().__init__()
+        self._makers = [
+            get_dirmaker_by_mode(mode)() for mode in modes
+        ]
+
+    def set_locals(self, dirpath, docpath, hostname, config=None):
+
+        super().set_locals(dirpath, docpath, hostname, config)
+
+        for maker in self._makers:
+            maker.set_locals(dirpath, docpath, hostname, config)
+
+    def gettoc(self) -> str:
+
+        tocs = [
+            maker.gettoc() for maker in self._makers
+        ]
+
+        return '\n'.join(
+            filter(None, tocs)
+        )
+
+    def dumpoutline(self, outline):
+        for maker in self._makers:
+            maker.dumpoutline(outline)
+
+    def dumpscript(self, script, report):
+        for maker in self._makers:
+            maker.dumpscript(script, report)
+
+    def skipoutline(self):
+        for maker in self._makers:
+            maker.skipoutline()
+
+    def skipscript(self, script):
+        for maker in self._makers:
+            maker.skipscript(script)
+
+    def removescript(self, name):
+        for maker in self._makers:
+            maker.removescript(name)
 
 
 class DocModeError(Exception):
     """Raised when a wrong report format is passed.
     """
+
+
+class ShardsError(Exception):
+    """Raised when shards are specified or merged inconsistently.
+    """
@@ -3,6 +3,8 @@
 """
 
 import os
+import contextlib
+from ..utils import dumpfiles
 
 __all__ = [
     'cleardocs'
@@ -62,6 +64,98 @@ def check_docdir(docpath) -> str:
     return docpath
 
 
+def check_assets_output(assets, output):
+    """Checks that fingerprinted assets are made in a folder.
+    """
+
+    if assets and output is not None and dumpfiles.isarchive(output):
+        raise ValueError(
+            'assets are fingerprinted in folders only, not in archives'
+        )
+
+
+def check_changed_output(changed, output):
+    """Checks that changed files are rebuilt over the previous output.
+    """
+
+    if changed is None or output is None:
+        return
+
+    if dumpfiles.isarchive(output):
+        raise ValueError(
+            'changed files are rebuilt in folders only, not in archives'
+        )
+
+
+def read_changed(changed) -> set[str] | None:
+    """Returns absolute paths of changed files.
+
+    - Paths are given as a list or a file listing them (one per line).
+    - Relative paths are taken from the current directory.
+
+    """
+
+    if changed is None:
+        return None
+
+    if isinstance(changed, str):
+        changed = read_file(changed).splitlines()
+
+    return {
+        os.path.abspath(path.strip()) for path in changed if path.strip()
+    }
+
+
+def check_foldtrees(foldtrees) -> tuple[int, int] | None:
+    """Checks the max depth and breadth of folded trees.
+    """
+
+    if foldtrees is None:
+        return None
+
+    maxdepth, maxbreadth = map(int, foldtrees)
+
+    if maxdepth < 1 or maxbreadth < 1:
+        raise ValueError(
+            f'max depth and breadth of trees must be positive: {foldtrees}'
+        )
+
+    return maxdepth, maxbreadth
+
+
+def check_blocking(blocking) -> list[str] | None:
+    """Checks patterns of blocking calls.
+    """
+
+    if blocking is None:
+        return None
+
+    if isinstance(blocking, str):
+        blocking = [blocking]
+
+    return list(blocking)
+
+
+@contextlib.contextmanager
+def opendocs(docpath, output=None):
+    """Selects the output and yields the folder for paths of files.
+
+    - Output is a folder, an archive path or a writable file.
+    - Archive members are named by paths relative to the archive.
+    - If output is None, files are written to docpath.
+
+    """
+
+    output = docpath if output is None else output
+
+    if not dumpfiles.isarchive(output):
+        yield check_docdir(output)
+        return
+
+    with dumpfiles.writeto(output):
+        yield ''
+
+
 @apiobj
 def cleardocs(dirpath) -> None:
     """Removes HTML, CSS, JS files from a specified folder.
@@ -144,8 +238,7 @@ def read_file_or_str(arg) -> str:
 
 
 def dump_file(filepath, content):
-    with open(filepath, encoding='utf-8', mode='w') as file:
-        file.write(content)
+    dumpfiles.dumpfile(filepath, content)
 
 
 class DirNotFound(Exception):
@@ -0,0 +1,489 @@
+# -*- coding: utf-8 -*-
+"""Rebuilds documentation when source files change.
+
+Watchers:
+
+    PollingWatcher
+     └─ InotifyWatcher (Linux, via ctypes)
+
+- Both watchers compare snapshots of the watched files.
+- The inotify watcher only wakes up earlier than the polling one.
+
+"""
+
+import os
+import sys
+import time
+import select
+import ctypes
+
+from . import utils
+from . import pyreporters
+from .docbuilder import DocsBuilder, NoIndexFile, TocNotFound, BrokenFileMeta
+from ..inspect import pyreport
+
+__all__ = [
+    'watchdocs', 'watchpackage'
+]
+
+apiobj = utils.apiobj
+
+REBUILD_ERRORS = (
+    NoIndexFile, TocNotFound, BrokenFileMeta, SyntaxError, OSError
+)
+
+
+@apiobj
+def watchdocs(srcpath, docpath, interval=0.5, **settings) -> None:
+    """Builds HTML documentation and rebuilds it on changes in MD sources.
+
+    Parameters
+    ----------
+    srcpath : str
+        Path to the source directory.
+    docpath : str
+        Path where to place the output files.
+    interval : float = 0.5
+        Time between checks for changes (in seconds).
+    settings : dict
+        Configuration settings of `builddocs()`.
+
+    """
+
+    srcpath = utils.check_srcdir(srcpath)
+    docpath = utils.check_docdir(docpath)
+
+    rebuilder = DocsRebuilder(srcpath, docpath, settings)
+    watcher = make_watcher(srcpath, suffix='.md', recursive=False)
+
+    WatchLoop(watcher, rebuilder).run(interval)
+
+
+@apiobj
+def watchpackage(pkgpath, docpath, mode, maxdepth=None, interval=0.5) -> None:
+    """Creates an overview of a package and rebuilds it on changes.
+
+    Parameters
+    ----------
+    pkgpath : str
+        Path to the package directory.
+    docpath : str
+        Path where to place the output files.
+    mode : str
+        Specifies the output format — "html" or "md".
+    maxdepth : int = None
+        Maximum depth of nested subpackages.
+        If None, all subpackages are included.
+    interval : float = 0.5
+        Time between checks for changes (in seconds).
+
+    """
+
+    pkgpath = utils.check_srcdir(pkgpath)
+    docpath = utils.check_docdir(docpath)
+
+    rebuilder = PackageRebuilder(pkgpath, docpath, mode, maxdepth)
+    watcher = make_watcher(pkgpath, suffix='.py', recursive=True)
+
+    pyreport.REPORTS.enable()
+
+    try:
+        WatchLoop(watcher, rebuilder).run(interval)
+    finally:
+        pyreport.REPORTS.disable()
+
+
+def make_watcher(rootdir, suffix, recursive):
+    """Returns the inotify watcher, if available, the polling one otherwise.
+    """
+
+    if InotifyWatcher.is_available():
+        try:
+            return InotifyWatcher(rootdir, suffix, recursive)
+        except OSError:
+            pass
+
+    return PollingWatcher(rootdir, suffix, recursive)
+
+
+class WatchLoop:
+    """Runs rebuilds on changes detected by a watcher.
+    """
+
+    def __init__(self, watcher, rebuilder):
+        self.watcher = watcher
+        self.rebuilder = rebuilder
+        self.cycles = 0
+
+    def run(self, interval, maxcycles=None):
+
+        self.rebuilder.build()
+
+        try:
+            while maxcycles is None or self.cycles < maxcycles:
+                self.run_cycle(interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.watcher.close()
+
+    def run_cycle(self, interval):
+
+        self.cycles += 1
+
+        changes = self.watcher.wait(interval)
+
+        if not changes:
+            return
+
+        try:
+            self.rebuilder.update(changes)
+        except REBUILD_ERRORS as exc:
+            self.report_error(exc)
+
+    def report_error(self, exc):
+        print(
+            f'docspyer: rebuild failed: {type(exc).__name__}: {exc}',
+            file=sys.stderr
+        )
+
+
+class FileChanges:
+    """Changes between two snapshots of watched files.
+
+    Attributes
+    ----------
+    modified : set
+        Paths to the modified files.
+    added : set
+        Paths to the new files.
+    removed : set
+        Paths to the removed files.
+
+    """
+
+    def __init__(self, oldstate, newstate):
+
+        oldpaths = set(oldstate)
+        newpaths = set(newstate)
+
+        self.added = newpaths - oldpaths
+        self.removed = oldpaths - newpaths
+
+        self.modified = {
+            path for path in oldpaths & newpaths
+            if oldstate[path] != newstate[path]
+        }
+
+    def __bool__(self):
+        return bool(self.modified or self.added or self.removed)
+
+    def changed(self) -> set:
+        return self.modified | self.added
+
+    def moved(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+class PollingWatcher:
+    """Detects changes of files by polling their stats.
+
+    Parameters
+    ----------
+    rootdir : str
+        Path to the watched directory.
+    suffix : str
+        Suffix of the watched files.
+    recursive : bool
+        Nested directories are watched, if True.
+
+    """
+
+    def __init__(self, rootdir, suffix, recursive):
+
+        self.rootdir = rootdir
+        self.suffix = suffix
+        self.recursive = recursive
+
+        self.state = self.snapshot()
+
+    def wait(self, timeout) -> FileChanges:
+        """Waits for the given time and returns the detected changes.
+        """
+        self.wait_for_events(timeout)
+        return self.poll()
+
+    def wait_for_events(self, timeout):
+        time.sleep(timeout)
+
+    def poll(self) -> FileChanges:
+
+        newstate = self.snapshot()
+        changes = FileChanges(self.state, newstate)
+
+        self.state = newstate
+        return changes
+
+    def snapshot(self) -> dict:
+        """Returns stats of the watched files (path-to-stats).
+        """
+
+        state = {}
+
+        for dirpath in self.list_dirs():
+            state |= self.snapshot_dir(dirpath)
+
+        return state
+
+    def snapshot_dir(self, dirpath) -> dict:
+
+        state = {}
+
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                if self.is_watched(entry):
+                    stat = entry.stat()
+                    state[entry.path] = (stat.st_mtime_ns, stat.st_size)
+
+        return state
+
+    def is_watched(self, entry):
+        if not entry.name.endswith(self.suffix):
+            return False
+        return entry.is_file()
+
+    def list_dirs(self) -> list[str]:
+
+        if not self.recursive:
+            return [self.rootdir]
+
+        dirpaths = []
+
+        for dirpath, dirnames, _ in os.walk(self.rootdir):
+            dirnames[:] = filter(self.is_watched_dir, dirnames)
+            dirpaths.append(dirpath)
+
+        return dirpaths
+
+    def is_watched_dir(self, name):
+        if name.startswith('.'):
+            return False
+        return name != '__pycache__'
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher(PollingWatcher):
+    """Wakes up on inotify events instead of sleeping.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    MASK = (
+        IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM |
+        IN_MOVED_TO | IN_CREATE | IN_DELETE
+    )
+
+    def __init__(self, rootdir, suffix, recursive):
+
+        self.libc = ctypes.CDLL(None, use_errno=True)
+
+        self.fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        self.check_result(self.fd)
+
+        self.dirpaths = set()
+
+        super().__init__(rootdir, suffix, recursive)
+
+    @staticmethod
+    def is_available() -> bool:
+
+        if not sys.platform.startswith('linux'):
+            return False
+
+        try:
+            libc = ctypes.CDLL(None)
+        except OSError:
+            return False
+
+        return hasattr(libc, 'inotify_init1')
+
+    def check_result(self, res):
+        if res < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+    def snapshot(self) -> dict:
+        self.add_watches()
+        return super().snapshot()
+
+    def add_watches(self):
+        """Watches directories that are not watched yet.
+        """
+
+        dirpaths = set(self.list_dirs())
+
+        for dirpath in dirpaths - self.dirpaths:
+            self.check_result(
+                self.libc.inotify_add_watch(
+                    self.fd, os.fsencode(dirpath), self.MASK
+                )
+            )
+
+        self.dirpaths = dirpaths
+
+    def wait_for_events(self, timeout):
+
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+
+        if ready:
+            self.drain_events()
+
+    def drain_events(self):
+        while True:
+            try:
+                os.read(self.fd, 65536)
+            except BlockingIOError:
+                return
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class DocsRebuilder:
+    """Keeps the documentation builder and its parsed sources alive.
+    """
+
+    def __init__(self, srcpath, docpath, settings):
+
+        self.srcpath = srcpath
+        self.docpath = docpath
+        self.settings = settings
+
+        self.builder = DocsBuilder()
+
+    def build(self):
+        self.builder.build_docs(
+            self.srcpath, self.docpath, self.settings
+        )
+
+    def update(self, changes) -> list[str]:
+        return self.builder.update_docs(
+            changes.changed(), changes.removed
+        )
+
+
+class PackageRebuilder:
+    """Rebuilds only folders with modified scripts.
+
+    - New or removed scripts change the TOC, so all is rebuilt.
+    - Modified scripts are rebuilt along with the folder outline.
+
+    """
+
+    def __init__(self, pkgpath, docpath, mode, maxdepth):
+
+        self.pkgpath = pkgpath
+        self.docpath = docpath
+        self.mode = mode
+        self.maxdepth = maxdepth
+
+        self.docmaker = pyreporters.get_docmaker_by_mode(mode)()
+        self.dirpaths = []
+
+    def build(self):
+
+        self.docmaker.docpkg(
+            pkgpath=self.pkgpath, docpath=self.docpath, maxdepth=self.maxdepth
+        )
+
+        self.dirpaths = self.list_pkg_dirs()
+
+    def update(self, changes) -> list[str]:
+
+        if self.has_moved_scripts(changes):
+            self.build()
+            return list(self.dirpaths)
+
+        dirpaths = self.get_affected_dirs(changes.modified)
+
+        for dirpath in dirpaths:
+            self.rebuild_dir(dirpath)
+
+        return dirpaths
+
+    def has_moved_scripts(self, changes) -> bool:
+
+        paths = changes.added | changes.removed
+
+        return any(
+            map(self.is_public_script, paths)
+        )
+
+    def get_affected_dirs(self, paths) -> list[str]:
+
+        dirpaths = {
+            os.path.dirname(path) for path in paths
+            if self.is_public_script(path)
+        }
+
+        return [
+            path for path in self.dirpaths if path in dirpaths
+        ]
+
+    def rebuild_dir(self, dirpath):
+
+        docmaker = getattr(
+            pyreporters, 'docpydir_' + self.mode
+        )
+
+        docmaker(
+            dirpath, self.docpath, hostname=self.get_hostname(dirpath)
+        )
+
+    def get_hostname(self, dirpath) -> str:
+        """Returns names of the parent packages joined by dots.
+        """
+
+        relpath = os.path.relpath(
+            dirpath, os.path.dirname(self.pkgpath)
+        )
+
+        *parents, _ = relpath.split(os.sep)
+        return '.'.join(parents)
+
+    def is_public_script(self, path) -> bool:
+
+        relpath = os.path.relpath(
+            path, os.path.dirname(self.pkgpath)
+        )
+
+        *dirnames, filename = relpath.split(os.sep)
+
+        if filename.startswith('_'):
+            return False
+
+        return not any(
+            name.startswith(('_', '.')) for name in dirnames
+        )
+
+    def list_pkg_dirs(self) -> list[str]:
+        """Returns paths to the documented folders (as in the docmaker).
+        """
+
+        folders = self.docmaker.walk_folders(self.pkgpath)
+
+        return [
+            folder.dirpath for folder in folders
+        ]
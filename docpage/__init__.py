@@ -2,6 +2,43 @@
 """Maker of HTML documentation pages.
 """
 
-from .textmd import makedochtml
-from .pagemaker import *
-from .templates import *
+import importlib as _importlib
+
+# Public names mapped to their modules (loaded lazily).
+_APIMAP = {
+    'makedochtml': '.textmd',
+    'makedocpage': '.pagemaker',
+    'dumpstatic': '.pagemaker',
+    'packassets': '.assets',
+    'PageParamsJS': '.templates',
+    'PageParamsHTML': '.templates'
+}
+
+_SUBMODULES = (
+    'anchors', 'assets', 'getsvg', 'highlight', 'npdocs',
+    'pagemaker', 'templates', 'textmd', 'widgets'
+)
+
+__all__ = list(_APIMAP)
+
+
+def __getattr__(name):
+
+    if name in _APIMAP:
+        module = _importlib.import_module(_APIMAP[name], __name__)
+        value = getattr(module, name)
+    elif name in _SUBMODULES:
+        value = _importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'"
+        )
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(
+        {*globals(), *_APIMAP, *_SUBMODULES}
+    )
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""Tests minified, fingerprinted and compressed static files.
+"""
+
+import os
+import gzip
+import tempfile
+import unittest
+
+import docspyer
+from docspyer.docpage import assets, pagemaker
+
+JSCODE = '''/**
+ * Settings.
+ */
+const page = {
+    logo: null,   // Logo.
+    url: "http://host"  /* Link. */
+}
+
+page.logo = `<svg>
+    <rect />
+</svg>`;
+'''
+
+
+def list_files(dirpath) -> set:
+    return set(os.listdir(dirpath))
+
+
+class TestMinify(unittest.TestCase):
+
+    def test_css(self):
+
+        source = '/* Box. */\na > b,\nc {\n    color: red;\n    margin: 0;\n}\n'
+
+        assert assets.minifycss(source) == 'a>b,c{color:red;margin:0}'
+
+    def test_js(self):
+
+        code = assets.minifyjs(JSCODE)
+
+        assert code.startswith('const page = {\nlogo: null,\n')
+        assert 'url: "http://host"\n}' in code
+        assert '`<svg>\n    <rect />\n</svg>`' in code
+
+
+class TestPackAssets(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.docpath = self.tempdir.name
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def make_page(self, name):
+
+        settings = pagemaker.PageParamsHTML()
+        settings.highlights = True
+
+        page = pagemaker.makedocpage('# Title', settings)
+
+        with open(os.path.join(self.docpath, name), mode='w',
+                  encoding='utf-8') as file:
+            file.write(page)
+
+    def read_page(self, name) -> str:
+        with open(os.path.join(self.docpath, name), encoding='utf-8') as file:
+            return file.read()
+
+    def test_fingerprints(self):
+
+        self.make_page('page.html')
+
+        pagemaker.dumpstatic(self.docpath, highlights=True, minify=True)
+        names = assets.packassets(self.docpath)
+
+        files = list_files(self.docpath)
+        page = self.read_page('page.html')
+
+        assert 'docpage.js' not in files
+        assert len(names) == 4
+
+        for newname in names.values():
+            assert newname in files
+            assert newname + '.gz' in files
+            assert f'"{newname}"' in page
+
+        with gzip.open(os.path.join(self.docpath, 'page.html.gz')) as file:
+            assert file.read().decode('utf-8') == page
+
+    def test_repeated_pass(self):
+
+        self.make_page('alfa.html')
+
+        pagemaker.dumpstatic(self.docpath)
+        oldnames = assets.packassets(self.docpath)
+
+        # A new page and changed static files.
+        self.make_page('bravo.html')
+
+        pagemaker.dumpstatic(self.docpath, minify=True)
+        newnames = assets.packassets(self.docpath)
+
+        files = list_files(self.docpath)
+        oldcss = oldnames['docpage.css']
+
+        assert newnames['docpage.css'] != oldcss
+        assert oldcss not in files and oldcss + '.gz' not in files
+
+        for name in ['alfa.html', 'bravo.html']:
+            assert newnames['docpage.css'] in self.read_page(name)
+
+        # Pages are linked, even if static files are not dumped.
+        self.make_page('charlie.html')
+
+        assert assets.packassets(self.docpath) == newnames
+        assert newnames['docpage.js'] in self.read_page('charlie.html')
+
+    def test_noop_build(self):
+
+        srcpath = os.path.join(
+            os.path.dirname(docspyer.__file__), 'docmakers', '_tests'
+        )
+
+        docspyer.builddocs(srcpath, self.docpath, assets=True)
+
+        pages = {
+            name: os.stat(os.path.join(self.docpath, name)).st_mtime_ns
+            for name in list_files(self.docpath)
+            if name.endswith(('.html', '.html.gz'))
+        }
+
+        docspyer.builddocs(srcpath, self.docpath, assets=True)
+
+        for name, mtime in pages.items():
+            filepath = os.path.join(self.docpath, name)
+            assert os.stat(filepath).st_mtime_ns == mtime, name
+
+    def test_archive(self):
+        with self.assertRaises(ValueError):
+            docspyer.builddocs(
+                self.docpath, self.docpath, assets=True,
+                output=os.path.join(self.docpath, 'docs.zip')
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Tests build-time highlighting of code blocks.
+"""
+
+import re
+import html
+import unittest
+
+from docspyer.docpage import highlight, pagemaker
+
+CODE = '''
+@cache
+def myfunc(arg: int = 1) -> str:
+    """Docs with <tags>."""
+    return str(arg) if arg else None  # Comment & more.
+'''
+
+SOURCEMD = """
+# Title
+
+```python
+x = 1
+```
+
+```c
+int x = 1 < 2;
+```
+"""
+
+
+def strip_tags(text):
+    return html.unescape(
+        re.sub('<[^>]+>', '', text)
+    )
+
+
+class TestPyHighlighter(unittest.TestCase):
+
+    def test_classes(self):
+
+        res = highlight.highlight_code(CODE, 'python')
+
+        assert '<span class="hljs-keyword">def</span>' in res
+        assert '<span class="hljs-title">myfunc</span>' in res
+        assert '<span class="hljs-built_in">int</span>' in res
+        assert '<span class="hljs-number">1</span>' in res
+        assert '<span class="hljs-literal">None</span>' in res
+        assert '<span class="hljs-meta">@</span>' in res
+        assert 'class="hljs-comment"># Comment &amp; more.' in res
+        assert 'class="hljs-string">&quot;&quot;&quot;Docs with &lt;' in res
+
+    def test_text_is_kept(self):
+        for code in [CODE, 'if (', 'f"{x!r}" \\\n  + y']:
+            res = highlight.PyHighlighter().highlight(code)
+            assert strip_tags(res) == code
+
+    def test_cache(self):
+        highlight.HIGHLIGHTS.clear()
+        res = highlight.highlight_code(CODE, 'python')
+        assert highlight.HIGHLIGHTS.getcode(CODE, 'python') == res
+
+
+class TestStaticHighlights(unittest.TestCase):
+
+    def test_docpage(self):
+
+        settings = pagemaker.PageParamsHTML()
+        settings.highlights = 'static'
+
+        page = pagemaker.makedocpage(SOURCEMD.strip(), settings)
+
+        assert '<code class="language-python hljs">' in page
+        assert '<span class="hljs-number">1</span>' in page
+        assert 'int x = 1 &lt; 2;' in page
+        assert 'default.min.css' in page
+        assert 'highlight.min.js' not in page
+        assert 'hljs.highlightAll' not in page
+
+
+if __name__ == '__main__':
+    unittest.main()
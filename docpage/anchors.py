@@ -289,3 +289,35 @@ class HighlightFunc(Highlight):
 
     TEXT = '/*highlights-func*/'
     REPL = 'hljs.highlightAll();'
+
+
+class AssetLink(Anchor):
+    """Links to static files in rendered docpages.
+
+    - The anchor is the link to a static file under its plain name.
+    - The replacement is the link under a fingerprinted name.
+
+    """
+
+    FORMAT = ''
+
+    def __init__(self, name):
+        self.TEXT = self.FORMAT.format(name)
+
+    def get_replacement(self, data=None, indent=None):
+
+        if data is None:
+            return self.TEXT
+
+        return self.FORMAT.format(data)
+
+    def put_replacement(self, temp, repl, lineno):
+        return self.replace_anchor_in_line(temp, repl, lineno)
+
+
+class StyleLink(AssetLink):
+    FORMAT = '<link rel="stylesheet" href="{}">'
+
+
+class ScriptLink(AssetLink):
+    FORMAT = '<script src="{}"></script>'
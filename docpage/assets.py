@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""Asset pipeline for HTML documentation (opt-in).
+
+- Templates of 'docpage.css' and 'docpage.js' are minified when dumped.
+- Static files get content hashes in their names (fingerprints).
+- Links to static files in docpages are rewritten through anchors.
+- Docpages and static files get gzip siblings (.gz).
+
+Fingerprinted files never change, so they can be served with
+immutable cache headers.
+
+"""
+
+import os
+import re
+import gzip
+import hashlib
+
+from . import anchors
+from . import templates
+from ..utils import dumpfiles, tracing
+
+__all__ = [
+    'packassets', 'minifycss', 'minifyjs'
+]
+
+# Static files mapped to the anchors of their links.
+ASSETS = {
+    templates.DocPageCSS.sourcename: anchors.StyleLink,
+    templates.DocPageJS.sourcename: anchors.ScriptLink,
+    templates.HighlightsCSS.sourcename: anchors.StyleLink,
+    templates.HighlightsJS.sourcename: anchors.ScriptLink
+}
+
+HASHSIZE = 10
+
+JSTOKENS = re.compile(
+    r'(?P<comment>//[^\n]*|/\*.*?\*/)|(?P<string>'
+    r'\'(?:\\.|[^\'\\\n])*\'|"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`'
+    r')',
+    flags=re.DOTALL
+)
+
+
+def apiobj(obj):
+    obj.__module__ = 'docspyer.docpage'
+    return obj
+
+
+@apiobj
+def packassets(dirpath, compress=True) -> dict:
+    """Fingerprints static files of the docs in a folder.
+
+    Parameters
+    ----------
+    dirpath : str
+        Folder with docpages and static files.
+    compress : bool = True
+        If True, gzip siblings of pages and static files are dumped.
+
+    Returns
+    -------
+    dict
+        Plain names of static files mapped to fingerprinted ones.
+
+    Notes
+    -----
+
+    - Plain files and older fingerprints are removed.
+    - Pages linked to older fingerprints are relinked.
+
+    """
+
+    packer = AssetsPacker(compress)
+
+    with tracing.span('assets', file=dirpath):
+        return packer.pack(dirpath)
+
+
+def findassets(dirpath) -> dict:
+    """Returns plain names of static files mapped to fingerprinted ones
+    found in a folder (from the previous pass).
+    """
+    return AssetsPacker().find_fingerprints(dirpath)
+
+
+def relinkpage(page, names) -> str:
+    """Links a docpage to fingerprinted static files before it is written.
+
+    - Pages of a rebuild are then the same as the packed ones on disk.
+
+    """
+    return AssetsPacker().relink_page(page, names)
+
+
+@apiobj
+def minifycss(source) -> str:
+    """Removes comments and redundant spaces from CSS code.
+    """
+
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.DOTALL)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{};,>])\s*', r'\1', source)
+    source = re.sub(r':\s+', ':', source)
+
+    return source.replace(';}', '}').strip()
+
+
+@apiobj
+def minifyjs(source) -> str:
+    """Removes comments, indents and blank lines from JS code.
+
+    - Strings and template literals are kept as they are.
+    - Line breaks are kept, so semicolons are not inserted.
+    - Regex literals are not recognized (none in templates).
+
+    """
+
+    parts = []
+    literals = []
+    pos = 0
+
+    for matchobj in JSTOKENS.finditer(source):
+
+        parts.append(source[pos:matchobj.start()])
+        pos = matchobj.end()
+
+        token = matchobj.group()
+
+        if matchobj.group('string'):
+            parts.append(f'\0{len(literals)}\0')
+            literals.append(token)
+        elif token.startswith('/*'):
+            parts.append('\n' if '\n' in token else ' ')
+
+    parts.append(source[pos:])
+
+    code = re.sub(r'[ \t]+', ' ', ''.join(parts))
+    code = re.sub(r' ?\n[ \n]*', '\n', code).strip()
+
+    # Literals are put back as they are.
+    return re.sub(
+        r'\0(\d+)\0', lambda matchobj: literals[int(matchobj[1])], code
+    )
+
+
+class AssetsPacker:
+    """Fingerprints static files and rewrites links in docpages.
+    """
+
+    def __init__(self, compress=True):
+        self.compress = compress
+
+    def pack(self, dirpath) -> dict:
+
+        names = {}
+
+        for name in ASSETS:
+
+            if os.path.isfile(os.path.join(dirpath, name)):
+                names[name] = self.fingerprint(dirpath, name)
+                continue
+
+            # Kept from the previous pass, pages may be new.
+            oldname = self.find_fingerprint(dirpath, name)
+
+            if oldname is not None:
+                names[name] = oldname
+
+        for filename in sorted(os.listdir(dirpath)):
+            if filename.endswith('.html'):
+                self.rewrite_page(dirpath, filename, names)
+
+        return names
+
+    def fingerprint(self, dirpath, name) -> str:
+        """Renames a static file by its content hash.
+        """
+
+        filepath = os.path.join(dirpath, name)
+
+        with open(filepath, mode='rb') as file:
+            data = file.read()
+
+        newname = self.make_name(name, data)
+
+        self.remove_old_names(dirpath, name, newname)
+        self.dump(os.path.join(dirpath, newname), data)
+
+        os.remove(filepath)
+
+        return newname
+
+    def find_fingerprints(self, dirpath) -> dict:
+
+        names = {}
+
+        for name in ASSETS:
+
+            oldname = self.find_fingerprint(dirpath, name)
+
+            if oldname is not None:
+                names[name] = oldname
+
+        return names
+
+    def make_name(self, name, data) -> str:
+
+        digest = hashlib.sha256(data).hexdigest()[:HASHSIZE]
+        stem, ext = os.path.splitext(name)
+
+        return f'{stem}.{digest}{ext}'
+
+    def find_fingerprint(self, dirpath, name) -> str | None:
+
+        pattern = self.make_pattern(name)
+
+        for filename in sorted(os.listdir(dirpath)):
+            if pattern.fullmatch(filename):
+                return filename
+
+        return None
+
+    def remove_old_names(self, dirpath, name, newname):
+
+        pattern = self.make_pattern(name, gzipped=True)
+
+        for filename in os.listdir(dirpath):
+            if filename.startswith(newname):
+                continue
+            if pattern.fullmatch(filename):
+                os.remove(os.path.join(dirpath, filename))
+
+    def make_pattern(self, name, gzipped=False):
+        """Returns the pattern of fingerprinted names of a file.
+        """
+
+        stem, ext = os.path.splitext(name)
+        suffix = r'(\.gz)?' if gzipped else ''
+
+        return re.compile(
+            re.escape(stem) + rf'\.[0-9a-f]{{{HASHSIZE}}}' +
+            re.escape(ext) + suffix
+        )
+
+    def rewrite_page(self, dirpath, filename, names):
+
+        filepath = os.path.join(dirpath, filename)
+
+        with open(filepath, encoding='utf-8') as file:
+            page = file.read()
+
+        page = self.relink_page(page, names)
+
+        self.dump(filepath, page.encode('utf-8'))
+
+    def relink_page(self, page, names) -> str:
+
+        for name, newname in names.items():
+            page = self.relink(page, name, newname)
+
+        return page
+
+    def relink(self, page, name, newname) -> str:
+        """Links a page to the file under the plain or older name.
+        """
+
+        pattern = self.make_pattern(name)
+        oldnames = {name, *pattern.findall(page)} - {newname}
+
+        for oldname in oldnames:
+
+            anchor = ASSETS[name](oldname)
+
+            if anchor.find_anchor_line(page) is not None:
+                page = anchor.replace_anchor(page, newname)
+
+        return page
+
+    def dump(self, filepath, data):
+
+        dumpfiles.dumpbytes(filepath, data)
+
+        if self.compress:
+            dumpfiles.dumpbytes(
+                filepath + '.gz', gzip.compress(data, mtime=0)
+            )
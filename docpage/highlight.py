@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""Build-time highlighting of code blocks (no JS on pages).
+
+- Python code is split into tokens by the `tokenize` module.
+- Tokens are wrapped in spans with highlight.js CSS classes.
+- Code in other languages is only escaped.
+- Identical snippets are highlighted once (content-hash cache).
+
+"""
+
+import re
+import io
+import html
+import hashlib
+import keyword
+import builtins
+import tokenize
+import threading
+
+__all__ = [
+    'highlight_html', 'highlight_code'
+]
+
+CODEBLOCK = re.compile(
+    r'<code class="language-(\w+)">(.*?)</code>', flags=re.DOTALL
+)
+
+
+def highlight_html(text) -> str:
+    """Highlights code blocks in the HTML text of a docpage.
+
+    Parameters
+    ----------
+    text : str
+        HTML text with code blocks made by `MDCode.make_html()`.
+
+    Returns
+    -------
+    str
+        HTML text with pre-classed spans inside code blocks.
+
+    """
+
+    def highlight_block(matchobj):
+        lang, body = matchobj.groups()
+        code = highlight_code(html.unescape(body), lang)
+        return f'<code class="language-{lang} hljs">{code}</code>'
+
+    return CODEBLOCK.sub(highlight_block, text)
+
+
+def highlight_code(code, lang) -> str:
+    """Returns code as escaped HTML with highlighted tokens.
+    """
+
+    res = HIGHLIGHTS.getcode(code, lang)
+
+    if res is not None:
+        return res
+
+    highlighter = HIGHLIGHTERS.get(lang, PlainHighlighter)
+    res = highlighter().highlight(code)
+
+    HIGHLIGHTS.addcode(code, lang, res)
+
+    return res
+
+
+class HighlightsCache:
+    """Highlighted snippets keyed by hashes of their content.
+
+    - The oldest snippets are dropped when the cache is full.
+    - Safe to use from several threads.
+
+    """
+
+    MAXSIZE = 4096
+
+    def __init__(self):
+        self.snippets = {}
+        self.lock = threading.Lock()
+
+    def getcode(self, code, lang) -> str | None:
+        return self.snippets.get(self.makekey(code, lang))
+
+    def addcode(self, code, lang, res):
+
+        key = self.makekey(code, lang)
+
+        with self.lock:
+
+            if len(self.snippets) >= self.MAXSIZE:
+                del self.snippets[next(iter(self.snippets))]
+
+            self.snippets[key] = res
+
+    def makekey(self, code, lang) -> str:
+        return hashlib.sha1(
+            (lang + '\0' + code).encode('utf-8')
+        ).hexdigest()
+
+    def clear(self):
+        with self.lock:
+            self.snippets.clear()
+
+
+HIGHLIGHTS = HighlightsCache()
+
+
+class PlainHighlighter:
+    """Escapes code without highlighting.
+    """
+
+    def highlight(self, code) -> str:
+        return html.escape(code)
+
+
+class PyHighlighter(PlainHighlighter):
+    """Highlights python code with highlight.js CSS classes.
+
+    - Gaps between tokens are copied from the source as they are.
+    - Code that cannot be tokenized is only escaped.
+
+    """
+
+    LITERALS = {
+        'True', 'False', 'None'
+    }
+
+    BUILTINS = set(
+        dir(builtins)
+    )
+
+    def __init__(self):
+        self.parts = None
+        self.prevname = None
+
+    def highlight(self, code) -> str:
+
+        try:
+            tokens = list(self.get_tokens(code))
+        except (tokenize.TokenError, SyntaxError):
+            return super().highlight(code)
+
+        return self.render_tokens(code, tokens)
+
+    def get_tokens(self, code):
+        return tokenize.generate_tokens(
+            io.StringIO(code).readline
+        )
+
+    def render_tokens(self, code, tokens) -> str:
+
+        offsets = self.get_line_offsets(code)
+
+        self.parts = []
+        self.prevname = None
+
+        position = 0
+
+        for token in tokens:
+
+            start = offsets[token.start[0]] + token.start[1]
+            end = offsets[token.end[0]] + token.end[1]
+
+            if start < position:
+                continue
+
+            self.add_text(code[position:start])
+            self.add_token(token, code[start:end])
+
+            position = end
+
+        self.add_text(code[position:])
+
+        return ''.join(self.parts)
+
+    def get_line_offsets(self, code) -> list[int]:
+        """Returns offsets of lines, lines are numbered from 1.
+        """
+
+        offsets = [0, 0]
+
+        for line in code.splitlines(keepends=True):
+            offsets.append(offsets[-1] + len(line))
+
+        return offsets
+
+    def add_text(self, text):
+        if text:
+            self.parts.append(html.escape(text))
+
+    def add_token(self, token, text):
+
+        cssclass = self.get_css_class(token)
+
+        if token.type == tokenize.NAME:
+            self.prevname = token.string
+        elif token.type not in (tokenize.NL, tokenize.COMMENT):
+            self.prevname = None
+
+        if cssclass is None:
+            return self.add_text(text)
+
+        return self.parts.append(
+            f'<span class="{cssclass}">{html.escape(text)}</span>'
+        )
+
+    def get_css_class(self, token) -> str | None:
+
+        if token.type == tokenize.COMMENT:
+            return 'hljs-comment'
+
+        if token.type == tokenize.NUMBER:
+            return 'hljs-number'
+
+        if self.is_string(token):
+            return 'hljs-string'
+
+        if token.type == tokenize.NAME:
+            return self.get_name_class(token.string)
+
+        if token.type == tokenize.OP and token.string == '@':
+            return 'hljs-meta'
+
+        return None
+
+    def is_string(self, token) -> bool:
+
+        if token.type == tokenize.STRING:
+            return True
+
+        # Parts of f-strings (Python 3.12+).
+        return tokenize.tok_name[token.type].startswith('FSTRING_')
+
+    def get_name_class(self, name) -> str | None:
+
+        if self.prevname in ('def', 'class'):
+            return 'hljs-title'
+
+        if name in self.LITERALS:
+            return 'hljs-literal'
+
+        if keyword.iskeyword(name):
+            return 'hljs-keyword'
+
+        if name in self.BUILTINS:
+            return 'hljs-built_in'
+
+        return None
+
+
+HIGHLIGHTERS = {
+    'python': PyHighlighter
+}
@@ -3,7 +3,11 @@
 """
 
 import os
+import functools
 from . import templates
+from ..utils import dumpfiles, tracing
+from . import highlight
+from . import assets
 from .textmd import makehtml
 
 __all__ = [
@@ -46,7 +50,7 @@ def makedocpage(sourcemd, settings=None):
 
 
 @apiobj
-def dumpstatic(dirpath, settings=None, highlights=False):
+def dumpstatic(dirpath, settings=None, highlights=False, minify=False):
     """Dumps static JS/CSS files to the specified folder.
 
     Parameters
@@ -55,19 +59,24 @@ def dumpstatic(dirpath, settings=None, highlights=False):
         Path where to dump the files.
     settings : PageParamsJS
         Static docpage parameters (a).
-    highlights : bool
-        Code highlighting is activated, if True (b).
+    highlights : bool | str
+        Code highlighting is activated, if True or "static" (b).
+    minify : bool = False
+        If True, 'docpage.css' and 'docpage.js' are minified.
 
     Notes
     -----
 
     (a) — Replaced by `PageParamsJS()`, if None.
 
-    (b) — Additional static files are copied.
+    (b) — Additional static files are copied,
+          only the CSS file, if "static".
 
     """
 
     dumper = StaticFilesDumper()
+    dumper.set_minify(minify)
+
     settings = settings or PageParamsJS()
 
     dumper.dump_static_files(
@@ -103,7 +112,7 @@ class DocPageMaker:
             settings = PageParamsHTML()
 
         settings.localtoc = dochtml.toc
-        settings.pagetext = dochtml.text
+        settings.pagetext = self.highlight_code(dochtml.text, settings)
 
         docpage = self.render_docpage(settings)
         return docpage
@@ -114,8 +123,17 @@ class DocPageMaker:
     def run_textmd_makehtml(self, sourcemd):
         return makehtml.makedochtml(sourcemd)
 
+    def highlight_code(self, pagetext, settings):
+
+        if settings.highlights != 'static':
+            return pagetext
+
+        with tracing.span('highlight'):
+            return highlight.highlight_html(pagetext)
+
     def render_docpage(self, settings):
-        return self.pagetemplate.getpage(settings)
+        with tracing.span('render'):
+            return self.pagetemplate.getpage(settings)
 
 
 class StaticFilesDumper:
@@ -123,8 +141,41 @@ class StaticFilesDumper:
     """
 
     def __init__(self):
+        self.extras = {}
+        self.minify = False
         self.set_templates()
 
+    def set_extras(self, css='', js=''):
+        """Sets custom code appended to 'docpage.css' and 'docpage.js'.
+        """
+        self.extras = {
+            'css': css, 'js': js
+        }
+
+    def set_minify(self, minify=True):
+        """Minifies the templates of 'docpage.css' and 'docpage.js'.
+        """
+        self.minify = minify
+
+    def minify_if_opted(self, source, ext):
+
+        if not self.minify:
+            return source
+
+        if ext == 'js':
+            return assets.minifyjs(source)
+
+        return assets.minifycss(source)
+
+    def add_extras(self, source, ext):
+
+        extracode = self.extras.get(ext)
+
+        if not extracode:
+            return source
+
+        return source + '\n\n' + extracode
+
     def set_templates(self):
         self.docpage_js = templates.DocPageJS()
         self.docpage_css = templates.DocPageCSS()
@@ -132,9 +183,9 @@ class StaticFilesDumper:
         self.highlights_css = templates.HighlightsCSS()
 
     def dump_static_files(self, dirpath, settings, highlights):
-
-        self.dump_docpage_files(dirpath, settings)
-        self.dump_highlights_if_opted(dirpath, highlights)
+        with tracing.span('static'):
+            self.dump_docpage_files(dirpath, settings)
+            self.dump_highlights_if_opted(dirpath, highlights)
 
     def dump_docpage_files(self, dirpath, settings):
         self.dump_docpage_js(dirpath, settings)
@@ -142,18 +193,26 @@ class StaticFilesDumper:
 
     def dump_docpage_js(self, dirpath, settings):
 
+        source = self.minify_if_opted(
+            self.docpage_js.getpage(settings), 'js'
+        )
+
         docpage_js = FileToDump(
             name=self.docpage_js.sourcename,
-            source=self.docpage_js.getpage(settings)
+            source=self.add_extras(source, 'js')
         )
 
         docpage_js.dump(dirpath)
 
     def dump_docpage_css(self, dirpath):
 
+        source = self.minify_if_opted(
+            self.docpage_css.getsource(), 'css'
+        )
+
         docpage_css = FileToDump(
             name=self.docpage_css.sourcename,
-            source=self.docpage_css.getsource()
+            source=self.add_extras(source, 'css')
         )
 
         docpage_css.dump(dirpath)
@@ -163,19 +222,24 @@ class StaticFilesDumper:
         if highlights is False:
             return
 
-        file_js = FileToDump(
-            name=self.highlights_js.sourcename,
-            source=self.highlights_js.getsource()
-        )
-
         file_css = FileToDump(
             name=self.highlights_css.sourcename,
             source=self.highlights_css.getsource()
         )
 
-        file_js.dump(dirpath)
         file_css.dump(dirpath)
 
+        # Build-time highlighting, no JS.
+        if highlights == 'static':
+            return
+
+        file_js = FileToDump(
+            name=self.highlights_js.sourcename,
+            source=self.highlights_js.getsource()
+        )
+
+        file_js.dump(dirpath)
+
 
 class FileToDump:
 
@@ -193,27 +257,29 @@ class FileToDump:
 
         path = os.path.join(dirpath, self.name)
 
-        with open(path, encoding='utf-8',  mode='w') as file:
-            file.write(self.source)
+        dumpfiles.dumpfile(path, self.source)
 
     def check_is_not_template(self, dirpath, name):
 
-        if name not in os.listdir(self.TEMPLATESPATH):
+        # Archive members have no folder.
+        if not dirpath:
             return
 
-        if name not in os.listdir(dirpath):
+        if not is_templates_dir(dirpath):
             return
 
-        filepath = os.path.join(dirpath, name)
-        templatepath = os.path.join(self.TEMPLATESPATH, name)
-
-        is_template = os.path.samefile(
-            filepath, templatepath
-        )
-
-        if not is_template:
+        if name not in templates.listtemplates():
             return
 
         raise ValueError(
             f"check the path, writing to the template '{name}' attempted"
         )
+
+
+@functools.cache
+def is_templates_dir(dirpath) -> bool:
+    """Checks once per folder, if it is the folder with templates.
+    """
+    return os.path.samefile(
+        dirpath, templates.TEMPLATESPATH
+    )
@@ -3,6 +3,7 @@
 """
 
 import os
+import functools
 from . import anchors
 
 __all__ = [
@@ -28,6 +29,24 @@ def get_path_to_templates() -> str:
 TEMPLATESPATH = get_path_to_templates()
 
 
+@functools.cache
+def read_template(name) -> str:
+    """Reads a template file once per process.
+    """
+    path = os.path.join(TEMPLATESPATH, name)
+    with open(path, encoding='utf-8') as file:
+        return file.read()
+
+
+@functools.cache
+def listtemplates() -> frozenset:
+    """Returns names of the template files.
+    """
+    return frozenset(
+        os.listdir(TEMPLATESPATH)
+    )
+
+
 class Template:
     """Base class for template files.
     """
@@ -39,9 +58,7 @@ class Template:
 
     def getsource(self):
         name = self.getsourcename()
-        path = os.path.join(TEMPLATESPATH, name)
-        with open(path, encoding='utf-8') as file:
-            return file.read()
+        return read_template(name)
 
 
 class MutableDoc(Template):
@@ -147,6 +164,9 @@ class DocPageHTML(MutableDoc):
         if highlights is False:
             return self.remove_highlights_if_false(source)
 
+        if highlights == 'static':
+            return self.add_static_highlights(source)
+
         return source
 
     def add_highlights_if_true(self, source):
@@ -167,6 +187,16 @@ class DocPageHTML(MutableDoc):
 
         return source
 
+    def add_static_highlights(self, source):
+        """Keeps the link to CSS, code is highlighted at build time.
+        """
+
+        source = self.anchors_hljs['css'].replace_anchor(source)
+        source = self.anchors_hljs['js'].remove_anchor(source)
+        source = self.anchors_hljs['func'].remove_anchor(source)
+
+        return source
+
 
 class DocPageJS(MutableDoc):
 
@@ -244,14 +274,16 @@ class PageParamsHTML:
         Local TOC as an HTML list inside a paragraph.
     pagetext : str = ''
         Content of a docpage as text in HTML.
-    highilights : bool = False
-       Code highlighting is activated, if True (a).
+    highilights : bool | str = False
+       Code highlighting is activated, if True or "static" (a).
 
     Notes
     -----
 
     (a) — Links to static files are added,
           call of JS based highlighter is included.
+          If "static", code is highlighted at build time,
+          only the link to CSS is added.
 
     """
 
@@ -8,6 +8,16 @@ const docPage = {
     tocanchorsID: []  // IDs of TOC anchors
 }
 
+/**
+ * Local TOC of long pages (rendered by visible rows).
+ */
+const virtualToc = {
+    rows: [],         // Rows as [level, ID, text].
+    rowheight: 22,    // Height of a row in px.
+    active: -1,       // Index of the active row.
+    pending: false    // Rendering is requested.
+}
+
 /**
  * Widgets on the top panel.
  * Order of widgets on the panel: 
@@ -59,6 +69,7 @@ function setDocPage() {
     setTitleBox();
     setTocBoxes();
     setTocAnchors();
+    setLazyTrees();
 }
 
 /**
@@ -128,6 +139,11 @@ function setTocBoxes() {
  */
 function setTocAnchors() {
 
+    if (document.getElementById("local-toc-data")) {
+        setVirtualToc();
+        return;
+    }
+
     extractTocAnchorsID();
 
     if (docPage.tocanchorsID.length == 0) {
@@ -137,6 +153,132 @@ function setTocAnchors() {
     }
 
     setTocAnchorsID();
+    observeTocAnchors(markTocLink);
+
+}
+
+/**
+ * Marks the link to the active section in the local TOC.
+ * @param index Index of the active anchor.
+ */
+function markTocLink(index) {
+
+    let toc = document.getElementById("local-toc-box__text");
+    let atags = toc.getElementsByTagName("a");
+
+    for (let atag of toc.getElementsByClassName("toc-active")) {
+        atag.classList.remove("toc-active");
+    }
+
+    if (atags[index]) {
+        atags[index].classList.add("toc-active");
+    }
+
+}
+
+/**
+ * Tracks the active section with a single observer of all headings.
+ * @param onactive Callback on the index of the active anchor.
+ */
+function observeTocAnchors(onactive) {
+
+    if (!("IntersectionObserver" in window)) {
+        return;
+    }
+
+    let tocAnchors = document.getElementsByClassName("toc-anchor");
+    let indices = new Map();
+
+    let observer = new IntersectionObserver(function (entries) {
+        for (let entry of entries) {
+            if (entry.isIntersecting) {
+                onactive(indices.get(entry.target));
+            }
+        }
+    }, { rootMargin: "0px 0px -70% 0px" });
+
+    for (let i = 0; i < tocAnchors.length; i++) {
+        let heading = tocAnchors[i].nextElementSibling;
+        indices.set(heading, i);
+        observer.observe(heading);
+    }
+
+}
+
+/**
+ * Sets up the local TOC of a long page from its JSON rows.
+ */
+function setVirtualToc() {
+
+    let list = document.getElementById("local-toc-list");
+
+    virtualToc.rows = JSON.parse(document.getElementById("local-toc-data").textContent);
+    list.style.height = virtualToc.rows.length * virtualToc.rowheight + "px";
+
+    list.parentElement.addEventListener("scroll", requestTocRows, { passive: true });
+    observeTocAnchors(activateTocRow);
+
+    renderTocRows();
+
+}
+
+/**
+ * Sets the active row and scrolls the local TOC to it.
+ * @param index Index of the active row.
+ */
+function activateTocRow(index) {
+
+    let box = document.getElementById("local-toc-list").parentElement;
+    let top = index * virtualToc.rowheight;
+
+    virtualToc.active = index;
+
+    if (top < box.scrollTop || top > box.scrollTop + box.clientHeight - virtualToc.rowheight) {
+        box.scrollTop = top - box.clientHeight / 2;
+    }
+
+    requestTocRows();
+
+}
+
+/**
+ * Requests rendering of the local TOC at the next frame.
+ */
+function requestTocRows() {
+
+    if (virtualToc.pending) {
+        return;
+    }
+
+    virtualToc.pending = true;
+    window.requestAnimationFrame(renderTocRows);
+
+}
+
+/**
+ * Renders the visible rows of the local TOC (with margins).
+ */
+function renderTocRows() {
+
+    let list = document.getElementById("local-toc-list");
+    let box = list.parentElement;
+
+    let height = virtualToc.rowheight;
+    let rows = virtualToc.rows;
+
+    let first = Math.max(0, Math.floor(box.scrollTop / height) - 10);
+    let last = Math.min(rows.length, Math.ceil((box.scrollTop + box.clientHeight) / height) + 10);
+
+    let html = "";
+
+    for (let i = first; i < last; i++) {
+        let [level, id, text] = rows[i];
+        let active = i == virtualToc.active ? ' class="toc-active"' : '';
+        html += `<li style="top: ${i * height}px; padding-left: ${level}em;"><a href="#${id}"${active}>${text}</a></li>`;
+    }
+
+    list.innerHTML = html;
+    virtualToc.pending = false;
 
 }
 
@@ -179,6 +321,109 @@ function setTocAnchorsID() {
 
 }
 
+/**
+ * Sets up folded call trees and class trees.
+ */
+function setLazyTrees() {
+
+    let trees = document.getElementsByClassName("lazy-trees");
+
+    for (let i = 0; i < trees.length; i++) {
+        trees[i].addEventListener("click", clickLazyTree);
+    }
+
+}
+
+/**
+ * Expands/collapses a folded subtree on click.
+ * @param event The click on a tree block.
+ */
+function clickLazyTree(event) {
+
+    let fold = event.target.closest(".tree-fold");
+
+    if (fold == null) {
+        return;
+    }
+
+    let tree = event.currentTarget;
+    let nodes = getTreeNodes(tree);
+    let breadth = Number(tree.dataset.breadth);
+
+    let ref = Number(fold.dataset.ref);
+    let indent = fold.dataset.indent;
+
+    if (fold.classList.contains("tree-more")) {
+        let start = Number(fold.dataset.start);
+        fold.outerHTML = renderTreeChildren(nodes, ref, indent, start, breadth);
+        return;
+    }
+
+    if (fold.classList.contains("tree-open")) {
+        fold.nextElementSibling.hidden = !fold.nextElementSibling.hidden;
+        return;
+    }
+
+    let children = renderTreeChildren(nodes, ref, indent, 0, breadth);
+
+    fold.insertAdjacentHTML("afterend", `<span class="tree-box">${children}</span>`);
+    fold.classList.add("tree-open");
+
+}
+
+/**
+ * Returns the nodes of folded subtrees, parsed on the first use.
+ * @param tree The block with a folded tree.
+ */
+function getTreeNodes(tree) {
+
+    if (tree.treeNodes == null) {
+        tree.treeNodes = JSON.parse(tree.nextElementSibling.textContent);
+    }
+
+    return tree.treeNodes;
+
+}
+
+/**
+ * Renders children of a node, nodes with children are folded.
+ * @param nodes Nodes as [label, [children]] or [label].
+ * @param ref Index of the parent node.
+ * @param indent Prefix of the children lines.
+ * @param start Index of the first child.
+ * @param breadth Number of children to render.
+ */
+function renderTreeChildren(nodes, ref, indent, start, breadth) {
+
+    let children = nodes[ref][1];
+    let stop = Math.min(children.length, start + breadth);
+    let html = "";
+
+    for (let i = start; i < stop; i++) {
+
+        let node = nodes[children[i]];
+        let islast = i == children.length - 1;
+        let line = indent + (islast ? "└─ " : "├─ ") + node[0] + "\n";
+
+        if (node.length == 1) {
+            html += line;
+            continue;
+        }
+
+        let subindent = indent + (islast ? "   " : "│  ");
+        html += `<span class="tree-fold" data-ref="${children[i]}" data-indent="${subindent}">${line}</span>`;
+
+    }
+
+    if (stop < children.length) {
+        let more = `${indent}└─ … ${children.length - stop} more\n`;
+        html += `<span class="tree-fold tree-more" data-ref="${ref}" data-indent="${indent}" data-start="${stop}">${more}</span>`;
+    }
+
+    return html;
+
+}
+
 /**
  * Closes a local/global TOC box on the button click.
  * @param xmark The cross button in a local/global TOC box.
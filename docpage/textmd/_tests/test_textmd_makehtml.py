@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import json
 import unittest
 from docspyer.docpage.textmd import blocks
 from docspyer.docpage.textmd import makehtml
@@ -58,6 +59,30 @@ class TestConverter(unittest.TestCase):
         assert dochtml.text == TEXTHTML.strip()
         assert dochtml.toc == TOC_IN_HTML.strip()
 
+    def test_long_page(self):
+
+        sections = [
+            f'## Section {i}\n\nText {i}.' for i in range(makehtml.LONGPAGE)
+        ]
+
+        dochtml = DocMaker().make_dochtml(
+            '# Alfa\n\nIntro.\n\n' + '\n\n'.join(sections)
+        )
+
+        rows = json.loads(
+            dochtml.toc.split('id="local-toc-data">')[1][:-len('</script>')]
+        )
+
+        assert dochtml.toc.startswith('<ul id="local-toc-list"')
+        assert rows[:2] == [[0, 'alfa', 'Alfa'], [1, 'section-0', 'Section 0']]
+
+        assert dochtml.text.count('<section class="doc-section">') == len(rows)
+        assert (
+            '<section class="doc-section">\n'
+            '<div class="toc-anchor" id="section-0"></div><h2>Section 0</h2>'
+            '\n\n<p>Text 0.</p>\n</section>'
+        ) in dochtml.text
+
 
 class TestTOCMaker(unittest.TestCase):
 
@@ -63,6 +63,9 @@ class MDHeading(MDBlock):
     ----------
     text : str
         Line with a heading.
+    anchorid : str | None
+        ID of the TOC anchor, if set by the generator
+        (otherwise assigned in docpage.js).
 
     """
 
@@ -77,6 +80,10 @@ class MDHeading(MDBlock):
     - Must start with `{RE_PREF}`.
     """
 
+    def __init__(self, text):
+        super().__init__(text)
+        self.anchorid = None
+
     def make_html(self) -> str:
         heading = self.make_html_heading()
         return self.add_toc_anchor_prolog(heading)
@@ -87,7 +94,9 @@ class MDHeading(MDBlock):
         return f'<h{level}>{content}</h{level}>'
 
     def add_toc_anchor_prolog(self, heading):
-        return '<div class="toc-anchor"></div>' + heading
+        if self.anchorid is None:
+            return '<div class="toc-anchor"></div>' + heading
+        return f'<div class="toc-anchor" id="{self.anchorid}"></div>' + heading
 
     def get_level(self) -> int:
         return str.count(self.text, '#')
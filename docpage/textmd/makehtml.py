@@ -2,18 +2,23 @@
 """Converts MD text to an HTML doc (object).
 """
 
+import json
 import itertools as itr
 import textwrap
 
 from docspyer.utils import githubids
 from docspyer.utils import texttrees
 from docspyer.utils import treeashtml
+from docspyer.utils import tracing
 from . import parser
 
 __all__ = [
     'makedochtml'
 ]
 
+# Number of headings from which a document is long.
+LONGPAGE = 300
+
 
 def apiobj(obj):
     obj.__module__ = 'docspyer.docpage'
@@ -43,6 +48,13 @@ def makedochtml(text):
     - Build as an HTML list based on MD headings.
     - Contains ready-to-use links with github-style IDs.
 
+    Long documents (from `LONGPAGE` headings):
+
+    - TOC is stored as JSON rows [level, ID, text], the list is
+      rendered by docpage.js (only visible rows).
+    - Anchors get their IDs, text is wrapped in sections
+      (one per heading), rendering of off-screen sections is deferred.
+
     """
     docmaker = DocMaker()
     return docmaker.make_dochtml(text)
@@ -77,27 +89,71 @@ class DocMaker:
         blocks = self.get_blocks(text)
 
         headings = self.take_headings_from_blocks(blocks)
+
+        if len(headings) >= LONGPAGE:
+            return self.make_long_dochtml(blocks, headings)
+
         toc = self.make_toc_from_headings(headings)
         text = self.dump_blocks_to_text(blocks)
 
         return self.make_instance(text, toc)
 
+    def make_long_dochtml(self, blocks, headings):
+        """Makes a document with TOC data and sections.
+        """
+
+        tocmaker = TOCMaker()
+        anchorids = tocmaker.get_githubids(headings)
+
+        for heading, anchorid in zip(headings, anchorids):
+            heading.anchorid = anchorid
+
+        with tracing.span('toc'):
+            toc = tocmaker.make_toc_data(headings, anchorids)
+
+        text = self.dump_blocks_to_sections(blocks)
+
+        return self.make_instance(text, toc)
+
     def make_instance(self, text, toc):
         return DocHTML(text, toc)
 
     def make_toc_from_headings(self, headings):
-        return TOCMaker().maketoc(headings)
+        with tracing.span('toc'):
+            return TOCMaker().maketoc(headings)
 
     def get_blocks(self, text) -> list:
         return self.run_parser(text)
 
     def dump_blocks_to_text(self, blocks) -> str:
-        return '\n\n'.join(
-            [block.make_html() for block in blocks]
+        with tracing.span('markup'):
+            return '\n\n'.join(
+                [block.make_html() for block in blocks]
+            )
+
+    def dump_blocks_to_sections(self, blocks) -> str:
+
+        sections = []
+
+        for block in blocks:
+            if block.is_heading() or not sections:
+                sections.append([])
+            sections[-1].append(block.make_html())
+
+        with tracing.span('markup'):
+            return '\n\n'.join(
+                map(self.make_section, sections)
+            )
+
+    def make_section(self, items) -> str:
+        return (
+            '<section class="doc-section">\n' +
+            '\n\n'.join(items) + '\n</section>'
         )
 
     def run_parser(self, text) -> list:
-        return parser.parsetext(text)
+        with tracing.span('parse', bytes=len(text)):
+            return parser.parsetext(text)
 
     def take_headings_from_blocks(self, blocks) -> list:
         def is_heading(block):
@@ -145,6 +201,36 @@ class TOCMaker:
         textlist = textwrap.dedent(textlist)
         return textlist
 
+    def make_toc_data(self, headings, anchorids) -> str:
+        """Returns an empty TOC list and its rows as JSON.
+        """
+
+        levels = [
+            heading.get_level() for heading in headings
+        ]
+
+        rows = [
+            [level - min(levels), anchorid, heading.get_content()]
+            for level, anchorid, heading in zip(levels, anchorids, headings)
+        ]
+
+        data = json.dumps(rows, ensure_ascii=False)
+        data = data.replace('</', '<\\/')
+
+        return (
+            '<ul id="local-toc-list" class="virtual-toc"></ul>\n'
+            f'<script type="application/json" id="local-toc-data">'
+            f'{data}</script>'
+        )
+
+    def get_githubids(self, headings) -> list[str]:
+
+        texts = [
+            heading.get_content() for heading in headings
+        ]
+
+        return githubids.makeids(texts)
+
     def get_links_with_githubdids(self, headings):
 
         def make_atag(path, text):
@@ -154,7 +240,7 @@ class TOCMaker:
             heading.get_content() for heading in headings
         ]
 
-        paths = githubids.makeids(texts)
+        paths = self.get_githubids(headings)
 
         return list(
             itr.starmap(make_atag, zip(paths, texts))
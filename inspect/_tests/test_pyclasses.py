@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""Tests the inheritance index of packages.
+"""
+
+import os
+import tempfile
+import unittest
+
+import docspyer
+from docspyer.inspect import pyclasses
+from docspyer.utils import namespace
+
+MODULES = {
+    'base.py': (
+        'class Node:\n    pass\n\n\n'
+        'class Leaf(Node):\n    pass\n'
+    ),
+    'sub/__init__.py': 'from .shapes import Shape\n',
+    'sub/shapes.py': (
+        'from ..base import Node\n\n\n'
+        'class Shape(Node):\n    pass\n'
+    ),
+    'items.py': (
+        'import typing\n'
+        'from . import sub\n'
+        'from .sub import Shape as Figure\n\n\n'
+        'class Circle(Figure):\n    pass\n\n\n'
+        'class Square(sub.Shape, typing.Generic[int]):\n    pass\n\n\n'
+        'class Both(Circle, Square):\n    pass\n\n\n'
+        'class Failure(Exception):\n    pass\n'
+    )
+}
+
+
+def make_package(tempdir) -> str:
+
+    pkgpath = os.path.join(tempdir, 'pkg')
+
+    for filename, source in MODULES.items():
+
+        filepath = os.path.join(pkgpath, filename)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+        with open(filepath, encoding='utf-8', mode='w') as file:
+            file.write(source)
+
+    return pkgpath
+
+
+class TestClassIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with tempfile.TemporaryDirectory() as tempdir:
+            cls.index = pyclasses.makeclassindex(make_package(tempdir))
+
+    def test_bases(self):
+        assert self.index.bases['pkg.items.Circle'] == ['pkg.sub.shapes.Shape']
+        assert self.index.bases['pkg.items.Square'] == [
+            'pkg.sub.shapes.Shape', 'typing.Generic'
+        ]
+        assert self.index.bases['pkg.base.Node'] == []
+
+    def test_subclasses(self):
+        assert self.index.getsubclasses('pkg.base.Node') == {
+            'pkg.base.Leaf', 'pkg.sub.shapes.Shape', 'pkg.items.Circle',
+            'pkg.items.Square', 'pkg.items.Both'
+        }
+        assert self.index.getsubclasses('pkg.items.Both') == set()
+        assert self.index.getsubclasses('Exception') == {'pkg.items.Failure'}
+
+    def test_ancestors(self):
+        assert self.index.getancestors('pkg.items.Both') == [
+            'pkg.items.Circle', 'pkg.items.Square', 'pkg.sub.shapes.Shape',
+            'pkg.base.Node', 'typing.Generic'
+        ]
+
+    def test_conditional_import(self):
+
+        index = pyclasses.ClassIndex()
+        index.add_module('class Mixin: pass\n', 'p.base')
+        index.add_module(
+            'try:\n    from ..base import Mixin\nexcept ImportError:\n'
+            '    Mixin = object\nclass Shape(Mixin): pass\n',
+            'p.sub.shapes'
+        )
+        index.resolve()
+
+        assert index.bases['p.sub.shapes.Shape'] == ['p.base.Mixin']
+
+    def test_cycle(self):
+
+        index = pyclasses.ClassIndex()
+        index.add_module('from .b import B\nclass A(B): pass\n', 'p.a')
+        index.add_module('from .a import A\nclass B(A): pass\n', 'p.b')
+        index.resolve()
+
+        assert index.getsubclasses('p.a.A') == {'p.b.B'}
+        assert index.getancestors('p.a.A') == ['p.b.B']
+
+
+class TestClassesReport(unittest.TestCase):
+
+    def test_docpackage(self):
+
+        with tempfile.TemporaryDirectory() as tempdir:
+
+            pkgpath = make_package(tempdir)
+            docpath = os.path.join(tempdir, 'docs')
+            os.mkdir(docpath)
+
+            docspyer.docpackage(
+                pkgpath, docpath, ['html', 'md'], classes=True
+            )
+
+            with open(os.path.join(docpath, 'pkg-classes.md'),
+                      encoding='utf-8') as file:
+                report = file.read()
+
+            assert os.path.isfile(os.path.join(docpath, 'pkg-classes.html'))
+
+        assert '• pkg.base.Node\n  ├─ pkg.base.Leaf' in report
+        assert '   ├─ pkg.items.Circle\n     │  └─ pkg.items.Both' in report
+        assert '• Exception\n  └─ pkg.items.Failure' in report
+
+
+class TestInvertMap(unittest.TestCase):
+
+    def test_invertmap(self):
+        inverted = namespace.invertmap({'a': ['x', 'y'], 'b': ['x', 'x']})
+        assert inverted == {'x': ['a', 'b'], 'y': ['a']}
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@
 """
 
 import os
+import types
 import unittest
 from docspyer.inspect import pydocmd
 
@@ -95,6 +96,40 @@ class TestClassDumper(unittest.TestCase):
         _dumpfile(out, '_myclass.md')
 
 
+class TestModulePages(unittest.TestCase):
+
+    def setUp(self):
+        self.pymod = types.ModuleType('mymodule', 'MODDOCS')
+        self.pymod.myfunc = myfunc
+        self.pymod.MyClass = MyClass
+
+    def test_no_split(self):
+
+        pages = pydocmd.modtomds(self.pymod, maxclasses=1)
+
+        assert pages == {
+            'mymodule': pydocmd.modtomd(self.pymod)
+        }
+
+    def test_split(self):
+
+        for pages in [
+            pydocmd.modtomds(self.pymod, maxclasses=0),
+            pydocmd.modtomds(self.pymod, maxclasssize=10)
+        ]:
+
+            modpage = pages['mymodule']
+            clspage = pages['mymodule.MyClass']
+
+            assert list(pages) == ['mymodule', 'mymodule.MyClass']
+
+            assert 'myfunc()' in modpage and 'METHODDOCS' not in modpage
+            assert '<a href="mymodule.MyClass.md">MyClass</a>' in modpage
+
+            assert clspage.startswith('# mymodule.MyClass\n\n## MyClass')
+            assert 'METHODDOCS' in clspage
+
+
 def _dumpfile(content, filename):
 
     dirpath = os.path.dirname(__file__)
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""Tests the export of parsed records as JSON lines.
+"""
+
+import io
+import os
+import json
+import tempfile
+import unittest
+
+import docspyer
+from docspyer.inspect import pyparser, pyreport
+
+SCRIPTS = {
+    '__init__.py': '"""Package."""\nfrom . import core\n',
+    'core.py': '''"""Core."""
+import asyncio
+
+
+class Runner(Base):
+    """Runs."""
+
+    def run(self):
+        for item in self.items:
+            self.step(item)
+
+    def step(self, item):
+        return check(item)
+
+
+async def main():
+    await asyncio.sleep(1)
+''',
+    'broken.py': 'def (:\n',
+    '_private/skipped.py': 'import os\n'
+}
+
+
+def make_package(rootpath):
+
+    pkgpath = os.path.join(rootpath, 'mypkg')
+
+    for name, source in SCRIPTS.items():
+
+        filepath = os.path.join(pkgpath, name)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+        with open(filepath, encoding='utf-8', mode='w') as file:
+            file.write(source)
+
+    return pkgpath
+
+
+class TestRecordsExport(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.pkgpath = make_package(self.tempdir.name)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_lines(self):
+
+        stream = io.StringIO()
+        count = docspyer.dumprecords(self.pkgpath, stream)
+
+        lines = list(
+            map(json.loads, stream.getvalue().splitlines())
+        )
+
+        assert count == 3
+        assert [line['name'] for line in lines] == [
+            'mypkg', 'mypkg.broken', 'mypkg.core'
+        ]
+
+        assert lines[1]['error'].startswith('SyntaxError')
+        assert lines[2]['path'] == 'mypkg/core.py'
+
+        runner, = lines[2]['classes']
+
+        assert runner['bases'] == ['Base']
+        assert runner['funcs'][0]['callsites'][0] == {
+            'name': 'self.step', 'lineno': 10, 'depth': 1,
+            'intry': False, 'awaited': False
+        }
+
+    def test_undecodable(self):
+
+        for name, content in [('latin', b'x = "\xe9"\n'), ('nulls', b'\0')]:
+            filepath = os.path.join(self.pkgpath, name + '.py')
+            with open(filepath, mode='wb') as file:
+                file.write(content)
+
+        stream = io.StringIO()
+        count = docspyer.dumprecords(self.pkgpath, stream)
+
+        lines = {
+            line['name']: line
+            for line in map(json.loads, stream.getvalue().splitlines())
+        }
+
+        assert count == 5
+        assert lines['mypkg.latin']['error'].startswith('UnicodeDecodeError')
+        # SyntaxError or ValueError, depending on the python version.
+        assert 'error' in lines['mypkg.nulls']
+        assert lines['mypkg.nulls']['path'] == 'mypkg/nulls.py'
+
+    def test_roundtrip(self):
+
+        filepath = os.path.join(self.tempdir.name, 'records.jsonl')
+        docspyer.dumprecords(self.pkgpath, filepath)
+
+        records = docspyer.loadrecords(filepath)
+
+        assert next(records).name == 'mypkg'
+
+        modrec = next(records)
+
+        with open(os.path.join(self.pkgpath, 'core.py'),
+                  encoding='utf-8') as file:
+            parsed = pyparser.parsescript(file.read(), 'mypkg.core')
+
+        assert modrec.funcs['main'].isasync
+        assert modrec.funcs['main'].callsites[0].awaited
+
+        assert (
+            pyreport.run_reporter(modrec) == pyreport.run_reporter(parsed)
+        )
+
+        with self.assertRaises(StopIteration):
+            next(records)
+
+
+if __name__ == '__main__':
+    unittest.main()
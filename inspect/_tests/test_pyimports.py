@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Tests the analysis of imports between modules of a package.
+"""
+
+import os
+import tempfile
+import unittest
+
+import docspyer
+from docspyer.inspect import pyimports
+
+SCRIPTS = {
+    '__init__.py': 'from . import core\n',
+    'core.py': 'import os\nfrom .tools import helpers as hp\n',
+    'cli.py': 'import json\nfrom mypkg.core import run\n',
+    'tools/__init__.py': '',
+    'tools/helpers.py': 'from .. import core\n\ndef f():\n    import re\n',
+    '_tests/test_core.py': 'from mypkg import cli\n'
+}
+
+IMPORTTIME = '''\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   json.decoder
+import time:       300 |        420 | json
+import time:        50 |         50 |     mypkg.tools.helpers
+import time:        10 |         60 |   mypkg.tools
+import time:      2000 |       2060 | mypkg.core
+'''
+
+
+def make_package(rootpath):
+
+    pkgpath = os.path.join(rootpath, 'mypkg')
+
+    for name, source in SCRIPTS.items():
+
+        filepath = os.path.join(pkgpath, name)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+        with open(filepath, encoding='utf-8', mode='w') as file:
+            file.write(source)
+
+    return pkgpath
+
+
+class TestImportGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.pkgpath = make_package(self.tempdir.name)
+        self.graph = pyimports.ImportGraph()
+        self.graph.set_modules(self.pkgpath)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_edges(self):
+
+        edges = self.graph.edges
+
+        self.assertNotIn('mypkg._tests.test_core', edges)
+
+        self.assertEqual(edges['mypkg'], ['mypkg.core'])
+        self.assertEqual(edges['mypkg.core'], ['mypkg.tools.helpers'])
+        self.assertEqual(edges['mypkg.cli'], ['mypkg.core'])
+        self.assertEqual(edges['mypkg.tools.helpers'], ['mypkg.core'])
+
+    def test_conditional_imports(self):
+
+        source = (
+            'try:\n    import ujson as json\nexcept ImportError:\n'
+            '    import json\nif TYPE_CHECKING:\n    from .core import run\n'
+            'def f():\n    import re\n'
+        )
+
+        fetcher = pyimports.ModulesFetcher()
+
+        self.assertEqual(
+            fetcher.get_imports(source), ['ujson', 'json', '.core.run']
+        )
+
+    def test_broken_script(self):
+        fetcher = pyimports.ModulesFetcher()
+        self.assertEqual(fetcher.get_imports('def (:\n'), [])
+
+    def test_cycles(self):
+        self.assertEqual(
+            self.graph.cycles(), [['mypkg.core', 'mypkg.tools.helpers']]
+        )
+
+    def test_closure(self):
+        self.assertEqual(
+            self.graph.closure('mypkg.cli'),
+            ['mypkg.core', 'mypkg.tools.helpers']
+        )
+        self.assertEqual(
+            self.graph.closure('mypkg.core'), ['mypkg.tools.helpers']
+        )
+
+
+class TestImportsReport(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.pkgpath = make_package(self.tempdir.name)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_parse_importtime(self):
+
+        times = pyimports.parse_importtime(IMPORTTIME)
+
+        self.assertEqual(times['json'], (300, 420))
+        self.assertEqual(times['mypkg.tools.helpers'], (50, 50))
+        self.assertNotIn('package', times)
+
+    def test_report(self):
+
+        logpath = os.path.join(self.tempdir.name, 'imports.log')
+
+        with open(logpath, encoding='utf-8', mode='w') as file:
+            file.write(IMPORTTIME)
+
+        report = pyimports.analyzeimports(self.pkgpath, logpath)
+
+        self.assertIn('mypkg.core → mypkg.tools.helpers', report)
+        self.assertIn('## Slowest imports (cumulative)', report)
+        self.assertIn('## Slowest imports (self)', report)
+
+        # Self times of mypkg.cli, mypkg.core, mypkg.tools.helpers.
+        self.assertIn('2.05', report)
+
+    def test_docpackage(self):
+
+        docpath = os.path.join(self.tempdir.name, 'docs')
+        os.mkdir(docpath)
+
+        docspyer.docpackage(self.pkgpath, docpath, 'md', imports=True)
+
+        filepath = os.path.join(docpath, 'mypkg-imports.md')
+
+        with open(filepath, encoding='utf-8') as file:
+            report = file.read()
+
+        self.assertIn('## Import cycles', report)
+        self.assertNotIn('Slowest imports', report)
+
+
+if __name__ == '__main__':
+    unittest.main()
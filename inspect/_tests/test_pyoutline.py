@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Tests the scanner of docstrings and imports of scripts.
+"""
+
+import unittest
+
+from docspyer.inspect import pyoutline
+
+SCRIPT = '''#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script for tests.
+
+Details.
+"""
+
+import os
+from . import (
+    utils,
+    tools
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def main():
+    import json
+    text = """
+import re
+"""
+    return text
+
+
+TEMPLATE = \'\'\'
+import fake
+\'\'\'
+
+if os.name == 'nt':
+    from .windows import winapi
+else:
+    from .posix import \\
+        posixapi
+
+
+class Loader:
+    from ..base import Base
+
+
+import late
+'''
+
+
+class TestHeaderScanner(unittest.TestCase):
+
+    def setUp(self):
+        self.scanner = pyoutline.HeaderScanner()
+
+    def test_docstring(self):
+        docs, _ = self.scanner.scan(SCRIPT)
+        self.assertEqual(docs, 'Script for tests.\n\nDetails.')
+
+    def test_imports(self):
+
+        _, imports = self.scanner.scan(SCRIPT)
+
+        self.assertEqual(
+            imports, [
+                'os', '.utils', '.tools', 'np', '.windows.winapi',
+                '.posix.posixapi', 'late'
+            ]
+        )
+
+    def test_no_docstring(self):
+
+        docs, imports = self.scanner.scan('TABLE = {\n1: 2,\n}\n')
+
+        self.assertEqual(docs, '')
+        self.assertEqual(imports, [])
+
+    def test_broken_split(self):
+
+        source = 'x = f(\n"""\nimport fake\n""")\nimport os\n'
+
+        _, imports = self.scanner.scan(source)
+
+        self.assertEqual(imports, ['os'])
+
+
+if __name__ == '__main__':
+    unittest.main()
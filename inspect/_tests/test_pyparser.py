@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""Tests loop depths, try blocks and awaits of recorded calls.
+"""
+
+import unittest
+
+from docspyer.inspect import pyparser, pyreport
+
+SCRIPT = '''
+def scan(items):
+    for item in load(items):
+        try:
+            check(item)
+            while ready(item):
+                step(item)
+        except ValueError:
+            warn()
+    return [fix(x) for x in load(items) for y in split(x)]
+
+
+def apply(items):
+    return list(map(check, items))
+
+
+def flat():
+    return load()
+
+
+class Runner:
+
+    def run(self):
+        for _ in range(3):
+            self.tick()
+
+    def tick(self):
+        return step(None)
+'''
+
+
+class TestCallSites(unittest.TestCase):
+
+    def setUp(self):
+        self.modrec = pyparser.parsescript(SCRIPT, 'loops')
+
+    def get_sites(self, funcname) -> dict:
+        return {
+            site.name: (site.depth, site.intry)
+            for site in self.modrec.funcs[funcname].callsites
+        }
+
+    def test_loops(self):
+
+        sites = self.get_sites('scan')
+
+        self.assertEqual(sites['check'], (1, True))
+        self.assertEqual(sites['ready'], (2, True))
+        self.assertEqual(sites['step'], (2, True))
+        self.assertEqual(sites['warn'], (1, False))
+
+    def test_comprehensions(self):
+
+        sites = self.get_sites('scan')
+
+        self.assertEqual(sites['split'], (1, False))
+        self.assertEqual(sites['fix'], (2, False))
+
+    def test_map(self):
+        sites = self.get_sites('apply')
+        self.assertEqual(sites['list'], (0, False))
+        self.assertEqual(sites['check'], (1, False))
+
+    def test_hotloops(self):
+
+        hotloops = self.modrec.dumphotloops()
+
+        self.assertLess(
+            hotloops.index('scan ↻2'), hotloops.index('apply ↻1')
+        )
+        self.assertIn('step ↻2 try', hotloops)
+        self.assertIn('Runner.run ↻1', hotloops)
+        self.assertNotIn('flat', hotloops)
+
+    def test_report(self):
+
+        report = pyreport.makereport(SCRIPT, 'loops', hotloops=True)
+
+        self.assertIn('```hot-loops', report)
+        self.assertIn('├─ check ↻1', report)
+        self.assertIn('└─ tick ↻1', report)
+
+    def test_report_default(self):
+
+        report = pyreport.makereport(SCRIPT, 'loops')
+
+        self.assertNotIn('```hot-loops', report)
+        self.assertNotIn('↻', report)
+
+
+ASYNCSCRIPT = '''
+import time
+import asyncio
+
+
+async def main():
+    await asyncio.sleep(1)
+    helper()
+    await fetch()
+
+
+def helper():
+    time.sleep(2)
+    return load()
+
+
+def load():
+    with open('data.txt') as file:
+        return file.read()
+
+
+async def fetch():
+    return await client.get('url')
+
+
+class Worker:
+
+    async def run(self):
+        self.prepare()
+
+    def prepare(self):
+        subprocess.run(['ls'])
+'''
+
+
+ALIASSCRIPT = '''
+import subprocess as sp
+from time import sleep
+from asyncio import sleep as pause
+
+async def main():
+    sleep(1)
+    sp.run(['ls'])
+    await pause(1)
+'''
+
+
+class TestAsyncCalls(unittest.TestCase):
+
+    def setUp(self):
+        self.modrec = pyparser.parsescript(ASYNCSCRIPT, 'aio')
+
+    def test_async_funcs(self):
+
+        funcs = self.modrec.funcs
+
+        self.assertTrue(funcs['main'].isasync)
+        self.assertFalse(funcs['helper'].isasync)
+        self.assertTrue(self.modrec.classes['Worker'].funcs['run'].isasync)
+
+    def test_awaited(self):
+
+        sites = {
+            site.name: site.awaited
+            for site in self.modrec.funcs['main'].callsites
+        }
+
+        self.assertEqual(
+            sites, {'asyncio.sleep': True, 'helper': False, 'fetch': True}
+        )
+
+    def test_blocking(self):
+
+        blocking = self.modrec.dumpblocking()
+
+        self.assertIn('helper → time.sleep (line 13)', blocking)
+        self.assertIn('helper → load → open (line 18)', blocking)
+        self.assertIn('self.prepare → subprocess.run (line 32)', blocking)
+        self.assertNotIn('async fetch', blocking)
+        self.assertNotIn('asyncio.sleep', blocking)
+
+    def test_patterns(self):
+        blocking = self.modrec.dumpblocking(patterns=['client.*'])
+        self.assertEqual(blocking, '')
+
+    def test_report(self):
+        report = pyreport.makereport(ASYNCSCRIPT, 'aio')
+        self.assertIn('```blocking-calls', report)
+
+    def test_aliases(self):
+
+        modrec = pyparser.parsescript(ALIASSCRIPT, 'aliases')
+        blocking = modrec.dumpblocking()
+
+        self.assertIn('sleep (line 7)', blocking)
+        self.assertIn('sp.run (line 8)', blocking)
+        self.assertNotIn('sleep (line 9)', blocking)
+
+    def test_report_patterns(self):
+        report = pyreport.makereport(ALIASSCRIPT, 'aliases', blocking=['x'])
+        self.assertNotIn('```blocking-calls', report)
+
+
+if __name__ == '__main__':
+    unittest.main()
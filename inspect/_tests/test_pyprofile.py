@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Tests call trees annotated with profile data.
+"""
+
+import os
+import cProfile
+import tempfile
+import unittest
+import importlib.util
+
+import docspyer
+from docspyer.inspect import pyprofile
+
+SCRIPT = '''
+def main():
+    for _ in range(3):
+        slow()
+    fast()
+
+
+def slow():
+    return sum(i * i for i in range(20000))
+
+
+def fast():
+    return 1
+
+
+class Worker:
+
+    def run(self):
+        self.step()
+
+    def step(self):
+        return slow()
+'''
+
+
+def run_script(filepath, profpath):
+
+    spec = importlib.util.spec_from_file_location('hotmod', filepath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    profiler = cProfile.Profile()
+    profiler.runcall(module.main)
+    profiler.runcall(module.Worker().run)
+    profiler.dump_stats(profpath)
+
+
+class TestProfile(unittest.TestCase):
+
+    def setUp(self):
+
+        self.tempdir = tempfile.TemporaryDirectory()
+
+        self.filepath = os.path.join(self.tempdir.name, 'hotmod.py')
+        self.profpath = os.path.join(self.tempdir.name, 'hot.prof')
+
+        with open(self.filepath, encoding='utf-8', mode='w') as file:
+            file.write(SCRIPT)
+
+        run_script(self.filepath, self.profpath)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def read_report(self, ext) -> str:
+
+        filepath = self.filepath.replace('.py', ext)
+
+        with open(filepath, encoding='utf-8') as file:
+            return file.read()
+
+    def find_line(self, text, node) -> str:
+        line, = [line for line in text.splitlines() if node + ' [' in line]
+        return line
+
+    def test_report(self):
+
+        docspyer.docscript(
+            self.filepath, self.tempdir.name, 'md', profile=self.profpath
+        )
+
+        report = self.read_report('.md')
+
+        main = self.find_line(report, '• main')
+        fast = self.find_line(report, '─ fast')
+        step = self.find_line(report, '─ step')
+
+        assert '1 calls' in main and main.endswith(pyprofile.HOTMARK)
+        assert '1 calls' in fast and not fast.endswith(pyprofile.HOTMARK)
+        assert '1 calls' in step
+
+    def test_callers(self):
+
+        docspyer.docscript(
+            self.filepath, self.tempdir.name, 'md', profile=self.profpath
+        )
+
+        report = self.read_report('.md')
+
+        main = self.find_line(report, '• main')
+        slow = self.find_line(report, '─ slow')
+
+        assert '3 calls' in slow
+        assert self.get_share(slow) <= self.get_share(main)
+
+    def get_share(self, line) -> float:
+        share = line.rpartition(', ')[2].partition('%')[0]
+        return float(share)
+
+    def test_threshold(self):
+
+        profile = pyprofile.loadprofile(self.profpath, threshold=1.1)
+
+        docspyer.docscript(
+            self.filepath, self.tempdir.name, 'md', profile=profile
+        )
+
+        assert pyprofile.HOTMARK not in self.read_report('.md')
+
+    def test_html(self):
+
+        docspyer.docscript(
+            self.filepath, self.tempdir.name, 'html', profile=self.profpath
+        )
+
+        assert '<mark class="hot-call">[' in self.read_report('.html')
+
+
+if __name__ == '__main__':
+    unittest.main()
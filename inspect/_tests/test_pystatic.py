@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Tests static documentation of python modules.
+"""
+
+import os
+import ast
+import inspect
+import unittest
+
+import docspyer
+from docspyer.docpage import pagemaker, templates
+from docspyer.inspect import pydocmd, pyscripts, pystatic, pytrees
+
+
+def myfunc(arg1, /, arg2: int = 1, *args, key=None, **kwargs) -> list[str]:
+    """FUNCDOCS
+    """
+
+
+class MyClass:
+    """CLASSDOCS
+    """
+
+    def __init__(self, arg1, arg2=True):
+        self.arg1 = arg1
+        self.arg2 = arg2
+
+    @property
+    def myprop(self):
+        """PROPDOCS
+        """
+        return self.arg1
+
+    def mymethod(self, *, key: str = 'key') -> None:
+        """METHODDOCS
+        """
+
+
+def get_script_path(module):
+    path = module.__file__
+    if path.endswith('__init__.py'):
+        return os.path.dirname(path)
+    return path
+
+
+def parse_this_script():
+    with open(__file__, encoding='utf-8') as file:
+        return ast.parse(file.read())
+
+
+def find_def(astmodule, name):
+    for node in ast.walk(astmodule):
+        if getattr(node, 'name', None) == name:
+            return node
+    return None
+
+
+class TestSignatures(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.astmodule = parse_this_script()
+        cls.signer = pystatic.SignatureMaker()
+
+    def test_function(self):
+        node = find_def(self.astmodule, 'myfunc')
+        sign = self.signer.make_signature(node)
+        assert sign == str(inspect.signature(myfunc))
+
+    def test_method(self):
+        node = find_def(self.astmodule, 'mymethod')
+        sign = self.signer.make_signature(node)
+        assert sign == str(inspect.signature(MyClass.mymethod))
+
+    def test_constructor(self):
+        node = find_def(self.astmodule, '__init__')
+        sign = self.signer.make_signature(node, bound=True)
+        assert sign == str(inspect.signature(MyClass))
+
+
+class TestStaticModule(unittest.TestCase):
+
+    def test_script(self):
+
+        path = get_script_path(pyscripts)
+        module = pystatic.loadmodule(path)
+
+        assert module.__name__ == 'docspyer.inspect.pyscripts'
+        assert 'Scripts' in module.namespace
+        assert 'ScriptRecord' in module.namespace
+
+        classstub = module.namespace['Scripts']
+        methods = [func.__name__ for func in classstub.methods]
+
+        assert 'listscripts' in methods
+        assert classstub.signature == '()'
+
+    def test_script_as_md(self):
+
+        path = get_script_path(pyscripts)
+        module = pystatic.loadmodule(path)
+
+        livemd = pydocmd.modtomd(pyscripts, clsverbs=2)
+        staticmd = pydocmd.modtomd(module, clsverbs=2)
+
+        assert livemd == staticmd
+
+    def test_constant_defaults(self):
+
+        path = get_script_path(pytrees)
+        module = pystatic.loadmodule(path)
+
+        func = module.namespace['foldtrees_html']
+
+        assert func.signature == str(
+            inspect.signature(pytrees.foldtrees_html)
+        )
+        assert 'maxdepth=3' in func.signature
+
+    def test_cached_functions(self):
+
+        module = pystatic.loadmodule(get_script_path(templates))
+
+        assert 'read_template' not in module.namespace
+        assert 'listtemplates' not in module.namespace
+
+        for livemod in (templates, pagemaker):
+
+            module = pystatic.loadmodule(get_script_path(livemod))
+
+            livemd = pydocmd.modtomd(livemod, clsverbs=2)
+            staticmd = pydocmd.modtomd(module, clsverbs=2)
+
+            assert livemd == staticmd
+
+    def test_package_as_md(self):
+
+        path = get_script_path(docspyer)
+        module = pystatic.loadmodule(path)
+
+        livemd = pydocmd.modtomd(docspyer)
+        staticmd = pydocmd.modtomd(module)
+
+        assert livemd == staticmd
+
+
+if __name__ == '__main__':
+    unittest.main()
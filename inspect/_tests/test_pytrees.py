@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""Tests folded call trees in HTML reports.
+"""
+
+import os
+import re
+import json
+import tempfile
+import unittest
+
+import docspyer
+from docspyer.inspect import pytrees
+
+TREES = '''<pre class="call-trees">• main
+  ├─ alfa
+  │  ├─ common
+  │  │  └─ leaf
+  │  └─ x
+  └─ bravo
+     └─ common
+        └─ leaf
+
+• wide
+  ├─ a
+  ├─ b
+  ├─ c
+  └─ d
+</pre>'''
+
+SCRIPT = '''
+def main():
+    alfa()
+    bravo()
+
+
+def alfa():
+    common()
+
+
+def bravo():
+    common()
+
+
+def common():
+    leaf()
+
+
+def leaf():
+    pass
+'''
+
+
+def load_nodes(page) -> list:
+    data = re.search(r'class="tree-data">(.*?)</script>', page).group(1)
+    return json.loads(data)
+
+
+class TestFoldTrees(unittest.TestCase):
+
+    def test_within_limits(self):
+        assert pytrees.foldtrees_html(TREES, 5, 5) == TREES
+
+    def test_depth(self):
+
+        page = pytrees.foldtrees_html(TREES, 2, 5)
+        nodes = load_nodes(page)
+
+        assert 'lazy-trees' in page
+        assert '│  │  └─ leaf' not in page
+
+        # The same subtree under alfa and bravo is stored once.
+        assert nodes == [['leaf'], ['common', [0]]]
+        assert page.count('data-ref="1"') == 2
+        assert '  └─ d\n' in page
+
+    def test_breadth(self):
+
+        page = pytrees.foldtrees_html(TREES, 3, 3)
+        nodes = load_nodes(page)
+
+        assert '  ├─ c\n' in page and '  └─ d\n' not in page
+        assert '└─ … 1 more\n</span>' in page
+        assert nodes[-1] == ['wide', [0, 1, 2, 3]]
+
+    def test_limits(self):
+        with self.assertRaises(ValueError):
+            pytrees.foldtrees_html(TREES, 0, 5)
+
+
+class TestFoldedReport(unittest.TestCase):
+
+    def test_docscript(self):
+
+        with tempfile.TemporaryDirectory() as tempdir:
+
+            filepath = os.path.join(tempdir, 'calls.py')
+
+            with open(filepath, encoding='utf-8', mode='w') as file:
+                file.write(SCRIPT)
+
+            docspyer.docscript(
+                filepath, tempdir, ['html', 'md'], foldtrees=(1, 5)
+            )
+
+            with open(os.path.join(tempdir, 'calls.html'),
+                      encoding='utf-8') as file:
+                page = file.read()
+
+            with open(os.path.join(tempdir, 'calls.md'),
+                      encoding='utf-8') as file:
+                report = file.read()
+
+        assert 'class="call-trees lazy-trees"' in page
+        assert 'class="tree-data"' in page
+        assert 'tree-fold' not in report
+
+
+if __name__ == '__main__':
+    unittest.main()
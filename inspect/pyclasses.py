@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+"""Indexes inheritance between classes of python packages.
+
+- Bases are resolved through imports to the modules defining them.
+- Re-exports (e.g. from `__init__` scripts) are followed.
+- Direct subclasses are kept as sets, transitive queries are cached.
+- Bases outside the packages are kept as written, e.g. `Exception`.
+
+"""
+
+import ast
+
+from . import pyimports
+from . import pyoutline
+from ..utils import deeptrees, tableasmd, treeastxt
+
+__all__ = [
+    'makeclassindex', 'reportclasses', 'ClassIndex'
+]
+
+# Re-exports followed to resolve a base.
+MAXHOPS = 10
+
+TOPCOUNT = 20
+
+
+def makeclassindex(*pkgpaths):
+    """Makes the inheritance index of classes of packages.
+
+    Parameters
+    ----------
+    pkgpaths : str
+        Paths to the package directories.
+
+    Returns
+    -------
+    ClassIndex
+        The index, classes are named by full dotted names.
+
+    """
+
+    index = ClassIndex()
+
+    for pkgpath in pkgpaths:
+        index.add_package(pkgpath)
+
+    index.resolve()
+
+    return index
+
+
+def reportclasses(*pkgpaths) -> str:
+    """Makes an MD report on class trees across modules of packages.
+
+    Parameters
+    ----------
+    pkgpaths : str
+        Paths to the package directories.
+
+    Returns
+    -------
+    str
+        The resulting report in MD.
+
+    """
+
+    reporter = ClassesReporter()
+    return reporter.make_report(makeclassindex(*pkgpaths))
+
+
+class ClassIndex:
+    """Inheritance index of classes.
+
+    Attributes
+    ----------
+    bases : dict
+        Full names of classes mapped to full names of their bases.
+    derived : dict
+        Full names of bases mapped to sets of their direct subclasses.
+
+    Notes
+    -----
+
+    - `getsubclasses()` and `getancestors()` are computed once per class.
+    - The caches are cleared by `resolve()`.
+
+    """
+
+    def __init__(self):
+
+        self.bases = {}
+        self.derived = {}
+
+        self._rawbases = {}
+        self._aliases = {}
+
+        self._subclasses = {}
+        self._ancestors = {}
+
+    def add_package(self, pkgpath):
+
+        fetcher = pyimports.ModulesFetcher()
+
+        for filepath, name, ispkg in fetcher.walk_scripts(pkgpath):
+
+            with open(filepath, encoding='utf-8') as file:
+                source = file.read()
+
+            self.add_module(source, name, ispkg)
+
+    def add_module(self, source, name, ispkg=False):
+        """Records classes of a module, `resolve()` is needed after.
+        """
+
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return
+
+        module = pyimports.ModuleImports(name, ispkg, [])
+        aliases = self.collect_aliases(tree, module)
+
+        classdefs = [
+            node for node in tree.body if isinstance(node, ast.ClassDef)
+        ]
+
+        for node in classdefs:
+            aliases[node.name] = f'{name}.{node.name}'
+
+        for node in classdefs:
+            self._rawbases[f'{name}.{node.name}'] = [
+                self.qualify(base, aliases)
+                for base in self.get_base_names(node)
+            ]
+
+        self._aliases[name] = aliases
+
+    def collect_aliases(self, tree, module) -> dict:
+        """Maps names bound by module-level imports to full names.
+        """
+
+        graph = pyimports.ImportGraph()
+        aliases = {}
+
+        for node in pyoutline.HeaderScanner().fetch_imports(tree.body):
+
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname:
+                        aliases[alias.asname] = alias.name
+                    else:
+                        head = alias.name.partition('.')[0]
+                        aliases[head] = head
+
+            if isinstance(node, ast.ImportFrom):
+
+                source = graph.make_absolute(
+                    '.'*node.level + (node.module or ''), module
+                )
+
+                for alias in node.names:
+                    if alias.name != '*':
+                        name = alias.asname or alias.name
+                        aliases[name] = f'{source}.{alias.name}'
+
+        return aliases
+
+    def get_base_names(self, classdef) -> list[str]:
+
+        names = []
+
+        for base in classdef.bases:
+
+            if isinstance(base, ast.Subscript):
+                base = base.value
+
+            if isinstance(base, (ast.Name, ast.Attribute)):
+                names.append(ast.unparse(base))
+
+        return [
+            name for name in names if name != 'object'
+        ]
+
+    def qualify(self, name, aliases) -> str:
+        head, dot, tail = name.partition('.')
+        if head in aliases:
+            return aliases[head] + dot + tail
+        return name
+
+    def resolve(self):
+        """Resolves bases to defining modules and maps subclasses.
+        """
+
+        self.bases = {
+            name: list(dict.fromkeys(map(self.follow, bases)))
+            for name, bases in self._rawbases.items()
+        }
+
+        self.derived = {}
+
+        for name, bases in self.bases.items():
+            for base in bases:
+                self.derived.setdefault(base, set()).add(name)
+
+        self._subclasses.clear()
+        self._ancestors.clear()
+
+    def follow(self, target) -> str:
+        """Follows re-exports of a name to the class definition.
+        """
+
+        for _ in range(MAXHOPS):
+
+            if target in self._rawbases:
+                return target
+
+            modname, _, attr = target.rpartition('.')
+            aliases = self._aliases.get(modname, {})
+
+            if attr not in aliases:
+                return target
+
+            target = aliases[attr]
+
+        return target
+
+    def getsubclasses(self, name) -> frozenset:
+        """Returns subclasses of a class, direct or not.
+        """
+
+        if name in self._subclasses:
+            return self._subclasses[name]
+
+        found = set()
+        stack = list(self.derived.get(name, ()))
+
+        while stack:
+
+            subname = stack.pop()
+
+            if subname in found:
+                continue
+
+            found.add(subname)
+
+            if subname in self._subclasses:
+                found.update(self._subclasses[subname])
+            else:
+                stack.extend(self.derived.get(subname, ()))
+
+        found.discard(name)
+
+        self._subclasses[name] = frozenset(found)
+        return self._subclasses[name]
+
+    def getancestors(self, name) -> list[str]:
+        """Returns bases of a class, direct or not, in the MRO order.
+
+        - The order is found by C3 linearization, as in python.
+        - For inconsistent hierarchies, the depth-first order is used.
+
+        """
+
+        if name in self._ancestors:
+            return list(self._ancestors[name])
+
+        # Guards against cycles of broken code.
+        self._ancestors[name] = ()
+
+        bases = self.bases.get(name, [])
+
+        seqs = [
+            [base, *self.getancestors(base)] for base in bases
+        ]
+
+        ancestors = merge_c3([*seqs, list(bases)])
+
+        if ancestors is None:
+            ancestors = list(
+                dict.fromkeys(item for seq in seqs for item in seq)
+            )
+
+        ancestors = [
+            ancestor for ancestor in ancestors if ancestor != name
+        ]
+
+        self._ancestors[name] = tuple(ancestors)
+        return ancestors
+
+    def getroots(self) -> list[str]:
+        """Returns bases that are not subclasses of other indexed classes.
+        """
+
+        return sorted(
+            name for name in self.derived if not self.bases.get(name)
+        )
+
+    def maketrees(self) -> list[deeptrees.TreeNode]:
+        return [
+            self.make_tree(name, set()) for name in self.getroots()
+        ]
+
+    def make_tree(self, name, path) -> deeptrees.TreeNode:
+
+        node = deeptrees.TreeNode(name)
+        subnames = sorted(self.derived.get(name, ()))
+
+        if subnames and name not in path:
+            node.children = [
+                self.make_tree(subname, path | {name})
+                for subname in subnames
+            ]
+
+        return node
+
+
+def merge_c3(seqs) -> list[str] | None:
+    """Merges linearizations of bases, None if they are inconsistent.
+    """
+
+    seqs = [list(seq) for seq in seqs if seq]
+    result = []
+
+    while seqs:
+
+        for seq in seqs:
+            head = seq[0]
+            if not any(head in other[1:] for other in seqs):
+                break
+        else:
+            return None
+
+        result.append(head)
+
+        seqs = [
+            seq[1:] if seq[0] == head else seq for seq in seqs
+        ]
+
+        seqs = [seq for seq in seqs if seq]
+
+    return result
+
+
+class ClassesReporter:
+    """Renders the inheritance index as MD.
+    """
+
+    def __init__(self):
+        self._index = None
+
+    def make_report(self, index) -> str:
+
+        self._index = index
+
+        return self.assemble(
+            self.make_trees(),
+            self.make_ranking()
+        )
+
+    def make_trees(self) -> str:
+
+        roots = self._index.maketrees()
+
+        if not roots:
+            return '## Class trees\n\nNo subclasses.'
+
+        views = '\n\n'.join(
+            map(treeastxt.dumptree_txt, roots)
+        )
+
+        return self.assemble(
+            '## Class trees', f'```class-trees\n{views}\n```'
+        )
+
+    def make_ranking(self) -> str:
+
+        index = self._index
+
+        names = sorted(
+            index.derived,
+            key=lambda name: (-len(index.getsubclasses(name)), name)
+        )
+
+        rows = [
+            [
+                name,
+                str(len(index.derived[name])),
+                str(len(index.getsubclasses(name))),
+                self.get_origin(name)
+            ]
+            for name in names[:TOPCOUNT]
+        ]
+
+        if not rows:
+            return ''
+
+        headers = ['class', 'direct', 'all', 'origin']
+
+        return self.assemble(
+            '## Most subclassed', self.make_table(headers, rows)
+        )
+
+    def get_origin(self, name) -> str:
+        if name in self._index.bases:
+            return 'package'
+        return 'external'
+
+    def make_table(self, headers, rows) -> str:
+        return tableasmd.maketablemd(
+            list(map(list, zip(headers, *rows)))
+        )
+
+    def assemble(self, *parts) -> str:
+        return '\n\n'.join(
+            filter(len, parts)
+        )
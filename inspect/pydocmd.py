@@ -5,6 +5,7 @@
 import json
 from . import pydump
 from ..docpage import npdocs
+from ..utils import tableasmd, tracing
 
 __all__ = [
     'funcstomd', 'classtomd'
@@ -21,8 +22,9 @@ def modtomd(pymod, meta=None, npstyle=True, clsverbs=0) -> str:
 
     Parameters
     ----------
-    pymod : module
+    pymod : module | ModuleStub
         A python module to be documented.
+        Static modules come from `pystatic.loadmodule()`.
     meta : dict = None
         Specifies JSON metadata of the output document.
     npstyle : bool = True
@@ -38,6 +40,58 @@ def modtomd(pymod, meta=None, npstyle=True, clsverbs=0) -> str:
 
     """
 
+    with tracing.span('modtomd', file=pymod.__name__) as args:
+        text = dump_module(pymod, meta, npstyle, clsverbs)
+        args['bytes'] = len(text)
+
+    return text
+
+
+def modtomds(pymod, meta=None, npstyle=True, clsverbs=0,
+             maxclasses=None, maxclasssize=None) -> dict:
+    """Dumps a module in MD, large classes are put on their own pages.
+
+    Parameters
+    ----------
+    pymod : module | ModuleStub
+        A python module to be documented.
+    meta : dict = None
+        Specifies JSON metadata of the output documents.
+    npstyle : bool = True
+        Expects numpy style docstrings, if True.
+    clsverbs : int = 0
+        Verbosity of classes from 0 to 2.
+    maxclasses : int = None
+        If a module has more classes, each class gets its own page.
+    maxclasssize : int = None
+        Classes with longer MD entries (in characters)
+        get their own pages.
+
+    Returns
+    -------
+    dict
+        Names of pages mapped to MD documents, the module page first.
+        Class pages are named MODULE.CLASS, the module page keeps
+        the table of these classes with links.
+
+    """
+
+    splitter = ClassesSplitter(maxclasses, maxclasssize)
+
+    with tracing.span('modtomd', file=pymod.__name__) as args:
+        pages = dump_module_pages(pymod, meta, npstyle, clsverbs, splitter)
+        args['bytes'] = sum(map(len, pages.values()))
+
+    return pages
+
+
+def dump_module(pymod, meta, npstyle, clsverbs) -> str:
+    pages = dump_module_pages(pymod, meta, npstyle, clsverbs)
+    return pages[pymod.__name__]
+
+
+def dump_module_pages(pymod, meta, npstyle, clsverbs, splitter=None) -> dict:
+
     name = pymod.__name__
     docs = pymod.__doc__ or ''
 
@@ -52,13 +106,59 @@ def modtomd(pymod, meta=None, npstyle=True, clsverbs=0) -> str:
 
     meta = get_metaformd(meta)
 
+    members = pydump.filter_mod_members(
+        pydump.get_mod_members(pymod)
+    )
+
+    entries = [
+        (obj, dumper.dumpobj(obj)) for obj in members
+    ]
+
+    classes = splitter.select(entries) if splitter else []
+
     heading = '# ' + name
-    entries = pydump.docmod_with_dumper(pymod, dumper)
+    table = make_classes_table(name, classes)
 
-    parts = [
-        meta, heading, docs, entries
+    kept = [
+        entry for obj, entry in entries if obj not in classes
     ]
 
+    pages = {
+        name: assemble(meta, heading, docs, table, *kept)
+    }
+
+    for obj, entry in entries:
+        if obj in classes:
+            pagename = f'{name}.{obj.__name__}'
+            pages[pagename] = assemble(meta, '# ' + pagename, entry)
+
+    return pages
+
+
+def make_classes_table(modname, classes) -> str:
+    """Returns the table of classes documented on their own pages.
+    """
+
+    if not classes:
+        return ''
+
+    links = [
+        f'<a href="{modname}.{obj.__name__}.md">{obj.__name__}</a>'
+        for obj in classes
+    ]
+
+    infos = [
+        obj.__doc__.strip().partition('\n')[0] for obj in classes
+    ]
+
+    table = tableasmd.maketablemd(
+        [['Name', *links], ['Description', *infos]]
+    )
+
+    return '<i>Classes</i>\n\n' + table
+
+
+def assemble(*parts) -> str:
     return '\n\n'.join(
         filter(len, parts)
     )
@@ -181,6 +281,37 @@ def get_metaformd(meta):
     return f'<!--\n{meta}\n-->'
 
 
+class ClassesSplitter:
+    """Selects classes documented on their own pages.
+
+    - All classes, if a module has more than `maxclasses`.
+    - Otherwise, classes with entries longer than `maxsize`.
+
+    """
+
+    def __init__(self, maxclasses=None, maxsize=None):
+        self.maxclasses = maxclasses
+        self.maxsize = maxsize
+
+    def select(self, entries) -> list:
+        """Returns classes from pairs (object, MD entry).
+        """
+
+        classes = [
+            (obj, entry) for obj, entry in entries if pydump.isclass(obj)
+        ]
+
+        if self.maxclasses is not None and len(classes) > self.maxclasses:
+            return [obj for obj, _ in classes]
+
+        if self.maxsize is None:
+            return []
+
+        return [
+            obj for obj, entry in classes if len(entry) > self.maxsize
+        ]
+
+
 class DumperMD:
     """Base class for MD dumpers.
     """
@@ -5,6 +5,7 @@
 from abc import ABC
 from abc import abstractmethod
 import inspect
+from . import pystatic
 
 __all__ = [
     'classfuncs'
@@ -43,8 +44,8 @@ def docmod_with_dumper(pymod, dumper) -> str:
 
     Parameters
     ----------
-    pymod : module
-        Python module to be documented.
+    pymod : module | ModuleStub
+        Python module to be documented (live or static).
     dumper : ObjectDumper
         Runtime dumper for module members.
 
@@ -72,13 +73,59 @@ def get_mod_members(module):
     """Selects functions and classes from the module.
     """
 
-    for val in module.__dict__.values():
-        if inspect.isfunction(val):
+    for val in get_mod_namespace(module).values():
+        if isfunction(val):
             yield val
-        if inspect.isclass(val):
+        if isclass(val):
             yield val
 
 
+def get_mod_namespace(module) -> dict:
+
+    if isinstance(module, pystatic.ModuleStub):
+        return module.namespace
+
+    if '__getattr__' in vars(module):
+        return get_lazy_namespace(module)
+
+    return module.__dict__
+
+
+def get_lazy_namespace(module) -> dict:
+    """Loads names served by a module-level `__getattr__`.
+
+    - Names from `__all__` come first and keep their order.
+    - The order does not depend on the order of first access.
+
+    """
+
+    names = getattr(module, '__all__', [])
+
+    lazynames = {
+        name: getattr(module, name) for name in names
+    }
+
+    return lazynames | {
+        name: val for name, val in vars(module).items() if name not in lazynames
+    }
+
+
+def isfunction(obj) -> bool:
+    """Checks for a function (live or static).
+    """
+    if isinstance(obj, pystatic.FuncStub):
+        return True
+    return inspect.isfunction(obj)
+
+
+def isclass(obj) -> bool:
+    """Checks for a class (live or static).
+    """
+    if isinstance(obj, pystatic.ClassStub):
+        return True
+    return inspect.isclass(obj)
+
+
 def filter_mod_members(members) -> list:
 
     def is_member(obj):
@@ -281,9 +328,9 @@ class ObjectDumper:
         self.classdumper = None
 
     def dumpobj(self, obj) -> str:
-        if inspect.isfunction(obj):
+        if isfunction(obj):
             return self.functomd(obj)
-        if inspect.isclass(obj):
+        if isclass(obj):
             return self.classtomd(obj)
         return ''
 
@@ -371,6 +418,10 @@ class ClassExplorer:
         return methods
 
     def fetch_methods(self, pycls) -> list:
+
+        if isinstance(pycls, pystatic.ClassStub):
+            return list(pycls.methods)
+
         members = self.only_locals(pycls)
         members = self.unfold_clsmethods(members)
         return members
@@ -476,6 +527,10 @@ class SignPrinter:
         return obj
 
     def render_signature(self, obj):
+
+        if pystatic.isstub(obj):
+            return obj.signature
+
         return str(
             inspect.signature(obj)
         )
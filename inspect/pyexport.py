@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""Exports records of python scripts as JSON lines.
+
+- One JSON object per module, written as soon as the module is parsed.
+- Records are read back lazily, one module at a time.
+- Scripts that can not be decoded or parsed are exported as error lines.
+
+"""
+
+import os
+import json
+import contextlib
+
+from . import pyparser
+from . import pyrecords
+from . import pyimports
+
+__all__ = [
+    'dumprecords', 'loadrecords'
+]
+
+
+def apiobj(obj):
+    obj.__module__ = 'docspyer'
+    return obj
+
+
+@apiobj
+def dumprecords(pkgpath, out) -> int:
+    """Streams parsed records of package modules as JSON lines.
+
+    Parameters
+    ----------
+    pkgpath : str
+        Path to the package directory.
+    out : str | file
+        Path to the output file (.jsonl) or writable text file,
+        e.g. `sys.stdout`.
+
+    Returns
+    -------
+    int
+        Number of exported modules.
+
+    Notes
+    -----
+
+    - Each line holds the module name, path (relative to the parent
+      of the package), docstring, imports, functions and classes.
+    - Folders starting with dots or underscores are skipped.
+
+    """
+
+    if not os.path.isdir(pkgpath):
+        raise FileNotFoundError(
+            f"package folder does not exist: '{pkgpath}'"
+        )
+
+    with open_output(out) as stream:
+        exporter = RecordsExporter(stream)
+        return exporter.export(pkgpath)
+
+
+@apiobj
+def loadrecords(source):
+    """Yields module records from JSON lines made by `dumprecords()`.
+
+    Parameters
+    ----------
+    source : str | file
+        Path to the JSON-lines file or readable text file.
+
+    Yields
+    ------
+    ModuleRecord
+        Records of modules, error lines are skipped.
+
+    """
+
+    decoder = RecordDecoder()
+
+    with open_input(source) as stream:
+        for line in stream:
+
+            if not line.strip():
+                continue
+
+            data = json.loads(line)
+
+            if 'error' in data:
+                continue
+
+            yield decoder.decode_module(data)
+
+
+@contextlib.contextmanager
+def open_output(out):
+
+    if hasattr(out, 'write'):
+        yield out
+        return
+
+    with open(out, encoding='utf-8', mode='w') as stream:
+        yield stream
+
+
+@contextlib.contextmanager
+def open_input(source):
+
+    if hasattr(source, 'read'):
+        yield source
+        return
+
+    with open(source, encoding='utf-8') as stream:
+        yield stream
+
+
+class RecordsExporter:
+    """Parses modules of a package and writes them one per line.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.encoder = RecordEncoder()
+
+    def export(self, pkgpath) -> int:
+
+        fetcher = pyimports.ModulesFetcher()
+        rootpath = os.path.dirname(os.path.abspath(pkgpath))
+
+        count = 0
+
+        for filepath, name, _ in fetcher.walk_scripts(pkgpath):
+
+            relpath = os.path.relpath(filepath, rootpath)
+            data = self.make_line_data(filepath, name)
+
+            data['path'] = relpath.replace(os.sep, '/')
+
+            self.write_line(data)
+            count += 1
+
+        return count
+
+    def make_line_data(self, filepath, name) -> dict:
+
+        # Decoding errors and null bytes raise ValueError.
+        try:
+            with open(filepath, encoding='utf-8') as file:
+                source = file.read()
+            modrec = pyparser.parsescript(source, name)
+        except (SyntaxError, ValueError) as exc:
+            return {'name': name, 'error': self.format_error(exc)}
+
+        return self.encoder.encode_module(modrec)
+
+    def format_error(self, exc) -> str:
+        if isinstance(exc, SyntaxError):
+            return f'SyntaxError: {exc.msg}'
+        return f'{type(exc).__name__}: {exc}'
+
+    def write_line(self, data):
+        self.stream.write(
+            json.dumps(data, ensure_ascii=False) + '\n'
+        )
+        self.stream.flush()
+
+
+class RecordEncoder:
+    """Converts records to JSON-compatible dicts.
+    """
+
+    def encode_module(self, modrec) -> dict:
+        return {
+            'name': modrec.name,
+            'docs': modrec.docs,
+            'imports': modrec.imports,
+            'aliases': modrec.aliases,
+            'funcs': self.encode_funcs(modrec.funcs),
+            'classes': [
+                self.encode_class(classrec)
+                for classrec in modrec.classes.values()
+            ]
+        }
+
+    def encode_class(self, classrec) -> dict:
+        return {
+            'name': classrec.name,
+            'docs': classrec.docs,
+            'bases': classrec.bases,
+            'signature': classrec.signature,
+            'funcs': self.encode_funcs(classrec.funcs)
+        }
+
+    def encode_funcs(self, funcs) -> list[dict]:
+        return list(
+            map(self.encode_func, funcs.values())
+        )
+
+    def encode_func(self, funcrec) -> dict:
+        return {
+            'name': funcrec.name,
+            'docs': funcrec.docs,
+            'signature': funcrec.signature,
+            'lineno': funcrec.lineno,
+            'isasync': funcrec.isasync,
+            'calls': funcrec.calls,
+            'callsites': list(
+                map(self.encode_callsite, funcrec.callsites)
+            )
+        }
+
+    def encode_callsite(self, site) -> dict:
+        return {
+            'name': site.name,
+            'lineno': site.lineno,
+            'depth': site.depth,
+            'intry': site.intry,
+            'awaited': site.awaited
+        }
+
+
+class RecordDecoder:
+    """Restores records from dicts made by `RecordEncoder`.
+    """
+
+    def decode_module(self, data) -> pyrecords.ModuleRecord:
+
+        modrec = pyrecords.ModuleRecord()
+
+        modrec.name = data['name']
+        modrec.docs = data['docs']
+        modrec.imports = data['imports']
+        modrec.aliases = data.get('aliases', {})
+        modrec.funcs = self.decode_funcs(data['funcs'])
+        modrec.classes = self.make_namespace(
+            map(self.decode_class, data['classes'])
+        )
+
+        return modrec
+
+    def decode_class(self, data) -> pyrecords.ClassRecord:
+
+        classrec = pyrecords.ClassRecord()
+
+        classrec.name = data['name']
+        classrec.docs = data['docs']
+        classrec.bases = data['bases']
+        classrec.signature = data['signature']
+        classrec.funcs = self.decode_funcs(data['funcs'])
+
+        return classrec
+
+    def decode_funcs(self, items) -> dict:
+        return self.make_namespace(
+            map(self.decode_func, items)
+        )
+
+    def decode_func(self, data) -> pyrecords.FuncRecord:
+
+        funcrec = pyrecords.FuncRecord()
+
+        funcrec.name = data['name']
+        funcrec.docs = data['docs']
+        funcrec.signature = data['signature']
+        funcrec.lineno = data['lineno']
+        funcrec.isasync = data['isasync']
+        funcrec.calls = data['calls']
+        funcrec.callsites = list(
+            map(self.decode_callsite, data['callsites'])
+        )
+
+        return funcrec
+
+    def decode_callsite(self, data) -> pyrecords.CallSite:
+
+        site = pyrecords.CallSite(
+            data['name'], data['lineno'], data['depth'], data['intry']
+        )
+
+        site.awaited = data['awaited']
+
+        return site
+
+    def make_namespace(self, records) -> dict:
+        return {
+            record.name: record for record in records
+        }
@@ -0,0 +1,504 @@
+# -*- coding: utf-8 -*-
+"""Analyzes imports between modules of a python package.
+
+- Top-level imports of modules make the intra-package import graph.
+- Cycles are found as strongly connected components (Tarjan).
+- Each module gets its transitive import closure.
+- Times from `python -X importtime` rank modules by import costs.
+
+"""
+
+import os
+import re
+import ast
+
+from . import pyparser
+from . import pyoutline
+from ..utils import tableasmd
+
+__all__ = [
+    'analyzeimports', 'loadimporttime', 'ImportGraph'
+]
+
+IMPORTTIME = re.compile(
+    r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)\s*$'
+)
+
+TOPCOUNT = 20
+
+
+def analyzeimports(pkgpath, importtime=None) -> str:
+    """Makes an MD report on imports between modules of a package.
+
+    Parameters
+    ----------
+    pkgpath : str
+        Path to the package directory.
+    importtime : str = None
+        Path to a log of `python -X importtime` (stderr) to rank
+        modules by import times.
+
+    Returns
+    -------
+    str
+        The resulting report in MD.
+
+    """
+
+    graph = ImportGraph()
+    graph.set_modules(pkgpath)
+
+    times = loadimporttime(importtime) if importtime else None
+
+    reporter = ImportsReporter()
+    return reporter.make_report(graph, times)
+
+
+def loadimporttime(filepath) -> dict:
+    """Reads import times from a log of `python -X importtime`.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the log.
+
+    Returns
+    -------
+    dict
+        Module names mapped to (self, cumulative) times in microseconds.
+
+    """
+
+    if not os.path.isfile(filepath):
+        raise FileNotFoundError(
+            f"importtime log does not exist: '{filepath}'"
+        )
+
+    with open(filepath, encoding='utf-8') as file:
+        return parse_importtime(file.read())
+
+
+def parse_importtime(text) -> dict:
+    """Maps module names to (self, cumulative) times from a log.
+    """
+
+    times = {}
+
+    for line in text.splitlines():
+
+        matchobj = IMPORTTIME.match(line)
+
+        if matchobj is None:
+            continue
+
+        selftime, cumtime, _, name = matchobj.groups()
+        times[name] = (int(selftime), int(cumtime))
+
+    return times
+
+
+class ModuleImports:
+    """Top-level imports of a module.
+
+    Attributes
+    ----------
+    name : str
+        Dotted name of the module.
+    ispkg : bool
+        True for `__init__` scripts.
+    imports : list[str]
+        Imported names (relative names start with dots).
+
+    """
+
+    def __init__(self, name, ispkg, imports):
+        self.name = name
+        self.ispkg = ispkg
+        self.imports = imports
+
+    def getbase(self) -> str:
+        """Returns the package that relative imports start from.
+        """
+        if self.ispkg:
+            return self.name
+        return self.name.rpartition('.')[0]
+
+
+class ImportTargetsRecorder(pyparser.ImportsRecorder):
+    """Records imported names without aliases.
+    """
+
+    def get_alias_name(self, alias) -> str:
+        return alias.name
+
+
+class ImportGraph:
+    """Import graph of modules of a package.
+
+    Attributes
+    ----------
+    modules : dict
+        Dotted names of modules mapped to their imports.
+    edges : dict
+        Dotted names of modules mapped to imported package modules.
+
+    """
+
+    def __init__(self):
+        self.modules = {}
+        self.edges = {}
+
+    def set_modules(self, pkgpath):
+
+        fetcher = ModulesFetcher()
+        modules = fetcher.fetch_modules(pkgpath)
+
+        self.modules = {
+            module.name: module for module in modules
+        }
+
+        self.edges = {
+            module.name: self.resolve_imports(module) for module in modules
+        }
+
+    def resolve_imports(self, module) -> list[str]:
+
+        targets = {
+            self.resolve_name(name, module) for name in module.imports
+        }
+
+        targets.discard(None)
+        targets.discard(module.name)
+
+        return sorted(targets)
+
+    def resolve_name(self, name, module) -> str | None:
+        """Returns the package module an imported name belongs to.
+        """
+
+        dotted = self.make_absolute(name, module)
+
+        while dotted:
+            if dotted in self.modules:
+                return dotted
+            dotted = dotted.rpartition('.')[0]
+
+        return None
+
+    def make_absolute(self, name, module) -> str:
+
+        level = len(name) - len(name.lstrip('.'))
+
+        if not level:
+            return name
+
+        base = module.getbase().split('.')
+        base = base[:len(base) - level + 1]
+
+        return '.'.join(
+            filter(len, [*base, name[level:]])
+        )
+
+    def cycles(self) -> list[list[str]]:
+        """Returns groups of modules that import each other.
+        """
+
+        components = TarjanSCC().find(self.edges)
+
+        return sorted(
+            sorted(component) for component in components
+            if len(component) > 1
+        )
+
+    def closure(self, name) -> list[str]:
+        """Returns modules imported by a module, directly or not.
+        """
+
+        seen = set()
+        stack = list(self.edges.get(name, []))
+
+        while stack:
+
+            target = stack.pop()
+
+            if target in seen:
+                continue
+
+            seen.add(target)
+            stack.extend(self.edges.get(target, []))
+
+        seen.discard(name)
+
+        return sorted(seen)
+
+
+class ModulesFetcher:
+    """Collects top-level imports of modules of a package.
+
+    - Folders starting with dots or underscores are skipped.
+
+    """
+
+    def fetch_modules(self, pkgpath) -> list[ModuleImports]:
+        return [
+            self.read_module(filepath, name, ispkg)
+            for filepath, name, ispkg in self.walk_scripts(pkgpath)
+        ]
+
+    def walk_scripts(self, pkgpath):
+        """Yields paths, dotted names and package flags of scripts.
+        """
+
+        pkgpath = os.path.abspath(pkgpath)
+        pkgname = os.path.basename(pkgpath)
+
+        for dirpath, dirnames, filenames in os.walk(pkgpath):
+
+            dirnames[:] = sorted(
+                filter(self.is_eligible_folder, dirnames)
+            )
+
+            hostname = self.make_hostname(pkgpath, pkgname, dirpath)
+
+            for filename in sorted(filenames):
+                if filename.endswith('.py'):
+                    yield self.make_script_item(dirpath, filename, hostname)
+
+    def is_eligible_folder(self, name) -> bool:
+        return not name.startswith(('.', '_'))
+
+    def make_hostname(self, pkgpath, pkgname, dirpath) -> str:
+
+        relpath = os.path.relpath(dirpath, pkgpath)
+
+        if relpath == os.curdir:
+            return pkgname
+
+        return '.'.join(
+            [pkgname, *relpath.split(os.sep)]
+        )
+
+    def make_script_item(self, dirpath, filename, hostname) -> tuple:
+
+        ispkg = filename == '__init__.py'
+        basename = filename.removesuffix('.py')
+
+        name = hostname if ispkg else f'{hostname}.{basename}'
+
+        return os.path.join(dirpath, filename), name, ispkg
+
+    def read_module(self, filepath, name, ispkg) -> ModuleImports:
+
+        with open(filepath, encoding='utf-8') as file:
+            source = file.read()
+
+        return ModuleImports(
+            name, ispkg, self.get_imports(source)
+        )
+
+    def get_imports(self, source) -> list[str]:
+
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return []
+
+        # Conditional imports (try, if TYPE_CHECKING) are included.
+        astimports = pyoutline.HeaderScanner().fetch_imports(tree.body)
+
+        return ImportTargetsRecorder().make_record(astimports)
+
+
+class TarjanSCC:
+    """Finds strongly connected components of a graph (iterative).
+    """
+
+    def find(self, edges) -> list[list[str]]:
+
+        index = {}
+        lowlink = {}
+        onstack = set()
+        stack = []
+        components = []
+
+        for root in edges:
+
+            if root in index:
+                continue
+
+            work = [(root, iter(edges.get(root, [])))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            onstack.add(root)
+
+            while work:
+
+                node, targets = work[-1]
+                target = next(targets, None)
+
+                if target is None:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        components.append(
+                            self.pop_component(node, stack, onstack)
+                        )
+                    continue
+
+                if target not in index:
+                    index[target] = lowlink[target] = len(index)
+                    stack.append(target)
+                    onstack.add(target)
+                    work.append((target, iter(edges.get(target, []))))
+                elif target in onstack:
+                    lowlink[node] = min(lowlink[node], index[target])
+
+        return components
+
+    def pop_component(self, node, stack, onstack) -> list[str]:
+
+        component = []
+
+        while True:
+            member = stack.pop()
+            onstack.discard(member)
+            component.append(member)
+            if member == node:
+                return component
+
+
+class ImportsReporter:
+    """Renders the import analysis as MD.
+    """
+
+    def __init__(self):
+        self._graph = None
+        self._times = None
+
+    def make_report(self, graph, times=None) -> str:
+
+        self._graph = graph
+        self._times = times
+
+        return self.assemble(
+            self.make_cycles(),
+            self.make_closures(),
+            self.make_ranking('cumulative', index=1),
+            self.make_ranking('self', index=0)
+        )
+
+    def make_cycles(self) -> str:
+
+        cycles = self._graph.cycles()
+
+        if not cycles:
+            return '## Import cycles\n\nNo import cycles.'
+
+        blocks = [
+            self.make_cycle_block(cycle) for cycle in cycles
+        ]
+
+        return self.assemble('## Import cycles', *blocks)
+
+    def make_cycle_block(self, cycle) -> str:
+
+        lines = [
+            f'{name} → ' + ', '.join(self.get_cycle_targets(name, cycle))
+            for name in cycle
+        ]
+
+        return '```imports-view\n' + '\n'.join(lines) + '\n```'
+
+    def get_cycle_targets(self, name, cycle) -> list[str]:
+        return [
+            target for target in self._graph.edges[name]
+            if target in cycle
+        ]
+
+    def make_closures(self) -> str:
+
+        names = sorted(
+            self._graph.edges,
+            key=lambda name: (-len(self._graph.closure(name)), name)
+        )
+
+        rows = list(
+            map(self.make_closure_row, names)
+        )
+
+        headers = ['module', 'imports', 'closure']
+
+        if self._times is not None:
+            headers.append('closure self, ms')
+
+        return self.assemble(
+            '## Import closures', self.make_table(headers, rows)
+        )
+
+    def make_closure_row(self, name) -> list[str]:
+
+        closure = self._graph.closure(name)
+
+        row = [
+            name,
+            str(len(self._graph.edges[name])),
+            str(len(closure))
+        ]
+
+        if self._times is not None:
+            row.append(
+                self.format_ms(self.sum_self_times([name, *closure]))
+            )
+
+        return row
+
+    def sum_self_times(self, names) -> int:
+        return sum(
+            self._times.get(name, (0, 0))[0] for name in names
+        )
+
+    def make_ranking(self, label, index) -> str:
+
+        if not self._times:
+            return ''
+
+        names = sorted(
+            self._times,
+            key=lambda name: (-self._times[name][index], name)
+        )
+
+        rows = [
+            [
+                name,
+                self.format_ms(self._times[name][0]),
+                self.format_ms(self._times[name][1]),
+                self.get_origin(name)
+            ]
+            for name in names[:TOPCOUNT]
+        ]
+
+        headers = ['module', 'self, ms', 'cumulative, ms', 'origin']
+
+        return self.assemble(
+            f'## Slowest imports ({label})', self.make_table(headers, rows)
+        )
+
+    def get_origin(self, name) -> str:
+        if name in self._graph.modules:
+            return 'package'
+        return 'external'
+
+    def format_ms(self, microseconds) -> str:
+        return f'{microseconds / 1e3:.2f}'
+
+    def make_table(self, headers, rows) -> str:
+        return tableasmd.maketablemd(
+            list(map(list, zip(headers, *rows)))
+        )
+
+    def assemble(self, *parts) -> str:
+        return '\n\n'.join(
+            filter(len, parts)
+        )
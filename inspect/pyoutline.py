@@ -3,6 +3,8 @@
 """
 
 import re
+import ast
+
 from . import pyparser
 from ..utils import namespace
 from ..utils import tableasmd
@@ -203,34 +205,268 @@ class ScriptSketcher:
 
     def make_sketch(self, script):
 
-        header = self.fetch_header(script.source)
-        record = self.parse_header(header)
-
-        name = script.name
-        docs = record.docs or ''
-        imports = record.imports
+        scanner = HeaderScanner()
+        docs, imports = scanner.scan(script.source)
 
         return ScriptSketch(
-            name, docs, imports
+            script.name, docs, imports
         )
 
-    def fetch_header(self, pytext):
-        header_start = self.find_first_def_or_class(pytext)
-        return pytext[0:header_start]
 
-    def parse_header(self, header):
-        return pyparser.parsescript(header)
+class HeaderScanner:
+    """Scans a script for its docstring and module-level imports.
 
-    def find_first_def_or_class(self, pytext) -> int:
+    - The script is split into top-level blocks by unindented lines.
+    - Blocks of functions and classes are skipped, never compiled.
+    - Other blocks are compiled only if they may contain imports,
+      conditional imports and imports after definitions are kept.
+    - If blocks are split wrongly, the whole script is compiled.
 
-        matchobj = re.search(
-            '^(@\w|def\s|class\s)', pytext, flags=re.MULTILINE
-        )
+    """
+
+    CODESTART = re.compile(r'[^\s#)\]}]')
+    BLOCKSTART = re.compile(r'\n(?=[^\s#)\]}])')
+    IMPORTLINE = re.compile(r'^[ \t]*(import|from)\b', flags=re.MULTILINE)
+    DEFLINE = re.compile(r'(@|(async\s+)?(def|class)\b)')
+    OPENMARK = re.compile(r'"""|\'\'\'|[(\[{]')
+    DOCSTART = re.compile(r'([ \t]*(#.*)?\n)*[rRuU]?[\'"]')
+    NEXTCLAUSE = re.compile(r'(else|elif|except|finally)\b')
+
+    DEFNODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+    BODIES = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+    def scan(self, source) -> tuple[str, list[str]]:
+        """Returns the docstring and imported names of a script.
+        """
+
+        blocks = self.split_blocks(source)
+
+        try:
+            return self.scan_blocks(blocks)
+        except SyntaxError:
+            return self.scan_module(ast.parse(source))
+
+    def scan_blocks(self, blocks) -> tuple[str, list[str]]:
+
+        docs = ''
+        astimports = []
+
+        for count, text in enumerate(self.select_chunks(blocks)):
+
+            astmodule = ast.parse(text)
+
+            if count == 0 and self.DOCSTART.match(blocks[0]):
+                docs = ast.get_docstring(astmodule) or ''
+
+            astimports.extend(
+                self.fetch_imports(astmodule.body)
+            )
+
+        return docs, self.record_imports(astimports)
+
+    def select_chunks(self, blocks) -> list[str]:
+        """Joins consecutive blocks to compile, skips other blocks.
+
+        - The first block may have the docstring (a string).
+        - Other blocks are compiled, if they may have imports.
+
+        """
+
+        chunks = []
+        joining = False
+
+        for count, text in enumerate(blocks):
+
+            if self.DEFLINE.match(text):
+                selected = False
+            elif count == 0 and self.DOCSTART.match(text):
+                selected = True
+            else:
+                selected = self.has_imports(text)
+
+            if selected and joining:
+                chunks[-1] += text
+            elif selected:
+                chunks.append(text)
+
+            joining = selected
+
+        return chunks
+
+    def scan_module(self, astmodule) -> tuple[str, list[str]]:
+
+        docs = ast.get_docstring(astmodule) or ''
+        astimports = self.fetch_imports(astmodule.body)
+
+        return docs, self.record_imports(astimports)
+
+    def fetch_imports(self, nodes) -> list:
+        """Returns import nodes outside of functions and classes.
+        """
+
+        astimports = []
+
+        for node in nodes:
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                astimports.append(node)
+            elif not isinstance(node, self.DEFNODES):
+                astimports.extend(
+                    self.fetch_imports(self.get_substatements(node))
+                )
+
+        return astimports
+
+    def get_substatements(self, node) -> list:
+        """Returns statements of compound statements (if, try, ...).
+        """
+
+        statements = []
+
+        for field in self.BODIES:
+            statements.extend(
+                getattr(node, field, [])
+            )
+
+        return statements
+
+    def record_imports(self, astimports) -> list[str]:
+        recorder = pyparser.ImportsRecorder()
+        return recorder.make_record(astimports)
+
+    def split_blocks(self, source) -> list[str]:
+        """Splits a script into top-level statements (with bodies).
+
+        - Lines inside strings or brackets are checked only around
+          statements to compile (the first one and imports).
+
+        """
+
+        starts = [
+            matchobj.end() for matchobj in self.BLOCKSTART.finditer(source)
+        ]
 
-        if matchobj is None:
-            return len(pytext)
+        # Leading comments go to the first statement.
+        if starts and not self.CODESTART.match(source):
+            starts[0] = 0
+        else:
+            starts.insert(0, 0)
 
-        return matchobj.start()
+        blocks = []
+        checked = 0
+        selected = False
+
+        for start, end in zip(starts, [*starts[1:], len(source)]):
+
+            if blocks and self.is_continued(source, start):
+                blocks[-1][1] = end
+                continue
+
+            # Imports in functions and classes are skipped.
+            hasimports = not self.DEFLINE.match(source, start) and (
+                self.has_imports(source, start, end)
+            )
+
+            if hasimports or selected:
+
+                head = blocks[checked][0] if blocks[checked:] else start
+
+                if self.is_inside(source, head, start, blocks):
+                    blocks[checked:] = [[head, end]]
+                    selected = True
+                    continue
+
+                checked = len(blocks)
+
+            blocks.append([start, end])
+            selected = hasimports or len(blocks) == 1
+
+        return [
+            source[start:end] for start, end in blocks
+        ]
+
+    def is_continued(self, source, start) -> bool:
+        """Checks if a line continues the previous statement.
+        """
+
+        if self.NEXTCLAUSE.match(source, start):
+            return True
+
+        if self.DEFLINE.match(source, start):
+            return self.is_decorated(source, start)
+
+        return source.endswith(('\\\n', '\\\r\n'), 0, start)
+
+    def is_decorated(self, source, start) -> bool:
+        linestart = source.rfind('\n', 0, start-1) + 1
+        return source.startswith('@', linestart)
+
+    def is_inside(self, source, head, start, blocks) -> bool:
+        """Checks if a segment is inside a string or brackets.
+
+        - Strings are checked from the last checked statement.
+        - Brackets are checked in the previous statement, if it
+          is not a definition (brackets in strings are counted).
+
+        """
+
+        if not self.OPENMARK.search(source, head, start):
+            return False
+
+        if BlockState(source[head:start]).has_open_string():
+            return True
+
+        if not blocks:
+            return False
+
+        text = source[blocks[-1][0]:start]
+
+        if self.DEFLINE.match(text):
+            return False
+
+        return BlockState(text).has_open_bracket()
+
+    def has_imports(self, source, start=0, end=None) -> bool:
+
+        end = len(source) if end is None else end
+
+        if source.find('import', start, end) < 0:
+            return False
+
+        return bool(self.IMPORTLINE.search(source, start, end))
+
+
+class BlockState:
+    """Counts triple quotes and brackets of lines.
+    """
+
+    QUOTES = ('"""', "'''")
+    BRACKETS = ('()', '[]', '{}')
+
+    def __init__(self, text):
+        self.text = text
+
+    def has_open_string(self) -> bool:
+        """Checks if a triple-quoted string is not closed.
+
+        - Triple quotes in single-quoted strings are skipped.
+
+        """
+
+        for quote, other in zip(self.QUOTES, reversed(self.QUOTES)):
+
+            count = self.text.count(quote)
+            count -= self.text.count(other[0] + quote + other[0])
+
+            if count % 2:
+                return True
+
+        return False
+
+    def has_open_bracket(self) -> bool:
+        return any(
+            self.text.count(opening) > self.text.count(closing)
+            for opening, closing in self.BRACKETS
+        )
 
 
 class Annotator:
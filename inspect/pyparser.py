@@ -54,7 +54,7 @@ class BaseRecorder:
 
     def fetch_funcs(self, astnode):
         return self.fetch_nodes_by_type(
-            astnode, typeinfo=ast.FunctionDef
+            astnode, typeinfo=(ast.FunctionDef, ast.AsyncFunctionDef)
         )
 
     def fetch_classes(self, astnode):
@@ -89,7 +89,7 @@ class BaseRecorder:
 
 class FuncRecorder(BaseRecorder):
 
-    NodeType = ast.FunctionDef
+    NodeType = (ast.FunctionDef, ast.AsyncFunctionDef)
 
     def __init__(self):
         self.set_call_parser()
@@ -105,9 +105,31 @@ class FuncRecorder(BaseRecorder):
         record.docs = self.get_docs(astfunc)
         record.signature = self.get_signature(astfunc)
         record.calls = self.get_calls(astfunc)
+        record.lineno = self.get_lineno(astfunc)
+        record.callsites = self.get_callsites(astfunc)
+        record.isasync = self.is_async(astfunc)
 
         return record
 
+    def is_async(self, astfunc) -> bool:
+        return isinstance(astfunc, ast.AsyncFunctionDef)
+
+    def get_callsites(self, astfunc) -> list:
+        visitor = CallSitesVisitor(self.call_parser)
+        return visitor.visit_body(astfunc)
+
+    def get_lineno(self, astfunc) -> int:
+        """Returns the first line of the code (as in profiles).
+        """
+
+        decorators = [
+            node.lineno for node in astfunc.decorator_list
+        ]
+
+        return min(
+            [astfunc.lineno, *decorators]
+        )
+
     def get_calls(self, astfunc) -> list[str]:
         callexprs = self.get_callexprs(astfunc)
         return self.fetch_first_calls(callexprs)
@@ -208,6 +230,7 @@ class ModuleRecorder(BaseRecorder):
         record.funcs = self.get_funcs(astmodule)
         record.classes = self.get_classes(astmodule)
         record.imports = self.get_imports(astmodule)
+        record.aliases = self.get_aliases(astmodule)
 
         return record
 
@@ -225,6 +248,10 @@ class ModuleRecorder(BaseRecorder):
         imports = self.fetch_imports(astnode)
         return self.record_imports(imports)
 
+    def get_aliases(self, astnode) -> dict:
+        imports = self.fetch_imports(astnode)
+        return self.imports_recorder.make_aliases(imports)
+
     def record_funcs(self, astfuncs):
 
         recorder = self.func_recorder.make_record
@@ -256,6 +283,30 @@ class ImportsRecorder:
             )
         return importnames
 
+    def make_aliases(self, astimports) -> dict:
+        """Maps names bound by imports to fully qualified names.
+        """
+
+        aliases = {}
+
+        for astimport in astimports:
+
+            modname = self.get_module_name(astimport)
+
+            for alias in astimport.names:
+
+                if alias.name == '*':
+                    continue
+
+                if modname or alias.asname:
+                    name = alias.asname or alias.name
+                    aliases[name] = modname + alias.name
+                else:
+                    head = alias.name.partition('.')[0]
+                    aliases[head] = head
+
+        return aliases
+
     def get_import_names(self, astimport) -> list:
 
         modname = self.get_module_name(astimport)
@@ -284,6 +335,112 @@ class ImportsRecorder:
         return '.'*astimport.level + astimport.module + '.'
 
 
+class CallSitesVisitor(ast.NodeVisitor):
+    """Records calls with their loop depths, try blocks and awaits.
+
+    - Loop bodies, while tests and comprehensions are loop levels.
+    - Iterables of for loops (and first generators) are evaluated once.
+    - Functions passed to map/filter are called in one more loop.
+    - Nested functions and lambdas start from zero.
+
+    """
+
+    def __init__(self, call_parser):
+        self.call_parser = call_parser
+        self.callsites = []
+        self.depth = 0
+        self.intry = False
+        self.awaited = None
+
+    def visit_body(self, astfunc) -> list:
+        self.visit_nodes(astfunc.body)
+        return self.callsites
+
+    def visit_nodes(self, nodes, depth=None, intry=None):
+
+        olddepth, oldtry = self.depth, self.intry
+
+        self.depth = olddepth if depth is None else depth
+        self.intry = oldtry if intry is None else intry
+
+        for node in nodes:
+            self.visit(node)
+
+        self.depth, self.intry = olddepth, oldtry
+
+    def visit_Call(self, node):
+
+        callexpr = ast.unparse(node)
+        name = self.call_parser.fetch_first_call_name(callexpr)
+
+        depth = self.depth
+
+        if re.match(self.call_parser.re_map, callexpr):
+            depth += 1
+
+        site = pyrecords.CallSite(name, node.lineno, depth, self.intry)
+        site.awaited = node is self.awaited
+
+        self.callsites.append(site)
+
+        self.generic_visit(node)
+
+    def visit_Await(self, node):
+        self.awaited = node.value
+        self.generic_visit(node)
+
+    def visit_For(self, node):
+        self.visit_nodes([node.target, node.iter])
+        self.visit_nodes(node.body, depth=self.depth+1)
+        self.visit_nodes(node.orelse)
+
+    visit_AsyncFor = visit_For
+
+    def visit_While(self, node):
+        self.visit_nodes([node.test, *node.body], depth=self.depth+1)
+        self.visit_nodes(node.orelse)
+
+    def visit_Try(self, node):
+        self.visit_nodes(node.body, intry=True)
+        self.visit_nodes([*node.handlers, *node.orelse, *node.finalbody])
+
+    visit_TryStar = visit_Try
+
+    def visit_comprehension_node(self, node):
+
+        depth = self.depth
+
+        for level, generator in enumerate(node.generators):
+            self.visit_nodes(
+                [generator.iter], depth=depth+level
+            )
+            self.visit_nodes(
+                [generator.target, *generator.ifs], depth=depth+level+1
+            )
+
+        if isinstance(node, ast.DictComp):
+            results = [node.key, node.value]
+        else:
+            results = [node.elt]
+
+        self.visit_nodes(results, depth=depth+len(node.generators))
+
+    visit_ListComp = visit_comprehension_node
+    visit_SetComp = visit_comprehension_node
+    visit_DictComp = visit_comprehension_node
+    visit_GeneratorExp = visit_comprehension_node
+
+    def visit_function_node(self, node):
+        self.visit_nodes(getattr(node, 'decorator_list', []))
+        self.visit_nodes([node.args])
+        body = node.body if isinstance(node.body, list) else [node.body]
+        self.visit_nodes(body, depth=0, intry=False)
+
+    visit_FunctionDef = visit_function_node
+    visit_AsyncFunctionDef = visit_function_node
+    visit_Lambda = visit_function_node
+
+
 class CallParser:
     """Parser of complex call expressions.
     """
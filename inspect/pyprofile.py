@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""Annotates call trees with runtime costs from cProfile data.
+
+- Profile entries are matched to function records by files, lines, names.
+- Tree nodes get cumulative times, numbers of calls and shares of total.
+- Roots get whole-program costs, children get costs of the calls made
+  by their parents (cProfile callers), at most the parent's time.
+- Nodes with shares above the threshold are marked as hot.
+- Hot nodes are highlighted in HTML reports.
+
+"""
+
+import os
+import re
+import pstats
+
+__all__ = [
+    'loadprofile', 'Profile'
+]
+
+HOTMARK = '▲'
+
+CALLTREES = re.compile(
+    r'<pre class="call-trees">.*?</pre>', flags=re.DOTALL
+)
+
+HOTLABEL = re.compile(
+    r'(\[[^\]\n]*\]) ' + HOTMARK
+)
+
+
+def loadprofile(filepath, threshold=0.05):
+    """Loads runtime costs of functions from a cProfile file.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file dumped by cProfile (.prof).
+    threshold : float = 0.05
+        Share of the total time above which calls are hot.
+
+    Returns
+    -------
+    Profile
+        Costs of the profiled functions.
+
+    """
+
+    if not os.path.isfile(filepath):
+        raise FileNotFoundError(
+            f"profile does not exist: '{filepath}'"
+        )
+
+    return Profile(
+        pstats.Stats(filepath), threshold
+    )
+
+
+def getprofile(profile):
+    """Returns a profile as it is, loads it, if a path is given.
+    """
+
+    if profile is None or isinstance(profile, Profile):
+        return profile
+
+    return loadprofile(profile)
+
+
+def markhot_html(pagehtml) -> str:
+    """Wraps labels of hot calls in call trees with `<mark>`.
+    """
+
+    def markblock(matchobj):
+        return HOTLABEL.sub(
+            r'<mark class="hot-call">\1</mark>', matchobj.group()
+        )
+
+    return CALLTREES.sub(markblock, pagehtml)
+
+
+class FuncCost:
+    """Runtime cost of a function.
+
+    Attributes
+    ----------
+    func : tuple[str, int, str]
+        Path to the script, line and name as recorded by cProfile.
+    calls : int
+        Number of calls.
+    cumtime : float
+        Cumulative time in seconds (subcalls included).
+    callers : dict
+        Costs of the calls made by each caller (cProfile keys).
+
+    """
+
+    def __init__(self, func, calls, cumtime, callers=None):
+        self.func = func
+        self.calls = calls
+        self.cumtime = cumtime
+        self.callers = callers or {}
+
+    @property
+    def filename(self) -> str:
+        return self.func[0]
+
+    def getcaller(self, caller):
+        """Returns the cost of the calls made by a given caller.
+        """
+
+        edge = self.callers.get(caller.func)
+
+        if edge is None:
+            return None
+
+        calls, _, _, cumtime = edge
+        cumtime = min(cumtime, caller.cumtime)
+
+        return FuncCost(self.func, calls, cumtime)
+
+
+class Profile:
+    """Runtime costs of functions from cProfile data.
+
+    Attributes
+    ----------
+    total : float
+        Total time of the profiled run in seconds.
+    threshold : float
+        Share of the total time above which calls are hot.
+
+    """
+
+    def __init__(self, stats, threshold=0.05):
+
+        self.total = stats.total_tt
+        self.threshold = threshold
+
+        self.costs = self.index_costs(stats.stats)
+
+    def index_costs(self, entries) -> dict:
+        """Maps script names, lines and function names to costs.
+        """
+
+        costs = {}
+
+        for func, entry in entries.items():
+
+            filename, lineno, funcname = func
+            _, calls, _, cumtime, callers = entry
+            key = (os.path.basename(filename), lineno, funcname)
+
+            costs.setdefault(key, []).append(
+                FuncCost(func, calls, cumtime, callers)
+            )
+
+        return costs
+
+    def forfile(self, filepath):
+        """Returns costs of functions from a given script.
+        """
+        return FileProfile(self, filepath)
+
+
+class FileProfile:
+    """Runtime costs of functions from a single script.
+    """
+
+    def __init__(self, profile, filepath):
+        self.profile = profile
+        self.filepath = os.path.abspath(filepath)
+
+    def getcost(self, funcrec) -> FuncCost | None:
+
+        key = (
+            os.path.basename(self.filepath), funcrec.lineno, funcrec.name
+        )
+
+        costs = self.profile.costs.get(key)
+
+        if not costs:
+            return None
+
+        return max(costs, key=self.count_common_parts)
+
+    def count_common_parts(self, cost) -> int:
+        """Counts trailing path parts shared with the script path.
+        """
+
+        parts = os.path.normpath(cost.filename).split(os.sep)
+        ownparts = self.filepath.split(os.sep)
+
+        count = 0
+
+        for part, ownpart in zip(reversed(parts), reversed(ownparts)):
+            if part != ownpart:
+                break
+            count += 1
+
+        return count
+
+    def annotate(self, roots, pyrec):
+        """Adds costs to names of nodes in call trees of a record.
+        """
+
+        funcs = self.map_names_to_funcs(pyrec)
+
+        def walk(node, caller=None):
+
+            funcrec = funcs.get(node.name)
+            cost = None
+
+            if funcrec is not None:
+                cost = self.annotate_node(node, funcrec, caller)
+
+            # Not called by the caller, neither are its callees.
+            if cost is None and caller is not None:
+                return
+
+            for child in node.children or []:
+                walk(child, cost)
+
+        for root in roots:
+            walk(root)
+
+    def map_names_to_funcs(self, pyrec) -> dict:
+        """Maps names of nodes to functions (classes to constructors).
+        """
+
+        funcs = dict(pyrec.funcs)
+
+        for name, classrec in getattr(pyrec, 'classes', {}).items():
+            if '__init__' in classrec.funcs:
+                funcs.setdefault(name, classrec.funcs['__init__'])
+
+        return funcs
+
+    def annotate_node(self, node, funcrec, caller=None):
+        """Labels a node with the cost of its calls from the caller.
+        """
+
+        cost = self.getcost(funcrec)
+
+        if cost is not None and caller is not None:
+            cost = cost.getcaller(caller)
+
+        if cost is None:
+            return None
+
+        node.data = node.name + ' ' + self.make_label(cost)
+
+        return cost
+
+    def make_label(self, cost) -> str:
+
+        share = self.get_share(cost)
+
+        label = (
+            f'[{cost.cumtime * 1e3:.2f} ms, '
+            f'{cost.calls} calls, {share:.1%}]'
+        )
+
+        if share >= self.profile.threshold:
+            return label + ' ' + HOTMARK
+
+        return label
+
+    def get_share(self, cost) -> float:
+        if not self.profile.total:
+            return 0.0
+        return cost.cumtime / self.profile.total
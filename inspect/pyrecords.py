@@ -2,10 +2,31 @@
 """Records of python objects.
 """
 
+import fnmatch
+
 from ..utils import namespace
 from ..utils import deeptrees
 from ..utils import treeastxt
 
+LOOPMARK = '↻'
+
+# Calls that block the event loop, if made from coroutines (fnmatch).
+BLOCKING = [
+    'time.sleep',
+    'open',
+    'input',
+    'os.system',
+    'os.wait*',
+    'requests.*',
+    'urllib.request.urlopen',
+    'subprocess.run',
+    'subprocess.call',
+    'subprocess.check_call',
+    'subprocess.check_output',
+    'socket.create_connection',
+    'socket.getaddrinfo'
+]
+
 
 class BaseRecord:
     """Base class for records of python objects.
@@ -32,6 +53,31 @@ class BaseRecord:
 
         return '\n\n'.join(views)
 
+    def markloops(self, roots):
+        """Adds loop depths to names of calls made in loops.
+        """
+
+        depths = self.map_funcs_to_loop_depths()
+
+        def walk(node):
+
+            calldepths = depths.get(node.name, {})
+
+            for child in node.children or []:
+
+                depth = calldepths.get(child.name)
+
+                if depth:
+                    child.data = f'{child.data} {LOOPMARK}{depth}'
+
+                walk(child)
+
+        for root in roots:
+            walk(root)
+
+    def map_funcs_to_loop_depths(self) -> dict:
+        return {}
+
     def make_trees_from_namespace(self, name_to_names) -> list:
         return deeptrees.maketrees(name_to_names)
 
@@ -76,6 +122,12 @@ class FuncRecord(BaseRecord):
         Line with the function definition.
     calls : list[str]
         Call names from the function body.
+    lineno : int
+        First line of the definition (decorators included).
+    callsites : list[CallSite]
+        Calls from the function body with their contexts.
+    isasync : bool
+        True for coroutine functions (`async def`).
 
     """
 
@@ -84,6 +136,9 @@ class FuncRecord(BaseRecord):
         self.docs = ''
         self.signature = ''
         self.calls = []
+        self.lineno = 0
+        self.callsites = []
+        self.isasync = False
 
     def dumpname(self) -> str:
         return self.formatname(self.name)
@@ -111,6 +166,94 @@ class FuncRecord(BaseRecord):
             call.removeprefix('self.') for call in calls
         ]
 
+    def get_loop_depths(self) -> dict:
+        """Maps names of calls made in loops to their deepest levels.
+        """
+
+        depths = {}
+
+        for site in self.callsites:
+            if site.depth:
+                depths[site.name] = max(depths.get(site.name, 0), site.depth)
+
+        return depths
+
+    def get_looped_calls(self) -> list:
+        """Returns calls made in loops, the deepest first.
+        """
+
+        sites = {}
+
+        for site in self.callsites:
+            if not site.depth:
+                continue
+            if site.name in sites and sites[site.name].depth >= site.depth:
+                continue
+            sites[site.name] = site
+
+        return sorted(
+            dict.values(sites), key=lambda site: (-site.depth, site.lineno)
+        )
+
+    def get_max_depth(self) -> int:
+        return max(
+            [site.depth for site in self.callsites], default=0
+        )
+
+
+class CallSite:
+    """Represents a call in a function body.
+
+    Attributes
+    ----------
+    name : str
+        Call name.
+    lineno : int
+        Line of the call.
+    depth : int
+        Number of loops (incl. comprehensions) around the call.
+    intry : bool
+        True, if the call is in the body of a try block.
+    awaited : bool
+        True, if the result of the call is awaited.
+
+    """
+
+    def __init__(self, name, lineno, depth, intry):
+        self.name = name
+        self.lineno = lineno
+        self.depth = depth
+        self.intry = intry
+        self.awaited = False
+
+    def is_blocking(self, patterns, aliases=None) -> bool:
+        """Matches the call name, its head qualified by imports.
+        """
+
+        if self.awaited:
+            return False
+
+        name = self.qualify(aliases or {})
+
+        return any(
+            fnmatch.fnmatchcase(name, pattern) for pattern in patterns
+        )
+
+    def qualify(self, aliases) -> str:
+        head, dot, tail = self.name.partition('.')
+        if head in aliases:
+            return aliases[head] + dot + tail
+        return self.name
+
+    def dumpsite(self) -> str:
+
+        site = f'{self.name} {LOOPMARK}{self.depth}'
+
+        if self.intry:
+            return site + ' try'
+
+        return site
+
 
 class ClassRecord(BaseRecord):
     """Represents a python class.
@@ -169,6 +312,24 @@ class ClassRecord(BaseRecord):
             dict.keys(self.funcs)
         )
 
+    def map_funcs_to_loop_depths(self) -> dict:
+        """Maps methods to loop depths of their self calls.
+        """
+
+        def makeitem(funcrec):
+
+            depths = {
+                name.removeprefix('self.'): depth
+                for name, depth in funcrec.get_loop_depths().items()
+                if name.startswith('self.')
+            }
+
+            return funcrec.name, depths
+
+        return dict(
+            map(makeitem, dict.values(self.funcs))
+        )
+
 
 class ModuleRecord(BaseRecord):
     """Represents a python script (module).
@@ -181,6 +342,8 @@ class ModuleRecord(BaseRecord):
         Module docstring.
     imports : list[str]
         Fully qualified names of imported objects.
+    aliases : dict
+        Names bound by imports mapped to fully qualified names.
     funcs : dict
         Namespace of module-level functions (name-to-record).
     classes : dict
@@ -192,6 +355,7 @@ class ModuleRecord(BaseRecord):
         self.name = ''
         self.docs = ''
         self.imports = []
+        self.aliases = {}
         self.funcs = {}
         self.classes = {}
 
@@ -214,6 +378,75 @@ class ModuleRecord(BaseRecord):
         roots = self.makeclasstrees()
         return self.print_trees(roots)
 
+    def dumphotloops(self) -> str:
+        """Lists functions with calls in loops, the deepest first.
+        """
+
+        funcrecs = self.rank_funcs_by_loops()
+
+        name_to_sites = {
+            f'{name} {LOOPMARK}{funcrec.get_max_depth()}': [
+                site.dumpsite() for site in funcrec.get_looped_calls()
+            ]
+            for name, funcrec in funcrecs
+        }
+
+        return namespace.dumpnamespace(
+            name_to_sites, rootname='loops'
+        )
+
+    def dumpblocking(self, patterns=None) -> str:
+        """Lists blocking calls reachable from coroutines.
+        """
+
+        finder = BlockingCallsFinder(self, patterns)
+
+        name_to_paths = {
+            f'async {name}': paths
+            for name, paths in finder.find_paths().items()
+        }
+
+        return namespace.dumpnamespace(
+            name_to_paths, rootname='blocking'
+        )
+
+    def rank_funcs_by_loops(self) -> list[tuple]:
+        """Returns named functions and methods with calls in loops.
+        """
+
+        funcrecs = list(
+            dict.items(self.funcs)
+        )
+
+        for classrec in dict.values(self.classes):
+            funcrecs.extend(
+                (f'{classrec.name}.{name}', funcrec)
+                for name, funcrec in classrec.funcs.items()
+            )
+
+        funcrecs = [
+            item for item in funcrecs if item[1].get_max_depth()
+        ]
+
+        def sortkey(item):
+            name, funcrec = item
+            return (
+                -funcrec.get_max_depth(),
+                -len(funcrec.get_looped_calls()),
+                name
+            )
+
+        return sorted(funcrecs, key=sortkey)
+
+    def map_funcs_to_loop_depths(self) -> dict:
+
+        def makeitem(funcrec):
+            return funcrec.name, funcrec.get_loop_depths()
+
+        return dict(
+            map(makeitem, dict.values(self.funcs))
+        )
+
     def makecalltrees(self) -> list:
         call_to_calls = self.map_calls_to_calls()
         call_to_calls = self.exclude_non_native_calls(call_to_calls)
@@ -292,3 +525,88 @@ class ModuleRecord(BaseRecord):
 
     def exclude_non_native_calls(self, call_to_calls) -> dict:
         return namespace.exclude_non_native_names(call_to_calls)
+
+
+class BlockingCallsFinder:
+    """Finds blocking calls reachable from coroutines of a module.
+
+    - Calls are followed to functions of the module (and to methods
+      of the same class for self calls).
+    - Coroutines are not followed, they are checked on their own.
+    - Awaited calls are not blocking.
+
+    """
+
+    def __init__(self, modrec, patterns=None):
+        self.modrec = modrec
+        self.patterns = BLOCKING if patterns is None else patterns
+
+    def find_paths(self) -> dict:
+        """Maps coroutines to paths of calls to blocking calls.
+        """
+
+        paths = {}
+
+        for name, funcrec, classrec in self.list_funcs():
+
+            if not funcrec.isasync:
+                continue
+
+            found = self.walk(funcrec, classrec, [], set())
+
+            if found:
+                paths[name] = found
+
+        return paths
+
+    def list_funcs(self) -> list[tuple]:
+
+        funcs = [
+            (name, funcrec, None)
+            for name, funcrec in self.modrec.funcs.items()
+        ]
+
+        for classrec in dict.values(self.modrec.classes):
+            funcs.extend(
+                (f'{classrec.name}.{name}', funcrec, classrec)
+                for name, funcrec in classrec.funcs.items()
+            )
+
+        return funcs
+
+    def walk(self, funcrec, classrec, path, seen) -> list[str]:
+
+        seen.add(id(funcrec))
+        found = []
+
+        for site in funcrec.callsites:
+
+            if site.is_blocking(self.patterns, self.modrec.aliases):
+                found.append(
+                    ' → '.join([*path, site.name]) + f' (line {site.lineno})'
+                )
+                continue
+
+            target, targetclass = self.resolve(site.name, classrec)
+
+            if target is None or target.isasync:
+                continue
+
+            if id(target) in seen:
+                continue
+
+            found.extend(
+                self.walk(target, targetclass, [*path, site.name], seen)
+            )
+
+        return found
+
+    def resolve(self, callname, classrec) -> tuple:
+        """Returns the record of a called function of the module.
+        """
+
+        if classrec is not None and callname.startswith('self.'):
+            method = callname.removeprefix('self.')
+            return classrec.funcs.get(method), classrec
+
+        return self.modrec.funcs.get(callname), None
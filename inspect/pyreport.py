@@ -2,11 +2,14 @@
 """Generates MD reports for python scripts.
 """
 
+import hashlib
 import textwrap
+import threading
 from . import pyparser
 
 
-def makereport(source, name) -> str:
+def makereport(source, name, profile=None, blocking=None,
+               hotloops=False) -> str:
     """Generates an MD report on given python script (module).
 
     Parameters
@@ -15,6 +18,14 @@ def makereport(source, name) -> str:
         Python script to be examined.
     name : str
         User-defined name of the script.
+    profile : FileProfile = None
+        Runtime costs to annotate call trees with (not cached).
+    blocking : list[str] = None
+        Patterns (fnmatch) of calls that block the event loop,
+        if None, `pyrecords.BLOCKING` is used.
+    hotloops : bool = False
+        If True, calls in call trees are marked with loop depths
+        and functions with calls in loops are listed.
 
     Returns
     -------
@@ -22,8 +33,23 @@ def makereport(source, name) -> str:
         The resulting report in MD.
 
     """
+
+    if profile is not None:
+        modrec = parse_script(source, name)
+        return run_reporter(modrec, profile, blocking, hotloops)
+
+    options = REPORTS.makeoptions(blocking, hotloops)
+    report = REPORTS.getreport(source, name, options)
+
+    if report is not None:
+        return report
+
     modrec = parse_script(source, name)
-    return run_reporter(modrec)
+    report = run_reporter(modrec, None, blocking, hotloops)
+
+    REPORTS.addreport(source, name, report, options)
+
+    return report
 
 
 def parse_script(source, name):
@@ -34,15 +60,85 @@ def run_pyparser(source, name):
     return pyparser.parsescript(source, name)
 
 
-def run_reporter(modrec):
-    module_reporter = ScriptReporter()
+def run_reporter(modrec, profile=None, blocking=None, hotloops=False):
+    module_reporter = ScriptReporter(profile, blocking, hotloops)
     return module_reporter.make_report(modrec)
 
 
+class ReportsCache:
+    """Cache of reports keyed by script names and sources.
+
+    - Disabled by default, enabled by long-running workers.
+    - Enabled while at least one user has not disabled it.
+    - The oldest reports are dropped when the cache is full.
+    - Safe to use from several threads.
+
+    """
+
+    MAXSIZE = 1024
+
+    def __init__(self):
+        self.users = 0
+        self.reports = {}
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.users > 0
+
+    def enable(self):
+        with self.lock:
+            self.users += 1
+
+    def disable(self):
+        with self.lock:
+            self.users = max(self.users - 1, 0)
+            if not self.users:
+                self.reports.clear()
+
+    def getreport(self, source, name, options=()) -> str | None:
+        if not self.enabled:
+            return None
+        return self.reports.get(self.makekey(source, name, options))
+
+    def addreport(self, source, name, report, options=()):
+
+        if not self.enabled:
+            return
+
+        key = self.makekey(source, name, options)
+
+        with self.lock:
+
+            if len(self.reports) >= self.MAXSIZE:
+                del self.reports[next(iter(self.reports))]
+
+            self.reports[key] = report
+
+    def makekey(self, source, name, options=()):
+        digest = hashlib.sha1(source.encode('utf-8')).hexdigest()
+        return name, digest, *options
+
+    def makeoptions(self, blocking=None, hotloops=False) -> tuple:
+        """Returns hashable options of reports, a part of their keys.
+        """
+        if blocking is not None:
+            blocking = tuple(blocking)
+        return blocking, hotloops
+
+
+REPORTS = ReportsCache()
+
+
 class Reporter:
     """Base class for reporters.
     """
 
+    def __init__(self, profile=None, blocking=None, hotloops=False):
+        self.profile = profile
+        self.blocking = blocking
+        self.hotloops = hotloops
+
     def make_report(self, record) -> str:
 
         heading = self.make_heading(record)
@@ -65,7 +161,16 @@ class Reporter:
         return pyrec.dumpdocs()
 
     def get_calltrees_from_record(self, pyrec):
-        return pyrec.dumpcalltrees()
+
+        roots = pyrec.makecalltrees()
+
+        if self.profile is not None:
+            self.profile.annotate(roots, pyrec)
+
+        if self.hotloops:
+            pyrec.markloops(roots)
+
+        return pyrec.print_trees(roots)
 
     def get_imports_from_record(self, pyrec):
         return pyrec.dumpimports()
@@ -73,6 +178,12 @@ class Reporter:
     def get_classtrees_from_record(self, pyrec):
         return pyrec.dumpclasstrees()
 
+    def get_hotloops_from_record(self, pyrec):
+        return pyrec.dumphotloops()
+
+    def get_blocking_from_record(self, pyrec):
+        return pyrec.dumpblocking(self.blocking)
+
     # Dumpers
 
     def dump_docstr(self, pyrec) -> str:
@@ -111,6 +222,25 @@ class Reporter:
             text=classtrees, label='class-trees'
         )
 
+    def dump_hotloops(self, modrec) -> str:
+
+        if not self.hotloops:
+            return ''
+
+        hotloops = self.get_hotloops_from_record(modrec)
+
+        return self.dump_to_labeled_text_block(
+            text=hotloops, label='hot-loops'
+        )
+
+    def dump_blocking(self, modrec) -> str:
+
+        blocking = self.get_blocking_from_record(modrec)
+
+        return self.dump_to_labeled_text_block(
+            text=blocking, label='blocking-calls'
+        )
+
     # Utils
 
     def assemble(self, *parts) -> str:
@@ -143,15 +273,20 @@ class ScriptReporter(Reporter):
 
     """
 
-    def __init__(self):
+    def __init__(self, profile=None, blocking=None, hotloops=False):
+        super().__init__(profile, blocking, hotloops)
         self.set_module_reporter()
         self.set_class_reporter()
 
     def set_class_reporter(self):
-        self.class_reporter = ClassReporter()
+        self.class_reporter = ClassReporter(
+            self.profile, hotloops=self.hotloops
+        )
 
     def set_module_reporter(self):
-        self.module_reporter = ModuleReporter()
+        self.module_reporter = ModuleReporter(
+            self.profile, self.blocking, self.hotloops
+        )
 
     def make_heading(self, record) -> str:
         return self.empty_heading()
@@ -199,9 +334,11 @@ class ModuleReporter(Reporter):
         imports = self.dump_imports(modrec)
         calltrees = self.dump_calltrees(modrec)
         classtrees = self.dump_classtrees(modrec)
+        hotloops = self.dump_hotloops(modrec)
+        blocking = self.dump_blocking(modrec)
 
         return self.assemble(
-            docstr, imports, calltrees, classtrees
+            docstr, imports, calltrees, classtrees, hotloops, blocking
         )
 
 
@@ -7,7 +7,9 @@ import itertools as itr
 
 from . import pyparser
 from . import pyreport
-from ..docpage import pagemaker
+from . import pyprofile
+from . import pytrees
+from ..utils import dumpfiles, tracing
 
 
 __all__ = [
@@ -21,26 +23,34 @@ def apiobj(obj):
 
 
 @apiobj
-def getscripts(dirpath):
+def getscripts(dirpath, lazy=False):
     """Extracts python scripts from a specified folder.
 
     Parameters
     ----------
     dirpath : str
         Path to the folder with the scripts.
+    lazy : bool = False
+        If True, sources are read on demand and not kept (a).
 
     Returns
     -------
     Scripts
         Object that holds script records.
 
+    Notes
+    -----
+
+    (a) — Only one source is held in memory at a time,
+          but a source is read each time it is used.
+
     """
 
     if not os.path.isdir(dirpath):
         raise ValueError('argument is not an existing directory')
 
     scripts = Scripts()
-    scripts.set_scripts(dirpath)
+    scripts.set_scripts(dirpath, lazy)
 
     return scripts
 
@@ -85,17 +95,17 @@ class Scripts:
 
         self.dirpath = dirpath
 
-    def set_scripts(self, dirpath):
+    def set_scripts(self, dirpath, lazy=False):
         self.set_dirpath(dirpath)
-        records = self.get_script_records()
+        records = self.get_script_records(lazy)
         self.scripts = self.make_namespace_of_scripts(records)
 
-    def get_script_records(self) -> list:
+    def get_script_records(self, lazy=False) -> list:
         path = self.dirpath
-        return self.call_scripts_fetcher(path)
+        return self.call_scripts_fetcher(path, lazy)
 
-    def call_scripts_fetcher(self, path):
-        scripts_fetcher = ScriptsFetcher()
+    def call_scripts_fetcher(self, path, lazy):
+        scripts_fetcher = ScriptsFetcher(lazy)
         return scripts_fetcher.getscripts(path)
 
     def make_namespace_of_scripts(self, scriptrecords) -> dict:
@@ -129,41 +139,63 @@ class ScriptRecord:
         Script name.
     source : str
         Script content.
+    profile : FileProfile | None
+        Runtime costs to annotate call trees with.
+    foldtrees : tuple[int, int] | None
+        Max depth and breadth of trees in HTML docpages.
+    blocking : list[str] | None
+        Patterns of blocking calls, if None, the default ones.
+    hotloops : bool
+        If True, calls in loops are reported.
 
     """
 
     def __init__(self, name, source):
         self.name = name
         self.source = source
+        self.profile = None
+        self.foldtrees = None
+        self.blocking = None
+        self.hotloops = False
 
     def parse(self):
         return self.run_pyparser(
             source=self.source, name=self.name
         )
 
-    def dumpdocpage(self, filepath):
+    def dumpdocpage(self, filepath, report=None):
 
-        reportmaker = self.makereport
+        if report is None:
+            report = self.makereport()
 
         self.run_pagemaker(
-            report=reportmaker(), filepath=filepath
+            report=report, filepath=filepath
         )
 
-    def dumpreport(self, filepath):
+    def dumpreport(self, filepath, report=None):
 
-        reportmaker = self.makereport
+        if report is None:
+            report = self.makereport()
 
         self.save_to_file(
-            filepath, reportmaker()
+            filepath, report
         )
 
     def makereport(self) -> str:
-        return self.run_pyreport(
-            source=self.source, name=self.name
-        )
+
+        source = self.source
+
+        with tracing.span('report', file=self.name, bytes=len(source)):
+            return self.run_pyreport(
+                source=source, name=self.name, profile=self.profile,
+                blocking=self.blocking, hotloops=self.hotloops
+            )
 
     def run_pagemaker(self, report, filepath):
 
+        # Deferred, the page maker is not needed for parsing.
+        from ..docpage import pagemaker
+
         filename = os.path.basename(filepath)
         webtitle, _ = os.path.splitext(filename)
 
@@ -174,26 +206,64 @@ class ScriptRecord:
             sourcemd=report, settings=settings
         )
 
-        with open(filepath, encoding='utf-8', mode='w') as file:
-            file.write(docpage)
+        if self.profile is not None:
+            docpage = pyprofile.markhot_html(docpage)
+
+        if self.foldtrees is not None:
+            docpage = pytrees.foldtrees_html(docpage, *self.foldtrees)
+
+        dumpfiles.dumpfile(filepath, docpage)
 
     def run_pyparser(self, source, name):
         return pyparser.parsescript(source, name)
 
-    def run_pyreport(self, source, name) -> str:
-        return pyreport.makereport(source, name)
+    def run_pyreport(self, source, name, profile=None, blocking=None,
+                     hotloops=False) -> str:
+        return pyreport.makereport(
+            source, name, profile, blocking, hotloops
+        )
 
     def save_to_file(self, filepath, content):
-        with open(filepath, encoding='utf-8', mode='w') as file:
-            file.write(content)
+        dumpfiles.dumpfile(filepath, content)
+
+
+class ScriptFile(ScriptRecord):
+    """Represents a python script, the source is read on demand.
+
+    Attributes
+    ----------
+    name : str
+        Script name.
+    filepath : str
+        Path to the script.
+
+    """
+
+    def __init__(self, name, filepath):
+        self.filepath = filepath
+        super().__init__(name, source=None)
+
+    @property
+    def source(self) -> str:
+        with open(self.filepath, encoding='utf-8') as file:
+            return file.read()
+
+    @source.setter
+    def source(self, value):
+        if value is not None:
+            raise AttributeError('the source is read from the file')
 
 
 class ScriptsFetcher:
     """Fetches python scripts from a specified folder.
+
+    - Lazy fetcher makes records that read sources on demand.
+
     """
 
-    def __init__(self):
+    def __init__(self, lazy=False):
         self._dirpath = None
+        self._lazy = lazy
 
     def getscripts(self, dirpath) -> list:
 
@@ -201,11 +271,19 @@ class ScriptsFetcher:
 
         self._dirpath = dirpath
 
+        if self._lazy:
+            return self.make_script_files(names)
+
         sources = self.read_script_sources(names)
         records = self.make_script_records(names, sources)
 
         return records
 
+    def make_script_files(self, names) -> list:
+        return [
+            ScriptFile(name, self.get_script_path(name)) for name in names
+        ]
+
     def get_script_names(self, dirpath) -> list[str]:
 
         files = os.listdir(dirpath)
@@ -240,15 +318,18 @@ class ScriptsFetcher:
 
     def read_script_source(self, scriptname) -> str:
 
-        path = os.path.join(
-            self._dirpath, scriptname + '.py'
-        )
+        path = self.get_script_path(scriptname)
 
         with open(path, encoding='utf-8') as file:
             source = file.read()
 
         return source
 
+    def get_script_path(self, scriptname) -> str:
+        return os.path.join(
+            self._dirpath, scriptname + '.py'
+        )
+
     def is_python_script(self, filename):
         return filename.endswith('.py')
 
@@ -0,0 +1,911 @@
+# -*- coding: utf-8 -*-
+"""Static stand-ins of python modules, functions and classes.
+
+- Modules are loaded from source files without being imported.
+- Stand-ins mimic the attributes used by the object dumpers.
+- Names that cannot be resolved statically are imported (fallback).
+- Functions wrapped by caching decorators (`functools.cache`,
+  `lru_cache`, `cached_property`) are not functions, as in live modules.
+  Other decorators are assumed to return functions (`functools.wraps`).
+
+"""
+
+import os
+import ast
+import sys
+import inspect
+import importlib
+
+__all__ = [
+    'loadmodule'
+]
+
+
+def loadmodule(path, modname=None):
+    """Loads a python module statically (no import).
+
+    Parameters
+    ----------
+    path : str
+        Path to the script or to the package folder.
+    modname : str = None
+        Full name of the module.
+        If None, the name is derived from the path.
+
+    Returns
+    -------
+    ModuleStub
+        Static stand-in of the module.
+
+    """
+    loader = StaticLoader()
+    return loader.loadmodule(path, modname)
+
+
+def isstub(obj) -> bool:
+    return isinstance(obj, (FuncStub, ClassStub, ModuleStub))
+
+
+class FuncStub:
+    """Static stand-in of a python function.
+
+    Attributes
+    ----------
+    signature : str
+        Signature as rendered by `inspect.signature()`.
+
+    """
+
+    def __init__(self, name, docs, signature, modname):
+        self.__name__ = name
+        self.__qualname__ = name
+        self.__doc__ = docs
+        self.__module__ = modname
+        self.signature = signature
+
+
+class ClassStub:
+    """Static stand-in of a python class.
+
+    Attributes
+    ----------
+    signature : str
+        Signature of the constructor (set by the loader).
+    methods : list[FuncStub]
+        Plain functions defined in the class body.
+
+    """
+
+    def __init__(self, name, docs, modname):
+        self.__name__ = name
+        self.__qualname__ = name
+        self.__doc__ = docs
+        self.__module__ = modname
+        self.signature = None
+        self.methods = []
+
+
+class ModuleStub:
+    """Static stand-in of a python module.
+
+    Attributes
+    ----------
+    namespace : dict
+        Module-level names mapped to functions and classes
+        (stubs or live objects) in the order of binding.
+
+    """
+
+    def __init__(self, name, docs, filepath):
+        self.__name__ = name
+        self.__doc__ = docs
+        self.__file__ = filepath
+        self.namespace = {}
+
+
+class ModuleRef:
+    """Name bound to a module.
+    """
+
+    def __init__(self, modname):
+        self.modname = modname
+
+
+class ImportRef:
+    """Name imported from another module (resolved on demand).
+    """
+
+    def __init__(self, modname, name):
+        self.modname = modname
+        self.name = name
+
+
+class Unresolved:
+    """Name that requires importing the host module.
+    """
+
+    def __init__(self, modname, name):
+        self.modname = modname
+        self.name = name
+
+
+DATA = object()
+
+
+class StaticLoader:
+    """Loads python modules from source files.
+
+    - Parsed modules are cached per loader.
+    - A single loader can serve a group of modules.
+
+    """
+
+    def __init__(self):
+        self.finder = SourceFinder()
+        self.signer = SignatureMaker()
+        self.scopes = {}
+        self.resolving = set()
+
+    def loadmodule(self, path, modname=None):
+
+        filepath = self.finder.get_script_path(path)
+
+        if modname is None:
+            modname = self.finder.get_module_name(filepath)
+
+        self.finder.add_root_for_module(filepath, modname)
+
+        scope = self.get_scope(modname, filepath)
+        return self.scope_to_module(scope)
+
+    def scope_to_module(self, scope):
+
+        modstub = ModuleStub(
+            scope.modname, scope.docs, scope.filepath
+        )
+
+        for name in self.list_names(scope):
+            value = self.resolve_name(scope, name)
+            if self.is_member(value):
+                modstub.namespace[name] = value
+
+        return modstub
+
+    def list_names(self, scope) -> list[str]:
+        """Returns bound names and names served by `__getattr__`.
+        """
+
+        names = list(scope.bindings)
+
+        if not scope.has_getattr:
+            return names
+
+        lazynames = [
+            name for name in scope.exports if name not in scope.bindings
+        ]
+
+        return names + lazynames
+
+    def is_member(self, value):
+        if isinstance(value, (FuncStub, ClassStub)):
+            return True
+        return inspect.isfunction(value) or inspect.isclass(value)
+
+    # Scopes
+
+    def get_scope(self, modname, filepath=None):
+
+        if modname in self.scopes:
+            return self.scopes[modname]
+
+        if filepath is None:
+            filepath = self.finder.find_module(modname)
+
+        if filepath is None:
+            return None
+
+        scope = ModuleScope(modname, filepath)
+        self.scopes[modname] = scope
+
+        ScopeBuilder(self).build(scope)
+        self.apply_patches(scope)
+
+        return scope
+
+    def apply_patches(self, scope):
+        """Applies assignments like `func.__name__ = 'name'`.
+        """
+        for name, attr, value in scope.patches:
+            target = self.resolve_name(scope, name)
+            if isinstance(target, (FuncStub, ClassStub)):
+                setattr(target, attr, value)
+
+    def is_submodule(self, modname, name):
+        return self.finder.find_module(modname + '.' + name) is not None
+
+    # Resolution
+
+    def resolve_name(self, scope, name):
+
+        key = (scope.modname, name)
+
+        if key in self.resolving:
+            return self.import_name(scope.modname, name)
+
+        self.resolving.add(key)
+
+        try:
+            value = self.resolve_binding(scope, name)
+        finally:
+            self.resolving.discard(key)
+
+        if name in scope.bindings:
+            scope.bindings[name] = value
+
+        return value
+
+    def resolve_binding(self, scope, name):
+
+        if name not in scope.bindings:
+            return self.resolve_missing(scope, name)
+
+        value = scope.bindings[name]
+
+        if isinstance(value, ImportRef):
+            return self.resolve_import(value.modname, value.name)
+
+        if isinstance(value, Unresolved):
+            return self.import_name(value.modname, value.name)
+
+        if isinstance(value, ClassStub) and value.signature is None:
+            value.signature = self.get_class_signature(scope, value)
+
+        return value
+
+    def resolve_missing(self, scope, name):
+
+        if scope.has_getattr:
+            return self.import_name(scope.modname, name)
+
+        return self.import_name('builtins', name)
+
+    def resolve_import(self, modname, name):
+
+        if self.is_submodule(modname, name):
+            return ModuleRef(modname + '.' + name)
+
+        scope = self.get_scope(modname)
+
+        if scope is None:
+            return self.import_name(modname, name)
+
+        if name not in scope.bindings:
+            return self.import_name(modname, name)
+
+        return self.resolve_name(scope, name)
+
+    def resolve_expr(self, scope, node):
+        """Resolves a name or an attribute chain in a module scope.
+        """
+
+        if isinstance(node, ast.Name):
+            return self.resolve_name(scope, node.id)
+
+        if not isinstance(node, ast.Attribute):
+            return DATA
+
+        host = self.resolve_expr(scope, node.value)
+
+        if isinstance(host, ModuleRef):
+            return self.resolve_import(host.modname, node.attr)
+
+        return DATA
+
+    def import_name(self, modname, name):
+        """Fallback: imports the module and takes the name.
+        """
+
+        try:
+            module = importlib.import_module(modname)
+        except Exception:  # pylint: disable=broad-except
+            return DATA
+
+        value = getattr(module, name, DATA)
+
+        if inspect.ismodule(value):
+            return ModuleRef(value.__name__)
+
+        return value
+
+    # Classes
+
+    def get_class_signature(self, scope, clsstub) -> str:
+
+        clsstub.signature = '()'
+
+        if scope.inits.get(clsstub.__name__):
+            return self.signer.make_signature(
+                scope.inits[clsstub.__name__], bound=True,
+                constants=scope.constants
+            )
+
+        for base in scope.bases.get(clsstub.__name__, []):
+            sign = self.get_base_signature(scope, base)
+            if sign is not None:
+                return sign
+
+        return '()'
+
+    def get_base_signature(self, scope, basenode):
+
+        base = self.resolve_expr(scope, basenode)
+
+        if isinstance(base, ClassStub):
+            return self.get_stub_signature(base)
+
+        if not inspect.isclass(base) or base is object:
+            return None
+
+        try:
+            return str(inspect.signature(base))
+        except (TypeError, ValueError):
+            return None
+
+    def get_stub_signature(self, clsstub):
+
+        scope = self.scopes.get(clsstub.__module__)
+
+        if clsstub.signature is None:
+            clsstub.signature = self.get_class_signature(scope, clsstub)
+
+        if clsstub.signature == '()':
+            return None
+
+        return clsstub.signature
+
+
+class ModuleScope:
+    """Top-level bindings of a parsed module.
+    """
+
+    def __init__(self, modname, filepath):
+
+        self.modname = modname
+        self.filepath = filepath
+
+        self.docs = None
+        self.bindings = {}
+        self.constants = {}
+        self.exports = []
+        self.has_getattr = False
+
+        self.patches = []
+        self.inits = {}
+        self.bases = {}
+
+    def get_package(self) -> str:
+        if os.path.basename(self.filepath) == '__init__.py':
+            return self.modname
+        package, _, _ = self.modname.rpartition('.')
+        return package
+
+    def public_names(self) -> list[str]:
+
+        if self.exports:
+            return list(self.exports)
+
+        return [
+            name for name in self.bindings if not name.startswith('_')
+        ]
+
+
+class ScopeBuilder:
+    """Collects top-level bindings of a module.
+    """
+
+    DESCRIPTORS = (
+        'staticmethod', 'classmethod', 'property'
+    )
+
+    WRAPPERS = (
+        'cache', 'lru_cache', 'cached_property'
+    )
+
+    def __init__(self, loader):
+        self.loader = loader
+        self.scope = None
+        self.strings = {}
+
+    def build(self, scope):
+
+        self.scope = scope
+        self.strings = {}
+
+        with open(scope.filepath, encoding='utf-8') as file:
+            astmodule = ast.parse(file.read())
+
+        scope.docs = ast.get_docstring(astmodule, clean=False)
+        self.visit_body(astmodule.body)
+
+    def visit_body(self, body):
+        for node in body:
+            self.visit_node(node)
+
+    def visit_node(self, node):
+
+        handler = getattr(
+            self, 'visit_' + type(node).__name__, None
+        )
+
+        if handler is not None:
+            handler(node)
+
+    def bind(self, name, value):
+        self.scope.bindings[name] = value
+        self.scope.constants.pop(name, None)
+
+    # Definitions
+
+    def visit_FunctionDef(self, node):
+
+        if node.name == '__getattr__':
+            self.scope.has_getattr = True
+
+        if self.is_wrapped(node):
+            self.bind(node.name, DATA)
+            return
+
+        self.bind(node.name, self.make_func_stub(node))
+
+    def visit_AsyncFunctionDef(self, node):
+        self.visit_FunctionDef(node)
+
+    def visit_ClassDef(self, node):
+
+        stub = ClassStub(
+            node.name,
+            ast.get_docstring(node, clean=False),
+            self.scope.modname
+        )
+
+        methods = {}
+        for item in node.body:
+            if self.is_plain_method(item):
+                methods[item.name] = self.make_func_stub(item)
+
+        stub.methods = list(methods.values())
+
+        self.scope.inits[node.name] = self.find_init(node)
+        self.scope.bases[node.name] = list(node.bases)
+
+        self.bind(node.name, stub)
+
+    def make_func_stub(self, node):
+        return FuncStub(
+            node.name,
+            ast.get_docstring(node, clean=False),
+            self.loader.signer.make_signature(
+                node, constants=self.scope.constants
+            ),
+            self.scope.modname
+        )
+
+    def find_init(self, node):
+        for item in reversed(node.body):
+            if isinstance(item, ast.FunctionDef):
+                if item.name == '__init__':
+                    return item
+        return None
+
+    def is_plain_method(self, node):
+
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            return False
+
+        for decorator in node.decorator_list:
+            if self.is_descriptor(decorator):
+                return False
+
+        return not self.is_wrapped(node)
+
+    def is_wrapped(self, node):
+        """Checks for decorators that replace functions with objects.
+        """
+
+        for decorator in node.decorator_list:
+
+            if isinstance(decorator, ast.Call):
+                decorator = decorator.func
+
+            if isinstance(decorator, ast.Name):
+                name = decorator.id
+            elif isinstance(decorator, ast.Attribute):
+                name = decorator.attr
+            else:
+                continue
+
+            if name in self.WRAPPERS:
+                return True
+
+        return False
+
+    def is_descriptor(self, decorator):
+
+        if isinstance(decorator, ast.Name):
+            return decorator.id in self.DESCRIPTORS
+
+        if isinstance(decorator, ast.Attribute):
+            return decorator.attr in ('setter', 'getter', 'deleter')
+
+        return False
+
+    # Imports
+
+    def visit_Import(self, node):
+        for alias in node.names:
+            if alias.asname:
+                self.bind(alias.asname, ModuleRef(alias.name))
+            else:
+                topname, _, _ = alias.name.partition('.')
+                self.bind(topname, ModuleRef(topname))
+
+    def visit_ImportFrom(self, node):
+
+        modname = self.get_absolute_name(node)
+
+        for alias in node.names:
+            if alias.name == '*':
+                self.bind_star_import(modname)
+            else:
+                self.bind(
+                    alias.asname or alias.name, ImportRef(modname, alias.name)
+                )
+
+    def get_absolute_name(self, node) -> str:
+
+        if not node.level:
+            return node.module
+
+        package = self.scope.get_package()
+        parts = package.split('.')
+
+        if node.level > 1:
+            parts = parts[:-(node.level-1)]
+
+        if node.module:
+            parts.append(node.module)
+
+        return '.'.join(parts)
+
+    def bind_star_import(self, modname):
+
+        scope = self.loader.get_scope(modname)
+
+        if scope is None:
+            self.bind_live_star_import(modname)
+            return
+
+        for name in scope.public_names():
+            self.bind(name, ImportRef(modname, name))
+
+    def bind_live_star_import(self, modname):
+
+        try:
+            module = importlib.import_module(modname)
+        except Exception:  # pylint: disable=broad-except
+            return
+
+        names = getattr(module, '__all__', None)
+
+        if names is None:
+            names = [
+                name for name in vars(module) if not name.startswith('_')
+            ]
+
+        for name in names:
+            self.bind(name, Unresolved(modname, name))
+
+    # Assignments
+
+    def visit_Assign(self, node):
+        for target in node.targets:
+            self.assign(target, node.value)
+
+    def visit_AnnAssign(self, node):
+        if node.value is not None:
+            self.assign(node.target, node.value)
+
+    def visit_AugAssign(self, node):
+        if self.is_exports(node.target):
+            self.scope.exports.extend(self.fetch_strings(node.value))
+
+    def assign(self, target, value):
+
+        if self.is_exports(target):
+            self.scope.exports = self.fetch_strings(value)
+            return
+
+        if isinstance(target, ast.Attribute):
+            self.assign_attribute(target, value)
+            return
+
+        if not isinstance(target, ast.Name):
+            return
+
+        self.bind(target.id, self.evaluate(value))
+        self.strings[target.id] = self.fetch_strings(value)
+
+        if self.is_constant(value):
+            self.scope.constants[target.id] = ast.literal_eval(value)
+
+    def assign_attribute(self, target, value):
+        """Handles renaming like `func.__name__ = 'name'`.
+        """
+
+        if target.attr not in ('__name__', '__doc__'):
+            return
+        if not isinstance(target.value, ast.Name):
+            return
+        if not isinstance(value, ast.Constant):
+            return
+
+        self.scope.patches.append(
+            (target.value.id, target.attr, value.value)
+        )
+
+    def evaluate(self, value):
+
+        if isinstance(value, ast.Name):
+            return self.scope.bindings.get(value.id, DATA)
+
+        if isinstance(value, ast.Attribute):
+            return self.evaluate_attribute(value)
+
+        return DATA
+
+    def evaluate_attribute(self, node):
+
+        host = self.evaluate(node.value)
+
+        if isinstance(host, ModuleRef):
+            return ImportRef(host.modname, node.attr)
+
+        if isinstance(host, ImportRef):
+            return ImportRef(host.modname + '.' + host.name, node.attr)
+
+        return DATA
+
+    def is_constant(self, value) -> bool:
+        """Checks for literals like `3`, `-1.5` or `'utf-8'`.
+        """
+
+        if isinstance(value, ast.UnaryOp):
+            if not isinstance(value.op, (ast.USub, ast.UAdd)):
+                return False
+            value = value.operand
+
+        return isinstance(value, ast.Constant)
+
+    def is_exports(self, target):
+        return isinstance(target, ast.Name) and target.id == '__all__'
+
+    def fetch_strings(self, node) -> list[str]:
+        """Returns strings of a literal, e.g. `['a', 'b']`, or of
+        a module-level literal copied by name, e.g. `list(NAMES)`.
+        """
+
+        if self.is_copy(node):
+            node = node.args[0]
+
+        if isinstance(node, ast.Name):
+            return list(self.strings.get(node.id, []))
+
+        if isinstance(node, ast.Dict):
+            items = node.keys
+        elif isinstance(node, (ast.List, ast.Tuple)):
+            items = node.elts
+        else:
+            return []
+
+        return [
+            item.value for item in items
+            if isinstance(item, ast.Constant) and isinstance(item.value, str)
+        ]
+
+    def is_copy(self, node) -> bool:
+        return (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in ('list', 'tuple')
+            and len(node.args) == 1 and not node.keywords
+        )
+
+    # Control flow
+
+    def visit_Try(self, node):
+        self.visit_body(node.body)
+
+    def visit_If(self, node):
+        if not self.is_main_check(node.test):
+            self.visit_body(node.body)
+
+    def is_main_check(self, test):
+        return ast.unparse(test) in (
+            "__name__ == '__main__'", '__name__ == "__main__"'
+        )
+
+
+class SourceFinder:
+    """Finds source files of python modules.
+    """
+
+    def __init__(self):
+        self.rootdirs = []
+        self.found = {}
+
+    def get_script_path(self, path) -> str:
+
+        if os.path.isdir(path):
+            path = os.path.join(path, '__init__.py')
+
+        if not os.path.isfile(path):
+            raise FileNotFoundError(
+                f"python source not found: '{path}'"
+            )
+
+        return os.path.abspath(path)
+
+    def get_module_name(self, filepath) -> str:
+        """Derives the full module name from the package structure.
+        """
+
+        dirpath, filename = os.path.split(filepath)
+
+        parts = []
+        if filename != '__init__.py':
+            parts.append(filename.removesuffix('.py'))
+
+        while os.path.isfile(os.path.join(dirpath, '__init__.py')):
+            dirpath, dirname = os.path.split(dirpath)
+            parts.insert(0, dirname)
+
+        return '.'.join(parts)
+
+    def add_root_for_module(self, filepath, modname):
+        """Registers the folder that holds the top-level package.
+        """
+
+        dirpath = os.path.dirname(filepath)
+
+        depth = modname.count('.')
+        if os.path.basename(filepath) == '__init__.py':
+            depth += 1
+
+        for _ in range(depth):
+            dirpath = os.path.dirname(dirpath)
+
+        if dirpath not in self.rootdirs:
+            self.rootdirs.insert(0, dirpath)
+            self.found.clear()
+
+    def get_search_dirs(self) -> list[str]:
+        syspaths = [
+            path or os.getcwd() for path in sys.path if isinstance(path, str)
+        ]
+        return self.rootdirs + syspaths
+
+    def find_module(self, modname) -> str | None:
+        """Returns the path to the module source or None.
+        """
+
+        if modname not in self.found:
+            self.found[modname] = self.search_module(modname)
+
+        return self.found[modname]
+
+    def search_module(self, modname) -> str | None:
+
+        parts = modname.split('.')
+
+        for dirpath in self.get_search_dirs():
+            path = self.search_in_dir(dirpath, parts)
+            if path is not None:
+                return path
+
+        return None
+
+    def search_in_dir(self, dirpath, parts):
+
+        basepath = os.path.join(dirpath, *parts)
+
+        candidates = [
+            os.path.join(basepath, '__init__.py'), basepath + '.py'
+        ]
+
+        for path in candidates:
+            if os.path.isfile(path):
+                return path
+
+        return None
+
+
+class SignatureMaker:
+    """Renders signatures of function definitions.
+
+    - Follows the format of `str(inspect.signature())`.
+    - Annotations and defaults are taken from the source code.
+    - Names of module-level constants (literals) in defaults are
+      replaced by their values, as in live signatures. Other
+      expressions are kept as written, e.g. `key=DEFAULTS['key']`.
+
+    """
+
+    def make_signature(self, astfunc, bound=False, constants=None) -> str:
+
+        params = self.get_params(astfunc.args, constants or {})
+
+        if bound and params and not params[0].startswith(('/', '*')):
+            params.pop(0)
+            if params and params[0] == '/':
+                params.pop(0)
+
+        sign = '(' + ', '.join(params) + ')'
+
+        if astfunc.returns is not None and not bound:
+            sign += ' -> ' + ast.unparse(astfunc.returns)
+
+        return sign
+
+    def get_params(self, args, constants=None) -> list[str]:
+
+        params = []
+        constants = constants or {}
+
+        positional = [*args.posonlyargs, *args.args]
+        defaults = [None]*(len(positional) - len(args.defaults))
+        defaults += [
+            self.resolve_default(node, constants) for node in args.defaults
+        ]
+
+        for index, (arg, default) in enumerate(zip(positional, defaults)):
+            params.append(self.render_param(arg, default))
+            if index == len(args.posonlyargs) - 1:
+                params.append('/')
+
+        if args.vararg is not None:
+            params.append('*' + self.render_param(args.vararg, None))
+        elif args.kwonlyargs:
+            params.append('*')
+
+        for arg, default in zip(args.kwonlyargs, args.kw_defaults):
+            default = self.resolve_default(default, constants)
+            params.append(self.render_param(arg, default))
+
+        if args.kwarg is not None:
+            params.append('**' + self.render_param(args.kwarg, None))
+
+        return params
+
+    def resolve_default(self, node, constants):
+        """Replaces the name of a known constant by its value.
+        """
+
+        if isinstance(node, ast.Name) and node.id in constants:
+            return ast.Constant(constants[node.id])
+
+        return node
+
+    def render_param(self, arg, default) -> str:
+
+        param = arg.arg
+
+        if arg.annotation is not None:
+            param += ': ' + ast.unparse(arg.annotation)
+
+        if default is None:
+            return param
+
+        if arg.annotation is not None:
+            return param + ' = ' + ast.unparse(default)
+
+        return param + '=' + ast.unparse(default)
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""Folds large call trees and class trees in HTML reports.
+
+- Tree views are parsed back from the text blocks of a docpage.
+- Nodes deeper than the max depth are folded (expanded on click).
+- Children beyond the max breadth are folded into a "more" line.
+- Folded subtrees are stored as compact JSON after the block,
+  repeated subtrees are stored once and referenced by index.
+
+"""
+
+import re
+import json
+
+from ..utils import deeptrees
+
+__all__ = [
+    'foldtrees_html'
+]
+
+MAXDEPTH = 3
+MAXBREADTH = 20
+
+TREEBLOCK = re.compile(
+    r'<pre class="(call-trees|class-trees)">(.*?)</pre>', flags=re.DOTALL
+)
+
+ROOTSIGN = '• '
+BODYNODE = '├─ '
+LASTNODE = '└─ '
+VERTLINE = '│  '
+BLANK = '   '
+
+
+def foldtrees_html(pagehtml, maxdepth=MAXDEPTH,
+                   maxbreadth=MAXBREADTH) -> str:
+    """Folds call trees and class trees of an HTML report.
+
+    Parameters
+    ----------
+    pagehtml : str
+        HTML docpage with a report.
+    maxdepth : int = 3
+        Depth of nodes shown, deeper subtrees are folded.
+    maxbreadth : int = 20
+        Number of children shown, the rest are folded.
+
+    Returns
+    -------
+    str
+        The docpage, trees within the limits are kept as they are.
+
+    """
+
+    if maxdepth < 1 or maxbreadth < 1:
+        raise ValueError('max depth and breadth must be positive')
+
+    def foldblock(matchobj):
+        folder = TreesFolder(maxdepth, maxbreadth)
+        return folder.fold_block(*matchobj.groups()) or matchobj.group()
+
+    return TREEBLOCK.sub(foldblock, pagehtml)
+
+
+def parse_tree_views(text) -> list:
+    """Parses text tree views back into trees.
+    """
+
+    roots = []
+    stack = []
+
+    for line in text.splitlines():
+
+        if not line:
+            continue
+
+        if line.startswith(ROOTSIGN):
+            stack = [deeptrees.TreeNode(line[len(ROOTSIGN):])]
+            roots.append(stack[0])
+            continue
+
+        depth, label = parse_tree_line(line[len(ROOTSIGN):])
+
+        node = deeptrees.TreeNode(label)
+        parent = stack[depth-1]
+
+        parent.children = (parent.children or []) + [node]
+        stack[depth:] = [node]
+
+    return roots
+
+
+def parse_tree_line(body) -> tuple[int, str]:
+
+    depth = 1
+
+    while body.startswith((VERTLINE, BLANK)):
+        body = body[len(VERTLINE):]
+        depth += 1
+
+    return depth, body[len(BODYNODE):]
+
+
+class TreesFolder:
+    """Renders trees of a block with folded nodes.
+    """
+
+    def __init__(self, maxdepth, maxbreadth):
+        self.maxdepth = maxdepth
+        self.maxbreadth = maxbreadth
+        self.nodes = []
+        self.keys = {}
+        self.refs = {}
+
+    def fold_block(self, cssclass, text) -> str | None:
+        """Returns the folded block or None, if within the limits.
+        """
+
+        roots = parse_tree_views(text)
+
+        if all(map(self.is_within_limits, roots)):
+            return None
+
+        views = [
+            ''.join(self.render_tree(root)) for root in roots
+        ]
+
+        pre = (
+            f'<pre class="{cssclass} lazy-trees" '
+            f'data-breadth="{self.maxbreadth}">' + '\n'.join(views) + '</pre>'
+        )
+
+        data = json.dumps(self.nodes, ensure_ascii=False)
+        data = data.replace('</', '<\\/')
+
+        script = (
+            f'<script type="application/json" class="tree-data">'
+            f'{data}</script>'
+        )
+
+        return pre + script
+
+    def is_within_limits(self, root, depth=0) -> bool:
+
+        children = root.children or []
+
+        if not children:
+            return True
+
+        if depth == self.maxdepth or len(children) > self.maxbreadth:
+            return False
+
+        return all(
+            self.is_within_limits(child, depth+1) for child in children
+        )
+
+    def render_tree(self, root) -> list[str]:
+
+        lines = [ROOTSIGN + root.data + '\n']
+
+        if root.children:
+            self.render_children(root, 0, chr(32)*len(ROOTSIGN), lines)
+
+        return lines
+
+    def render_children(self, node, depth, indent, lines):
+
+        children = node.children
+        count = len(children)
+
+        for index, child in enumerate(children[:self.maxbreadth]):
+
+            islast = index == count - 1
+
+            line = indent + (LASTNODE if islast else BODYNODE) + child.data
+            subindent = indent + (BLANK if islast else VERTLINE)
+
+            if not child.children:
+                lines.append(line + '\n')
+            elif depth + 1 < self.maxdepth:
+                lines.append(line + '\n')
+                self.render_children(child, depth+1, subindent, lines)
+            else:
+                lines.append(
+                    self.make_fold(line, self.intern(child), subindent)
+                )
+
+        if count > self.maxbreadth:
+            lines.append(
+                self.make_more(node, indent, count)
+            )
+
+    def make_fold(self, line, ref, indent) -> str:
+        """Returns a line expanded on click (line break included).
+        """
+        return (
+            f'<span class="tree-fold" data-ref="{ref}" '
+            f'data-indent="{indent}">{line}\n</span>'
+        )
+
+    def make_more(self, node, indent, count) -> str:
+
+        ref = self.intern(node)
+        line = f'{indent}{LASTNODE}… {count - self.maxbreadth} more'
+
+        return (
+            f'<span class="tree-fold tree-more" data-ref="{ref}" '
+            f'data-indent="{indent}" data-start="{self.maxbreadth}">'
+            f'{line}\n</span>'
+        )
+
+    def intern(self, node) -> int:
+        """Returns the index of a subtree, equal subtrees share one.
+        """
+
+        ref = self.refs.get(id(node))
+
+        if ref is not None:
+            return ref
+
+        childrefs = [
+            self.intern(child) for child in node.children or []
+        ]
+
+        key = (node.data, *childrefs)
+
+        if key not in self.keys:
+            self.keys[key] = len(self.nodes)
+            self.nodes.append(
+                [node.data, childrefs] if childrefs else [node.data]
+            )
+
+        self.refs[id(node)] = self.keys[key]
+
+        return self.keys[key]
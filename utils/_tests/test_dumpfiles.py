@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Tests the shared writer of output files.
+"""
+
+import io
+import os
+import tarfile
+import zipfile
+import tempfile
+import unittest
+
+from docspyer.utils import dumpfiles
+
+
+class TestDumpFile(unittest.TestCase):
+
+    def test_write_if_changed(self):
+
+        with tempfile.TemporaryDirectory() as dirpath:
+
+            filepath = os.path.join(dirpath, 'page.html')
+            dumpfiles.resetstats()
+
+            assert dumpfiles.dumpfile(filepath, 'TEXT') is True
+            mtime = os.stat(filepath).st_mtime_ns
+
+            assert dumpfiles.dumpfile(filepath, 'TEXT') is False
+            assert os.stat(filepath).st_mtime_ns == mtime
+
+            assert dumpfiles.dumpfile(filepath, 'NEWS') is True
+
+            with open(filepath, encoding='utf-8') as file:
+                assert file.read() == 'NEWS'
+
+            assert os.listdir(dirpath) == ['page.html']
+            assert dumpfiles.getstats() == {'written': 2, 'skipped': 1}
+
+    def test_file_mode(self):
+
+        with tempfile.TemporaryDirectory() as dirpath:
+
+            filepath = os.path.join(dirpath, 'page.html')
+            dumpfiles.dumpfile(filepath, 'TEXT')
+
+            mode = os.stat(filepath).st_mode & 0o777
+            assert mode == dumpfiles.FileWriter.get_new_filemode()
+
+            os.chmod(filepath, 0o600)
+            dumpfiles.dumpfile(filepath, 'NEWS')
+
+            assert os.stat(filepath).st_mode & 0o777 == 0o600
+
+    def test_no_folder(self):
+        with self.assertRaises(FileNotFoundError):
+            dumpfiles.dumpfile('/nofolder/page.html', 'TEXT')
+
+
+class TestArchives(unittest.TestCase):
+
+    def test_zip_file_object(self):
+
+        stream = io.BytesIO()
+
+        with dumpfiles.writeto(stream):
+            assert dumpfiles.dumpfile('index.html', 'INDEX') is True
+            assert dumpfiles.dumpfile('index.html', 'INDEX') is False
+            assert dumpfiles.isdumped('index.html') is True
+            dumpfiles.dumpfile('sub/page.html', 'PAGE')
+
+        with zipfile.ZipFile(stream) as archive:
+            assert archive.namelist() == ['index.html', 'sub/page.html']
+            assert archive.read('sub/page.html') == b'PAGE'
+
+    def test_tar_path(self):
+
+        with tempfile.TemporaryDirectory() as dirpath:
+
+            tarpath = os.path.join(dirpath, 'docs.tar.gz')
+
+            with dumpfiles.writeto(tarpath):
+                dumpfiles.dumpfile('index.html', 'INDEX')
+
+            with tarfile.open(tarpath) as archive:
+                assert archive.getnames() == ['index.html']
+
+    def test_conflict(self):
+        with dumpfiles.writeto(io.BytesIO()):
+            dumpfiles.dumpfile('index.html', 'INDEX')
+            with self.assertRaises(ValueError):
+                dumpfiles.dumpfile('index.html', 'OTHER')
+
+    def test_is_archive(self):
+        assert dumpfiles.isarchive('docs.zip') is True
+        assert dumpfiles.isarchive('docs.tgz') is True
+        assert dumpfiles.isarchive(io.BytesIO()) is True
+        assert dumpfiles.isarchive('docs') is False
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Tests tracing of build stages.
+"""
+
+import os
+import json
+import tempfile
+import unittest
+
+import docspyer
+from docspyer.utils import tracing
+
+
+def get_src_path():
+    return os.path.join(
+        os.path.dirname(docspyer.__file__), 'docmakers', '_tests'
+    )
+
+
+class TestSpans(unittest.TestCase):
+
+    def test_off(self):
+
+        with tracing.span('write', file='a') as args:
+            args['bytes'] = 1
+
+        assert tracing.gettracer() is None
+
+    def test_nested(self):
+
+        tracer = tracing.Tracer()
+
+        with tracing.tracerun(tracer):
+            with tracing.tracerun() as inner:
+                with tracing.span('write', file='a') as args:
+                    args['bytes'] = 10
+
+        assert inner is tracer
+        assert tracing.gettracer() is None
+
+        event, = tracer.events
+
+        assert event['ph'] == 'X'
+        assert event['args'] == {'file': 'a', 'bytes': 10}
+
+
+class TestBuildTrace(unittest.TestCase):
+
+    def test_builddocs(self):
+
+        with tempfile.TemporaryDirectory() as dirpath:
+
+            tracepath = os.path.join(dirpath, 'trace.json')
+            docpath = os.path.join(dirpath, 'docs')
+            os.mkdir(docpath)
+
+            docspyer.builddocs(get_src_path(), docpath, trace=tracepath)
+
+            with open(tracepath, encoding='utf-8') as file:
+                events = json.load(file)['traceEvents']
+
+        names = {event['name'] for event in events}
+
+        assert {'read', 'parse', 'toc', 'markup', 'render'} <= names
+        assert {'page', 'static', 'write'} <= names
+
+        pages = [
+            event['args']['file'] for event in events
+            if event['name'] == 'page'
+        ]
+
+        assert 'index.html' in pages
+
+    def test_summary(self):
+
+        tracer = tracing.Tracer()
+
+        with tempfile.TemporaryDirectory() as docpath:
+            pkgpath = os.path.dirname(get_src_path())
+            docspyer.docpackage(pkgpath, docpath, 'html', trace=tracer)
+
+        summary = tracer.summary().splitlines()
+
+        assert summary[0].startswith('stage ')
+        assert any(line.startswith('report ') for line in summary)
+        assert tracer.slowest('report', 1)[0]['args']['file']
+
+
+if __name__ == '__main__':
+    unittest.main()
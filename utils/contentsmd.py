@@ -38,6 +38,13 @@ def makemultitoc(sources, level) -> str:
     return maker.contents_from_sources(sources, level)
 
 
+def keepheadings(source) -> str:
+    """Keeps only headings of an MD file (enough to make its TOC).
+    """
+    headings = TocMaker().fetch_headings(source)
+    return '\n\n'.join(headings)
+
+
 class ContentsMaker:
     """Base class for contents makers.
     """
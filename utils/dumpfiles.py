@@ -0,0 +1,431 @@
+# -*- coding: utf-8 -*-
+"""Output layer shared by all writers of documentation files.
+
+Sinks:
+
+    FileWriter — files in folders (default)
+    ArchiveSink
+     ├─ ZipSink — members of a zip archive
+     └─ TarSink — members of a tar archive
+
+- A file is written only if its content has changed.
+- A file is written to a temporary file and renamed (atomic).
+- A rewritten file keeps its mode, new files get the umask mode.
+- Existing directories are remembered, not checked for each file.
+- Written and skipped files are counted.
+- Archives are selected by `writeto()` for the current context.
+- Sinks and counts belong to the current context (thread).
+
+"""
+
+import io
+import os
+import stat
+import time
+import hashlib
+import tarfile
+import zipfile
+import tempfile
+import contextlib
+import threading
+import contextvars
+
+from . import tracing
+
+__all__ = [
+    'dumpfile', 'dumpbytes', 'isdumped', 'isarchive', 'writeto',
+    'getstats', 'resetstats'
+]
+
+ZIP_SUFFIXES = (
+    '.zip',
+)
+
+TAR_SUFFIXES = (
+    '.tar', '.tar.gz', '.tgz'
+)
+
+# The earliest time supported by zip (1980-01-01).
+ZIP_EPOCH = 315532800
+
+
+def dumpfile(filepath, content) -> bool:
+    """Writes a text file, if its content has changed.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the output file.
+    content : str
+        Text to be written (UTF-8).
+
+    Returns
+    -------
+    bool
+        True, if the file was written, False if skipped.
+
+    """
+
+    return dumpbytes(
+        filepath, content.encode('utf-8')
+    )
+
+
+def dumpbytes(filepath, data) -> bool:
+    """Writes a binary file, if its content has changed.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the output file.
+    data : bytes
+        Content to be written.
+
+    Returns
+    -------
+    bool
+        True, if the file was written, False if skipped.
+
+    """
+
+    with tracing.span('write', file=filepath, bytes=len(data)):
+        return getsink().write(filepath, data)
+
+
+def isdumped(filepath) -> bool:
+    """Checks if a file exists in the current output.
+    """
+    return getsink().contains(filepath)
+
+
+def isarchive(output) -> bool:
+    """Checks if the output is an archive path or a file object.
+    """
+
+    if hasattr(output, 'write'):
+        return True
+
+    return str(output).endswith(
+        ZIP_SUFFIXES + TAR_SUFFIXES
+    )
+
+
+@contextlib.contextmanager
+def writeto(output):
+    """Sends files to an archive within the context.
+
+    Parameters
+    ----------
+    output : str | file
+        Path to an archive (.zip, .tar, .tar.gz, .tgz)
+        or a writable binary file (zip, unless named as tar).
+
+    Notes
+    -----
+
+    - Paths of files are used as names of archive members.
+    - The archive is closed on exit from the context.
+
+    """
+
+    sink = make_archive_sink(output)
+    token = SINK.set(sink)
+
+    try:
+        yield sink
+    finally:
+        SINK.reset(token)
+        sink.close()
+
+
+def make_archive_sink(output):
+
+    name = getattr(output, 'name', output)
+
+    if str(name).endswith(TAR_SUFFIXES):
+        return TarSink(output)
+
+    return ZipSink(output)
+
+
+def getsink():
+    return SINK.get() or WRITER
+
+
+def getstats() -> dict:
+    """Returns numbers of written and skipped files in the current context.
+    """
+    return getcounter().getstats()
+
+
+def resetstats() -> None:
+    """Resets numbers of written and skipped files in the current context.
+    """
+    STATS.set(WriteStats())
+    WRITER.forget_dirs()
+
+
+def getcounter():
+    """Returns the counter of the current context, a new one if not set.
+    """
+
+    counter = STATS.get()
+
+    if counter is None:
+        counter = WriteStats()
+        STATS.set(counter)
+
+    return counter
+
+
+def get_umask() -> int:
+    """Reads the umask, it is set for the whole process meanwhile.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def get_timestamp() -> float:
+    """Returns SOURCE_DATE_EPOCH, if set, for reproducible archives.
+    """
+
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+
+    if epoch:
+        return float(epoch)
+    return time.time()
+
+
+class WriteStats:
+    """Numbers of written and skipped files.
+    """
+
+    def __init__(self):
+        self.written = 0
+        self.skipped = 0
+
+    def add_written(self):
+        self.written += 1
+
+    def add_skipped(self):
+        self.skipped += 1
+
+    def getstats(self) -> dict:
+        return {
+            'written': self.written, 'skipped': self.skipped
+        }
+
+    def reset(self):
+        self.written = 0
+        self.skipped = 0
+
+
+class FileWriter:
+    """Writes files atomically, if their content has changed.
+    """
+
+    # Mode of new files, computed on the first write.
+    FILEMODE = None
+    LOCK = threading.Lock()
+
+    def __init__(self):
+        self.dirpaths = set()
+
+    def write(self, filepath, data) -> bool:
+
+        self.check_dir(
+            os.path.dirname(filepath) or '.'
+        )
+
+        if self.is_unchanged(filepath, data):
+            getcounter().add_skipped()
+            return False
+
+        self.write_atomic(filepath, data)
+        getcounter().add_written()
+
+        return True
+
+    def contains(self, filepath) -> bool:
+        return os.path.isfile(filepath)
+
+    def check_dir(self, dirpath):
+
+        if dirpath in self.dirpaths:
+            return
+
+        if not os.path.isdir(dirpath):
+            raise FileNotFoundError(
+                f"output directory does not exist: '{dirpath}'"
+            )
+
+        self.dirpaths.add(dirpath)
+
+    def is_unchanged(self, filepath, data) -> bool:
+
+        try:
+            size = os.path.getsize(filepath)
+        except OSError:
+            return False
+
+        if size != len(data):
+            return False
+
+        with open(filepath, mode='rb') as file:
+            return file.read() == data
+
+    def write_atomic(self, filepath, data):
+        """Writes to a temporary file in the same folder and renames it.
+        """
+
+        dirpath, filename = os.path.split(filepath)
+        filemode = self.get_filemode(filepath)
+
+        fd, temppath = tempfile.mkstemp(
+            dir=dirpath or '.', prefix='.' + filename + '.', suffix='.tmp'
+        )
+
+        try:
+            with os.fdopen(fd, mode='wb') as file:
+                file.write(data)
+            os.chmod(temppath, filemode)
+            os.replace(temppath, filepath)
+        except BaseException:
+            os.remove(temppath)
+            raise
+
+    def get_filemode(self, filepath) -> int:
+        """Returns the mode of the existing file or of new files.
+        """
+
+        try:
+            return stat.S_IMODE(os.stat(filepath).st_mode)
+        except OSError:
+            return self.get_new_filemode()
+
+    @classmethod
+    def get_new_filemode(cls) -> int:
+
+        with cls.LOCK:
+            if cls.FILEMODE is None:
+                cls.FILEMODE = 0o666 & ~get_umask()
+
+        return cls.FILEMODE
+
+    def forget_dirs(self):
+        self.dirpaths.clear()
+
+
+class ArchiveSink:
+    """Streams files into an archive (base class).
+
+    - Each member is added once, repeated identical files are skipped.
+    - Different content under the same name is an error.
+
+    """
+
+    def __init__(self, output):
+        self.hashes = {}
+        self.timestamp = get_timestamp()
+        self.archive = self.open_archive(output)
+
+    def open_archive(self, output):
+        """Returns the archive opened for writing.
+        """
+
+    def add_member(self, name, data):
+        """Adds a member to the archive.
+        """
+
+    def write(self, filepath, data) -> bool:
+
+        name = self.get_member_name(filepath)
+        datahash = gethash(data)
+
+        oldhash = self.hashes.get(name)
+
+        if oldhash == datahash:
+            getcounter().add_skipped()
+            return False
+
+        if oldhash is not None:
+            raise ValueError(
+                f"'{name}' is already in the archive with other content"
+            )
+
+        self.add_member(name, data)
+
+        self.hashes[name] = datahash
+        getcounter().add_written()
+
+        return True
+
+    def contains(self, filepath) -> bool:
+        return self.get_member_name(filepath) in self.hashes
+
+    def get_member_name(self, filepath) -> str:
+        name = os.path.normpath(filepath).replace(os.sep, '/')
+        return name.lstrip('/')
+
+    def close(self):
+        self.archive.close()
+
+
+class ZipSink(ArchiveSink):
+    """Streams files into a zip archive.
+    """
+
+    def open_archive(self, output):
+        return zipfile.ZipFile(
+            output, mode='w', compression=zipfile.ZIP_DEFLATED
+        )
+
+    def add_member(self, name, data):
+
+        timestamp = max(self.timestamp, ZIP_EPOCH)
+
+        info = zipfile.ZipInfo(
+            name, date_time=time.gmtime(timestamp)[:6]
+        )
+
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o644 << 16
+
+        self.archive.writestr(info, data)
+
+
+class TarSink(ArchiveSink):
+    """Streams files into a tar archive (gzipped, if named so).
+    """
+
+    def open_archive(self, output):
+
+        name = str(getattr(output, 'name', output))
+        compression = 'gz' if name.endswith(('.gz', '.tgz')) else ''
+
+        if hasattr(output, 'write'):
+            return tarfile.open(fileobj=output, mode='w|' + compression)
+
+        return tarfile.open(output, mode='w:' + compression)
+
+    def add_member(self, name, data):
+
+        info = tarfile.TarInfo(name)
+
+        info.size = len(data)
+        info.mode = 0o644
+        info.mtime = int(self.timestamp)
+
+        self.archive.addfile(
+            info, io.BytesIO(data)
+        )
+
+
+def gethash(data) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+SINK = contextvars.ContextVar('SINK', default=None)
+STATS = contextvars.ContextVar('STATS', default=None)
+WRITER = FileWriter()
@@ -51,16 +51,18 @@ def invertmap(name_to_names) -> dict:
     for value in name_to_names.values():
         set_of_values.update(value)
 
+    # Dicts keep the order of keys and check them in constant time.
     value_to_keys = {
-        value: [] for value in set_of_values
+        value: {} for value in set_of_values
     }
 
     for key, values in name_to_names.items():
         for value in values:
-            if key not in value_to_keys[value]:
-                value_to_keys[value].append(key)
+            value_to_keys[value][key] = None
 
-    return value_to_keys
+    return {
+        value: list(keys) for value, keys in value_to_keys.items()
+    }
 
 
 def exclude_non_native_names(name_to_names) -> dict:
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""Opt-in tracing of build stages.
+
+Stages:
+
+    read — reading a source file
+    parse — splitting MD text into blocks (MDParser)
+    toc — local TOC with github-style IDs
+    markup — blocks as HTML (inline MD included)
+    highlight — build-time highlighting of code blocks
+    render — filling the page template
+    page — making and writing a docpage
+    report — making a report on a python script
+    modtomd — documenting a module in MD
+    imports — analyzing imports between modules of a package
+    static — dumping static files
+    write — writing a file
+
+- Spans are recorded only within `tracerun()` (current context).
+- Spans carry file names and byte counts, if known.
+- Spans carry memory peaks (tracemalloc), if the tracer tracks memory.
+- Spans are exported as Chrome trace events or as a summary table.
+
+"""
+
+import os
+import json
+import time
+import threading
+import contextlib
+import contextvars
+import tracemalloc
+
+from . import tableasmd
+
+__all__ = [
+    'tracerun', 'span', 'gettracer', 'Tracer'
+]
+
+
+@contextlib.contextmanager
+def tracerun(output=None):
+    """Records spans of build stages within the context.
+
+    Parameters
+    ----------
+    output : str | Tracer = None
+        Path to a JSON file for Chrome trace events (a),
+        or a tracer to collect the spans.
+
+    Notes
+    -----
+
+    (a) — The file is written on exit from the context.
+          It can be opened in chrome://tracing or Perfetto.
+
+    - If None, the current tracer is kept (or tracing stays off).
+
+    """
+
+    if output is None:
+        yield gettracer()
+        return
+
+    tracer = output if isinstance(output, Tracer) else Tracer()
+    token = TRACER.set(tracer)
+
+    tracer.start()
+
+    try:
+        yield tracer
+    finally:
+        tracer.stop()
+        TRACER.reset(token)
+
+    if not isinstance(output, Tracer):
+        tracer.dumptrace(output)
+
+
+@contextlib.contextmanager
+def span(name, **args):
+    """Records a span of a stage, if tracing is on.
+
+    - Yields the dict of arguments, which can be updated in the span.
+
+    """
+
+    tracer = TRACER.get()
+
+    if tracer is None:
+        yield args
+        return
+
+    tracer.enter()
+    start = time.perf_counter()
+
+    try:
+        yield args
+    finally:
+        end = time.perf_counter()
+        tracer.leave(args)
+        tracer.addspan(name, start, end, args)
+
+
+def gettracer():
+    """Returns the tracer of the current context, if any.
+    """
+    return TRACER.get()
+
+
+class Tracer:
+    """Collects spans as Chrome trace events (complete events).
+
+    Parameters
+    ----------
+    memory : bool = False
+        If True, spans get memory peaks over their start (a).
+
+    Notes
+    -----
+
+    (a) — Peaks are measured by tracemalloc, which slows down runs.
+          Peaks of parallel spans (threads) are mixed.
+
+    """
+
+    def __init__(self, memory=False):
+        self.events = []
+        self.origin = time.perf_counter()
+        self.lock = threading.Lock()
+        self.memory = memory
+        self.started = False
+        self.stacks = {}
+
+    def start(self):
+        """Starts tracemalloc, if memory is tracked and it is off.
+        """
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started = True
+
+    def stop(self):
+        if self.started:
+            tracemalloc.stop()
+            self.started = False
+
+    def enter(self):
+        """Saves the memory state at the start of a span.
+        """
+
+        if not self.is_tracking():
+            return
+
+        current, peak = tracemalloc.get_traced_memory()
+        stack = self.stacks.setdefault(threading.get_ident(), [])
+
+        if stack:
+            stack[-1][1] = max(stack[-1][1], peak)
+
+        tracemalloc.reset_peak()
+        stack.append([current, current])
+
+    def leave(self, args):
+        """Adds the peak of a span over its start to its arguments.
+        """
+
+        if not self.is_tracking():
+            return
+
+        _, peak = tracemalloc.get_traced_memory()
+        stack = self.stacks.get(threading.get_ident())
+
+        if not stack:
+            return
+
+        base, oldpeak = stack.pop()
+        peak = max(peak, oldpeak)
+
+        if stack:
+            stack[-1][1] = max(stack[-1][1], peak)
+
+        args['peak'] = peak - base
+
+    def is_tracking(self) -> bool:
+        return self.memory and tracemalloc.is_tracing()
+
+    def addspan(self, name, start, end, args):
+
+        event = {
+            'name': name,
+            'cat': 'docspyer',
+            'ph': 'X',
+            'ts': self.to_microseconds(start - self.origin),
+            'dur': self.to_microseconds(end - start),
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': args
+        }
+
+        with self.lock:
+            self.events.append(event)
+
+    def to_microseconds(self, seconds) -> float:
+        return round(seconds * 1e6, 3)
+
+    def astrace(self) -> dict:
+        """Returns the spans in Chrome trace format.
+        """
+        return {
+            'traceEvents': list(self.events),
+            'displayTimeUnit': 'ms'
+        }
+
+    def dumptrace(self, filepath):
+        with open(filepath, encoding='utf-8', mode='w') as file:
+            json.dump(self.astrace(), file)
+
+    def summary(self) -> str:
+        """Returns the spans summed up by stages as an MD table.
+        """
+        summarizer = SpansSummarizer()
+        return summarizer.make_table(self.events)
+
+    def slowest(self, name, count=10) -> list[dict]:
+        """Returns the slowest spans of a stage.
+        """
+
+        events = [
+            event for event in self.events if event['name'] == name
+        ]
+
+        events.sort(key=lambda event: event['dur'], reverse=True)
+
+        return events[:count]
+
+
+class SpansSummarizer:
+    """Sums up spans by stages.
+    """
+
+    HEADERS = [
+        'stage', 'count', 'total, ms', 'mean, ms', 'max, ms', 'bytes',
+        'peak, KiB', 'slowest'
+    ]
+
+    def make_table(self, events) -> str:
+
+        stages = {}
+
+        for event in events:
+            stages.setdefault(event['name'], []).append(event)
+
+        rows = [
+            self.make_row(name, spans) for name, spans in stages.items()
+        ]
+
+        rows.sort(key=lambda row: float(row[2]), reverse=True)
+
+        return tableasmd.maketablemd(
+            list(map(list, zip(self.HEADERS, *rows)))
+        )
+
+    def make_row(self, name, spans) -> list[str]:
+
+        total = sum(event['dur'] for event in spans) / 1e3
+        slowest = max(spans, key=lambda event: event['dur'])
+
+        nbytes = sum(
+            event['args'].get('bytes', 0) for event in spans
+        )
+
+        peak = max(
+            event['args'].get('peak', 0) for event in spans
+        )
+
+        return [
+            name,
+            str(len(spans)),
+            f'{total:.2f}',
+            f'{total / len(spans):.2f}',
+            f"{slowest['dur'] / 1e3:.2f}",
+            str(nbytes),
+            f'{peak / 2**10:.1f}',
+            slowest['args'].get('file', '')
+        ]
+
+
+TRACER = contextvars.ContextVar('TRACER', default=None)